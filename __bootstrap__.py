@@ -0,0 +1,108 @@
+import asyncio
+from typing import Optional
+
+from sqlalchemy import select
+
+from src import Role, User
+from src.cache.redis import RedisClient
+from src.core.constants import (
+    SUPERUSER_PASSWORD,
+    SUPERUSER_USERNAME
+)
+from src.core.settings.base import settings
+from src.dependencies.unit_of_work import get_uow
+from src.enums.permission import PermissionEnum
+from src.enums.role import RoleEnum
+from src.services import (
+    PermissionService,
+    RoleService,
+    RolePermissionService,
+    UserService
+)
+from src.utils.security import pwd_guard
+
+
+ROLES: list[dict[str, str]] = [
+    {
+        'name': RoleEnum.ADMIN.value,
+        'description': 'Organization level administrator'
+    },
+    {
+        'name': RoleEnum.OWNER.value,
+        'description': 'Department owner level'
+    },
+    {
+        'name': RoleEnum.CONTRIBUTOR.value,
+        'description': 'Department member level'
+    },
+    {
+        'name': RoleEnum.VIEWER.value,
+        'description': 'Department viewer level'
+    },
+]
+
+PERMISSIONS: list[dict[str, str]] = [
+    {'name': permission.value} for permission in PermissionEnum
+]
+
+ROLE_PERMISSIONS: dict[str, list[str]] = {
+    RoleEnum.ADMIN.value: ['create', 'edit', 'delete', 'read', 'share'],
+    RoleEnum.OWNER.value: ['create', 'edit', 'delete', 'read', 'share'],
+    RoleEnum.CONTRIBUTOR.value: ['create', 'edit', 'read'],
+    RoleEnum.VIEWER.value: ['read'],
+}
+
+
+async def create_superuser(uow) -> Optional[User]:
+    """
+    Creates the superuser bound to the admin role.
+    The password is hashed only if the superuser does not exist.
+    """
+    if await UserService.get_by_filters(uow, username=SUPERUSER_USERNAME):
+        return None
+
+    data: dict = {
+        'email': settings.SMTP_USER,
+        'username': SUPERUSER_USERNAME,
+        'hashed_password': pwd_guard.get_password_hash(SUPERUSER_PASSWORD),
+        'is_active': True,
+        'is_superuser': True,
+        'role_id': (
+            select(Role.id)
+            .where(Role.name == RoleEnum.ADMIN.value)
+            .scalar_subquery()
+        )
+    }
+    users: list[User] = await UserService.create_missing(uow, [data])
+    return users[0] if users else None
+
+
+async def bootstrap(uow) -> Optional[User]:
+    """
+    Seeds roles, permissions, their bindings and the superuser
+    in one transaction. Existing rows are kept as is,
+    so it's safe to run on every deploy.
+    """
+    async with uow:
+        await RoleService.create_missing(uow, ROLES, ('name', ))
+        await PermissionService.create_missing(uow, PERMISSIONS, ('name', ))
+        await RolePermissionService.bind_permissions(uow, ROLE_PERMISSIONS)
+        return await create_superuser(uow)
+
+
+async def main() -> None:
+    uow = next(get_uow())
+    try:
+        user: Optional[User] = await bootstrap(uow)
+    finally:
+        await RedisClient.close()
+
+    if user:
+        print('-'*80)
+        print('Superuser is created with data:')
+        print(user.to_pydantic_schema())
+        print('-'*80)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,42 @@
+"""meeting period index
+
+Revision ID: ee16580929e1
+Revises: 9beb0fcb16c1
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ee16580929e1'
+down_revision: Union[str, None] = '9beb0fcb16c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_meeting_period',
+        'meeting',
+        [sa.text('tstzrange(start_at, end_at)')],
+        unique=False,
+        postgresql_using='gist'
+    )
+    op.create_index(
+        op.f('ix_employee_meeting_employee_id'),
+        'employee_meeting',
+        ['employee_id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix_employee_meeting_employee_id'),
+        table_name='employee_meeting'
+    )
+    op.drop_index('ix_meeting_period', table_name='meeting')
@@ -0,0 +1,44 @@
+"""score summary
+
+Revision ID: 6cd63d50aa15
+Revises: ee16580929e1
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6cd63d50aa15'
+down_revision: Union[str, None] = 'ee16580929e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('score_summary',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('employee_id', sa.Integer(), nullable=False),
+    sa.Column('scores_count', sa.Integer(), nullable=False),
+    sa.Column('in_time_sum', sa.Integer(), nullable=False),
+    sa.Column('integrity_sum', sa.Integer(), nullable=False),
+    sa.Column('quality_sum', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['employee_id'], ['employee.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('employee_id')
+    )
+    op.execute(
+        'INSERT INTO score_summary '
+        '(employee_id, scores_count, in_time_sum, integrity_sum, quality_sum) '
+        'SELECT employee_id, count(*), sum(in_time), sum(integrity), '
+        'sum(quality) FROM score GROUP BY employee_id'
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('score_summary')
@@ -0,0 +1,55 @@
+"""score daily rollup
+
+Revision ID: 3f1c9a7b52d4
+Revises: 6cd63d50aa15
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7b52d4'
+down_revision: Union[str, None] = '6cd63d50aa15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('rollup_checkpoint',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('last_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_table('score_daily',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('employee_id', sa.Integer(), nullable=False),
+    sa.Column('organization_id', sa.Integer(), nullable=False),
+    sa.Column('department_id', sa.Integer(), nullable=True),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('scores_count', sa.Integer(), nullable=False),
+    sa.Column('in_time_sum', sa.Integer(), nullable=False),
+    sa.Column('integrity_sum', sa.Integer(), nullable=False),
+    sa.Column('quality_sum', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['employee_id'], ['employee.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('employee_id', 'day')
+    )
+    op.create_index('ix_score_daily_department_id_day', 'score_daily', ['department_id', 'day'], unique=False)
+    op.create_index('ix_score_daily_organization_id_day', 'score_daily', ['organization_id', 'day'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_score_daily_organization_id_day', table_name='score_daily')
+    op.drop_index('ix_score_daily_department_id_day', table_name='score_daily')
+    op.drop_table('score_daily')
+    op.drop_table('rollup_checkpoint')
@@ -0,0 +1,79 @@
+"""hot path indexes
+
+Revision ID: a84d2e6c0b19
+Revises: 3f1c9a7b52d4
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a84d2e6c0b19'
+down_revision: Union[str, None] = '3f1c9a7b52d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns, partial index predicate)
+INDEXES: tuple[tuple[str, str, list[str], Union[str, None]], ...] = (
+    ('ix_employee_user_id', 'employee', ['user_id'], None),
+    (
+        'ix_employee_organization_id_id',
+        'employee',
+        ['organization_id', 'id'],
+        None
+    ),
+    (
+        'ix_employee_department_id_id',
+        'employee',
+        ['department_id', 'id'],
+        'department_id IS NOT NULL'
+    ),
+    (
+        'ix_department_organization_id_id',
+        'department',
+        ['organization_id', 'id'],
+        None
+    ),
+    ('ix_task_assignee_id', 'task', ['assignee', 'id'], None),
+    ('ix_task_created_by_id', 'task', ['created_by', 'id'], None),
+    ('ix_comment_task_id_id', 'comment', ['task_id', 'id'], None),
+    ('ix_score_employee_id_id', 'score', ['employee_id', 'id'], None),
+    (
+        'ix_employee_meeting_meeting_id',
+        'employee_meeting',
+        ['meeting_id'],
+        None
+    ),
+)
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction,
+    # an interrupted build leaves an invalid index to be dropped by hand
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True
+            )
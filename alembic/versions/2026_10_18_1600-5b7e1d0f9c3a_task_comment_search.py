@@ -0,0 +1,80 @@
+"""task comment search
+
+Revision ID: 5b7e1d0f9c3a
+Revises: a84d2e6c0b19
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e1d0f9c3a'
+down_revision: Union[str, None] = 'a84d2e6c0b19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # btree_gin lets the GIN indexes lead with the organization
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gin')
+    op.add_column('task', sa.Column('organization_id', sa.Integer(), nullable=True))
+    op.add_column('comment', sa.Column('organization_id', sa.Integer(), nullable=True))
+    op.execute(
+        'UPDATE task SET organization_id = employee.organization_id '
+        'FROM employee WHERE employee.id = task.created_by'
+    )
+    op.execute(
+        'UPDATE comment SET organization_id = task.organization_id '
+        'FROM task WHERE task.id = comment.task_id'
+    )
+    op.alter_column('task', 'organization_id', nullable=False)
+    op.alter_column('comment', 'organization_id', nullable=False)
+    op.create_foreign_key(None, 'task', 'organization', ['organization_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key(None, 'comment', 'organization', ['organization_id'], ['id'], ondelete='CASCADE')
+    # stored generated columns rewrite the tables under an exclusive lock
+    op.add_column('task', sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed("setweight(to_tsvector('simple', coalesce(name, '')), 'A') || setweight(to_tsvector('simple', coalesce(description, '')), 'B')", persisted=True), nullable=True))
+    op.add_column('comment', sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed("to_tsvector('simple', content)", persisted=True), nullable=True))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_task_organization_id_search_vector',
+            'task',
+            ['organization_id', 'search_vector'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'ix_comment_organization_id_search_vector',
+            'comment',
+            ['organization_id', 'search_vector'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_comment_organization_id_search_vector',
+            table_name='comment',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+        op.drop_index(
+            'ix_task_organization_id_search_vector',
+            table_name='task',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+    op.drop_column('comment', 'search_vector')
+    op.drop_column('task', 'search_vector')
+    op.drop_column('comment', 'organization_id')
+    op.drop_column('task', 'organization_id')
@@ -1,3 +1,5 @@
 #!/bin/bash
 
+python __bootstrap__.py
+
 gunicorn src.main:app --workers 4 --worker-class uvicorn.workers.UvicornWorker --bind=0.0.0.0:8000
\ No newline at end of file
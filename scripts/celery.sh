@@ -1,7 +1,12 @@
 #!/bin/bash
 
 if [[ "${1}" == "celery" ]]; then
+  export PROMETHEUS_MULTIPROC_DIR=/tmp/celery_metrics
+  rm -rf "${PROMETHEUS_MULTIPROC_DIR}"
+  mkdir -p "${PROMETHEUS_MULTIPROC_DIR}"
   celery --app=src.background.app:celery worker -l INFO
+elif [[ "${1}" == "beat" ]]; then
+  celery --app=src.background.app:celery beat -l INFO
 elif [[ "${1}" == "flower" ]]; then
   celery --app=src.background.app:celery flower
 fi
\ No newline at end of file
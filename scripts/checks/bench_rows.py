@@ -0,0 +1,90 @@
+"""
+Measures the list reads of 10k rows through ORM entities
+with validated schemas against plain rows with constructed schemas.
+
+    python -m scripts.checks.bench_rows
+"""
+import asyncio
+from time import perf_counter
+
+from sqlalchemy import insert
+
+from scripts.checks.common import rolled_back_uow, seed_organization
+from src.models import Comment, Employee, Task
+
+
+ROWS: int = 10000
+RUNS: int = 5
+
+
+async def best_of(call) -> float:
+    """Returns the best run time of the call in milliseconds."""
+    best: float = float('inf')
+    for _ in range(RUNS):
+        start: float = perf_counter()
+        await call()
+        best = min(best, perf_counter() - start)
+
+    return best * 1e3
+
+
+async def main() -> None:
+    async with rolled_back_uow() as uow:
+        session = uow._session
+        seed = await seed_organization(session, ROWS, tasks_per_employee=1)
+        await session.execute(insert(Comment.__table__), [
+            {
+                'created_by': seed.employee_ids[0],
+                'content': f'comment {number}',
+                'task_id': seed.task_ids[0],
+                'organization_id': seed.organization_id
+            }
+            for number in range(ROWS)
+        ])
+        lists: list[tuple] = [
+            (
+                'tasks',
+                uow.task_repository,
+                Task,
+                {'created_by': seed.employee_ids[0]}
+            ),
+            (
+                'comments',
+                uow.comment_repository,
+                Comment,
+                {'task_id': seed.task_ids[0]}
+            ),
+            (
+                'employees',
+                uow.employee_repository,
+                Employee,
+                {'department_id': seed.department_id}
+            ),
+        ]
+        print(f'list of {ROWS} rows to response schemas, best of {RUNS}:')
+        for name, repository, model, filters in lists:
+            async def entities() -> None:
+                objs = await repository.get_all(filters, limit=ROWS)
+                assert len(objs) == ROWS
+                [obj.to_pydantic_schema() for obj in objs]
+                session.expunge_all()
+
+            async def rows() -> None:
+                rows, _ = await repository.get_rows_page(
+                    model.response_columns,
+                    filters,
+                    limit=ROWS
+                )
+                assert len(rows) == ROWS
+                [model.row_to_pydantic_schema(row) for row in rows]
+
+            before: float = await best_of(entities)
+            after: float = await best_of(rows)
+            print(
+                f'  {name:<10} entities {before:7.1f} ms  '
+                f'rows {after:7.1f} ms  x{before / after:.1f}'
+            )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
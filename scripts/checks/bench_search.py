@@ -0,0 +1,134 @@
+"""
+Measures the first page of the task and comment search
+over millions of comments spread across organizations
+for rare, frequent and common terms in both search scopes.
+
+    python -m scripts.checks.bench_search
+"""
+import asyncio
+from time import perf_counter
+
+from sqlalchemy import case, func, insert, select, text, true
+
+from scripts.checks.common import expect, rolled_back_uow, seed_organization
+from src.core.constants import SEARCH_DEFAULT_LIMIT
+from src.models import Comment, Task
+
+
+ORGANIZATIONS: int = 20
+EMPLOYEES: int = 50
+TASKS_PER_EMPLOYEE: int = 20
+COMMENTS_PER_TASK: int = 100
+RARE_NOTES: int = 100000
+RUNS: int = 5
+TARGET_MS: float = 50
+
+QUERIES: tuple[tuple[str, str], ...] = (
+    ('rare', 'note4242'),
+    ('frequent', 'hotfix'),
+    ('common', 'update'),
+    ('common -frequent', 'update -hotfix'),
+)
+
+
+async def best_of(call) -> float:
+    """Returns the best run time of the call in milliseconds."""
+    best: float = float('inf')
+    for _ in range(RUNS):
+        start: float = perf_counter()
+        await call()
+        best = min(best, perf_counter() - start)
+
+    return best * 1e3
+
+
+async def seed_comments(session, seed) -> None:
+    """
+    Inserts the comments of the organization tasks by one statement:
+    every comment has the common term, every fourth the frequent one
+    and a note shared with a few comments of all organizations.
+    """
+    series = (
+        func.generate_series(1, COMMENTS_PER_TASK)
+        .table_valued('number')
+        .render_derived()
+    )
+    number = series.c.number
+    note = (Task.id * COMMENTS_PER_TASK + number) % RARE_NOTES
+    content = func.concat_ws(
+        ' ',
+        'update',
+        case((number % 4 == 0, 'hotfix'), else_='review'),
+        func.concat('note', note)
+    )
+    await session.execute(
+        insert(Comment.__table__).from_select(
+            ['created_by', 'content', 'task_id', 'organization_id'],
+            select(Task.created_by, content, Task.id, Task.organization_id)
+            .join(series, true())
+            .where(Task.organization_id == seed.organization_id)
+        )
+    )
+
+
+async def main() -> None:
+    async with rolled_back_uow() as uow:
+        session = uow._session
+        seeds: list = []
+        for _ in range(ORGANIZATIONS):
+            seed = await seed_organization(
+                session,
+                EMPLOYEES,
+                TASKS_PER_EMPLOYEE
+            )
+            await seed_comments(session, seed)
+            seeds.append(seed)
+
+        # the vacuum moves the GIN pending lists into the indexes,
+        # it can't run in the transaction of the seeded rows
+        for index in (
+            'ix_task_organization_id_search_vector',
+            'ix_comment_organization_id_search_vector'
+        ):
+            await session.execute(
+                select(func.gin_clean_pending_list(index))
+            )
+
+        await session.execute(text('ANALYZE employee, task, comment'))
+        response = await session.execute(select(func.count(Comment.id)))
+        comments: int = response.scalar_one()
+        seed = seeds[0]
+        scopes: tuple[tuple[str, dict], ...] = (
+            ('organization', {'organization_id': seed.organization_id}),
+            (
+                'department',
+                {
+                    'organization_id': seed.organization_id,
+                    'department_id': seed.department_id
+                }
+            ),
+        )
+        print(
+            f'search of {SEARCH_DEFAULT_LIMIT} results over {comments} '
+            f'comments of {ORGANIZATIONS} organizations, best of {RUNS}:'
+        )
+        for scope_name, scope in scopes:
+            for query_name, query in QUERIES:
+                async def search() -> None:
+                    rows, _ = await uow.task_repository.search(
+                        query,
+                        SEARCH_DEFAULT_LIMIT,
+                        **scope
+                    )
+                    expect(rows, f'{query!r} has no results')
+
+                elapsed: float = await best_of(search)
+                mark: str = 'ok' if elapsed <= TARGET_MS else 'SLOW'
+                print(
+                    f'  {scope_name:<12} {query_name:<16} '
+                    f'{elapsed:7.1f} ms  {mark}'
+                )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""
+Measures sending a batch of invitations to the mailpit service
+through the SMTP pool against one connection per message.
+
+    docker compose --profile mail up -d mailpit
+    python -m scripts.checks.bench_smtp
+"""
+import os
+from email.message import EmailMessage
+from statistics import quantiles
+from time import perf_counter
+
+from src.background.mailer import SMTPConnection, SMTPPool
+from src.background.tasks.smtp import get_email_invite_template
+
+
+HOST: str = os.getenv('BENCH_SMTP_HOST', 'mailpit')
+PORT: int = int(os.getenv('BENCH_SMTP_PORT', 1025))
+MESSAGES: int = 1000
+CHUNK_SIZE: int = 200
+
+
+class TimedPool(SMTPPool):
+    """Pool that records the latency of every sent message."""
+
+    latencies: list[float] = []
+
+    @staticmethod
+    def _send(connection: SMTPConnection, message: EmailMessage) -> bool:
+        start: float = perf_counter()
+        try:
+            return SMTPPool._send(connection, message)
+        finally:
+            TimedPool.latencies.append(perf_counter() - start)
+
+
+def messages() -> list[EmailMessage]:
+    return [
+        get_email_invite_template({
+            'organization': {'name': 'bench'},
+            'code': f'code-{number}',
+            'invited_by': {'email': 'bench@example.com'},
+            'invitee': {'email': f'bench-{number}@example.com'}
+        })
+        for number in range(MESSAGES)
+    ]
+
+
+def report(name: str, seconds: float) -> None:
+    latencies: list[float] = TimedPool.latencies
+    p50, p95 = (
+        quantiles(latencies, n=100)[index] * 1e3 for index in (49, 94)
+    )
+    print(
+        f'{name:<22} {len(latencies) / seconds:8.0f} msg/s'
+        f'  p50 {p50:6.2f} ms  p95 {p95:6.2f} ms'
+    )
+
+
+def main() -> None:
+    batch: list[EmailMessage] = messages()
+    pool = TimedPool(HOST, PORT, 'bench', 'bench', False, 2, 30, 30)
+
+    TimedPool.latencies = []
+    start: float = perf_counter()
+    for index in range(0, MESSAGES, CHUNK_SIZE):
+        pool.send_messages(batch[index:index + CHUNK_SIZE])
+    report('pooled chunks', perf_counter() - start)
+
+    TimedPool.latencies = []
+    start = perf_counter()
+    for message in batch:
+        pool.send_messages([message])
+        pool.close()
+    report('connection per message', perf_counter() - start)
+    pool.close()
+
+
+if __name__ == '__main__':
+    main()
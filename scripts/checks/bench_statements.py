@@ -0,0 +1,117 @@
+"""
+Measures the per-call overhead of the repository reads
+built inline on every call against the prebuilt cached statements.
+
+The inline builders repeat the reads of the repository
+before the statements cache was added.
+
+    python -m scripts.checks.bench_statements
+"""
+import asyncio
+from timeit import repeat
+
+from sqlalchemy import select
+
+from scripts.checks.common import rolled_back_uow, seed_organization, timeit
+from src.enums.sql import OrderEnum
+from src.models import Employee
+from src.repositories import statements
+
+
+CALLS: int = 2000
+
+
+def inline_get():
+    return (
+        select(Employee)
+        .execution_options(populate_existing=True)
+        .where(Employee.id == 1)
+    )
+
+
+def inline_get_by_filters():
+    return (
+        select(Employee)
+        .execution_options(populate_existing=True)
+        .filter_by(user_id=1)
+    )
+
+
+def inline_get_all():
+    stmt = (
+        select(Employee)
+        .execution_options(populate_existing=True)
+        .filter_by(department_id=1)
+        .offset(0)
+        .limit(10)
+    )
+    columns = Employee.__table__.columns
+    order_by_field = 'id' if 'id' in columns else None
+    return stmt.order_by(getattr(Employee, order_by_field).asc())
+
+
+def cached_get():
+    return statements.select_by(Employee, ('id', ))
+
+
+def cached_get_by_filters():
+    return statements.select_by(Employee, ('user_id', ))
+
+
+def cached_get_all():
+    return statements.select_page(
+        Employee,
+        ('department_id', ),
+        (),
+        'id',
+        OrderEnum.ASCENDING
+    )
+
+
+def construction(build) -> float:
+    """
+    Returns the per-call microseconds of building the statement
+    and its cache key, the Python side work before the execution
+    finds the compiled form in the engine cache.
+    """
+    def call():
+        build()._generate_cache_key()
+
+    return min(repeat(call, number=CALLS, repeat=5)) / CALLS * 1e6
+
+
+async def main() -> None:
+    print(f'construction and cache key, us per call ({CALLS} calls):')
+    for name in ('get', 'get_by_filters', 'get_all'):
+        before: float = construction(globals()[f'inline_{name}'])
+        after: float = construction(globals()[f'cached_{name}'])
+        print(f'  {name:<15} inline {before:7.1f}  cached {after:7.1f}')
+
+    async with rolled_back_uow() as uow:
+        session = uow._session
+        seed = await seed_organization(session, employees=10)
+        employee_id: int = seed.employee_ids[1]
+        repository = uow.employee_repository
+
+        async def inline() -> None:
+            stmt = (
+                select(Employee)
+                .execution_options(populate_existing=True)
+                .where(Employee.id == employee_id)
+            )
+            response = await session.execute(stmt)
+            response.scalar_one_or_none()
+
+        async def cached() -> None:
+            await repository.get(employee_id)
+
+        await inline()
+        await cached()
+        before: float = await timeit(inline, CALLS)
+        after: float = await timeit(cached, CALLS)
+        print('get by pk with a database round trip, us per call:')
+        print(f'  get             inline {before:7.1f}  cached {after:7.1f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,240 @@
+"""
+Helpers of the database checks.
+
+The checks run against the database of `DATABASE_URL` migrated to head.
+Every check seeds its own rows in a transaction that is rolled back,
+so it can be pointed at a shared development database.
+"""
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import AsyncGenerator, Awaitable, Callable, Generator
+from uuid import uuid4
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.engine import engine
+from src.db.sessions import LocalSession
+from src.enums.role import RoleEnum
+from src.models import (
+    Comment,
+    Department,
+    Employee,
+    Organization,
+    Role,
+    Task,
+    User
+)
+from src.units.unit_of_work import UnitOfWork
+
+
+class CheckFailed(AssertionError):
+    pass
+
+
+def expect(condition: bool, message: str) -> None:
+    """Fails the check with the message if the condition is false."""
+    if not condition:
+        raise CheckFailed(message)
+
+
+@dataclass
+class Seed:
+
+    organization_id: int
+    department_id: int
+    role_ids: dict[str, int]
+    user_ids: list[int] = field(default_factory=list)
+    employee_ids: list[int] = field(default_factory=list)
+    task_ids: list[int] = field(default_factory=list)
+
+
+@asynccontextmanager
+async def rolled_back_uow() -> AsyncGenerator[UnitOfWork, None]:
+    """
+    Yields the unit of work inside an outer transaction
+    that is rolled back on exit, nested services only flush.
+    """
+    uow = UnitOfWork(LocalSession)
+    async with uow:
+        try:
+            yield uow
+        finally:
+            await uow.rollback()
+
+    await engine.dispose()
+
+
+class StatementCounter:
+    """Collects the SQL statements sent to the database."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def _collect(self, conn, cursor, statement, parameters, context, many):
+        self.statements.append(statement)
+
+    @contextmanager
+    def counting(self) -> Generator['StatementCounter', None, None]:
+        self.statements.clear()
+        event.listen(
+            engine.sync_engine,
+            'before_cursor_execute',
+            self._collect
+        )
+        try:
+            yield self
+        finally:
+            event.remove(
+                engine.sync_engine,
+                'before_cursor_execute',
+                self._collect
+            )
+
+
+async def timeit(
+    call: Callable[[], Awaitable],
+    repeat: int
+) -> float:
+    """Returns the best of the mean call time of 3 runs in microseconds."""
+    best: float = float('inf')
+    for _ in range(3):
+        start: float = perf_counter()
+        for _ in range(repeat):
+            await call()
+        best = min(best, (perf_counter() - start) / repeat)
+
+    return best * 1e6
+
+
+async def explain(session: AsyncSession, stmt, params: dict) -> str:
+    """
+    Returns the plan of the statement for the parameters
+    sent as bound values like in the request path.
+    """
+    compiled = stmt.compile(dialect=engine.dialect)
+    values: dict = compiled.construct_params(params)
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    rows = await raw_connection.driver_connection.fetch(
+        f'EXPLAIN (COSTS OFF) {compiled.string}',
+        *(values[name] for name in compiled.positiontup)
+    )
+    return '\n'.join(row[0] for row in rows)
+
+
+async def _insert_ids(session: AsyncSession, model, rows: list[dict]):
+    table = model.__table__
+    response = await session.execute(
+        insert(table).returning(table.c.id),
+        rows
+    )
+    return response.scalars().all()
+
+
+async def seed_organization(
+    session: AsyncSession,
+    employees: int,
+    tasks_per_employee: int = 0,
+    comments_per_task: int = 0,
+    empty_departments: int = 0
+) -> Seed:
+    """
+    Seeds an organization with one department, its employees,
+    tasks assigned to them and comments of the tasks.
+    The first employee is the department owner.
+    """
+    suffix: str = uuid4().hex[:8]
+    await session.execute(
+        pg_insert(Role.__table__)
+        .values([{'name': role.value} for role in RoleEnum])
+        .on_conflict_do_nothing(index_elements=['name'])
+    )
+    response = await session.execute(select(Role.name, Role.id))
+    role_ids: dict[str, int] = dict(response.all())
+
+    user_ids: list[int] = await _insert_ids(session, User, [
+        {
+            'username': f'check-{suffix}-{number}',
+            'email': f'check-{suffix}-{number}@example.com',
+            'hashed_password': '-',
+            'is_active': True,
+            'is_superuser': False,
+            'role_id': role_ids[RoleEnum.CONTRIBUTOR]
+        }
+        for number in range(employees)
+    ])
+    organization_id, = await _insert_ids(session, Organization, [
+        {'name': f'check-{suffix}', 'user_id': user_ids[0]}
+    ])
+    department_id, = await _insert_ids(session, Department, [
+        {
+            'name': f'check-{suffix}',
+            'user_id': user_ids[0],
+            'organization_id': organization_id
+        }
+    ])
+    if empty_departments:
+        await session.execute(insert(Department.__table__), [
+            {
+                'name': f'check-{suffix}-{number}',
+                'user_id': user_ids[0],
+                'organization_id': organization_id
+            }
+            for number in range(empty_departments)
+        ])
+
+    employee_ids: list[int] = await _insert_ids(session, Employee, [
+        {
+            'user_id': user_id,
+            'organization_id': organization_id,
+            'department_id': department_id,
+            'role_id': role_ids[
+                RoleEnum.OWNER if number == 0 else RoleEnum.CONTRIBUTOR
+            ]
+        }
+        for number, user_id in enumerate(user_ids)
+    ])
+    seed = Seed(
+        organization_id,
+        department_id,
+        role_ids,
+        user_ids,
+        employee_ids
+    )
+    if not tasks_per_employee:
+        return seed
+
+    deadline: datetime = datetime.now(timezone.utc) + timedelta(days=7)
+    seed.task_ids = await _insert_ids(session, Task, [
+        {
+            'name': f'task {number} of employee {employee_id}',
+            'description': 'seeded by the database checks',
+            'created_by': employee_ids[0],
+            'assignee': employee_id,
+            'organization_id': organization_id,
+            'status': 1,
+            'deadline': deadline
+        }
+        for employee_id in employee_ids
+        for number in range(tasks_per_employee)
+    ])
+    if comments_per_task:
+        await session.execute(insert(Comment.__table__), [
+            {
+                'created_by': employee_ids[0],
+                'content': f'comment {number}',
+                'task_id': task_id,
+                'organization_id': organization_id
+            }
+            for task_id in seed.task_ids
+            for number in range(comments_per_task)
+        ])
+
+    return seed
@@ -0,0 +1,88 @@
+"""
+Runs the employee import and setting the password
+of an imported user against the database.
+
+    python -m scripts.checks.employee_import
+"""
+import asyncio
+from uuid import uuid4
+
+
+from scripts.checks.common import (
+    CheckFailed,
+    expect,
+    rolled_back_uow,
+    seed_organization
+)
+from src.exceptions.auth import SetPasswordCodeError
+from src.models import Department, User
+from src.services import EmployeeService, UserService
+from src.utils.imports import CSV_MEDIA_TYPE, iter_records
+from src.utils.security import pwd_guard
+
+
+async def main() -> None:
+    async with rolled_back_uow() as uow:
+        session = uow._session
+        seed = await seed_organization(session, employees=1)
+        department: Department = await session.get(
+            Department,
+            seed.department_id
+        )
+        suffix: str = uuid4().hex[:8]
+        upload: bytes = (
+            'email,username,department,role\n'
+            f'a-{suffix}@example.com,"a\n{suffix}",{department.name},\n'
+            f'b-{suffix}@example.com,b-{suffix},,admin\n'
+            f'c-{suffix}@example.com,c-{suffix},unknown,\n'
+            f'a-{suffix}@example.com,d-{suffix},,\n'
+            'not an email,e,,\n'
+        ).encode()
+
+        async def chunks():
+            for index in range(0, len(upload), 16):
+                yield upload[index:index + 16]
+
+        report: dict = await EmployeeService.import_employees(
+            uow,
+            seed.organization_id,
+            iter_records(chunks(), CSV_MEDIA_TYPE)
+        )
+        expect(report['created'] == 2, f'created: {report}')
+        expect(
+            [error['row'] for error in report['errors']] == [3, 4, 5],
+            f'errors: {report["errors"]}'
+        )
+        users: dict[str, dict] = {
+            user['username']: user for user in report['users']
+        }
+        expect(f'a\n{suffix}' in users, 'quoted newline not kept')
+        user: User = await session.get(User, users[f'b-{suffix}']['id'])
+        expect(
+            not pwd_guard.verify_password('Password_1', user.hashed_password),
+            'placeholder hash accepts a password'
+        )
+
+        try:
+            await UserService.set_password_by_code(uow, None, 'Password_1')
+        except SetPasswordCodeError:
+            pass
+        else:
+            raise CheckFailed('unknown code accepted')
+
+        user = await UserService.set_password_by_code(
+            uow,
+            {'user_id': user.id},
+            'Password_1'
+        )
+        await session.refresh(user)
+        expect(
+            pwd_guard.verify_password('Password_1', user.hashed_password),
+            'password not set'
+        )
+
+    print('employee import: ok')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,236 @@
+"""
+Checks that the planner reads the hot request queries
+from the indexes built for them.
+
+The statements are built by the repository statement builders,
+the tables are seeded with enough rows for index scans to pay off
+and analyzed in the same rolled back transaction.
+
+    python -m scripts.checks.index_plans
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert, select, text
+
+from scripts.checks.common import (
+    Seed,
+    explain,
+    expect,
+    rolled_back_uow,
+    seed_organization
+)
+from src.enums.sql import OrderEnum
+from src.models import (
+    Comment,
+    Department,
+    Employee,
+    Employee_Meeting,
+    Meeting,
+    Score,
+    Task
+)
+from src.repositories import statements
+
+
+ORGANIZATIONS: int = 50
+EMPLOYEES: int = 40
+TASKS_PER_EMPLOYEE: int = 5
+COMMENTS_PER_TASK: int = 2
+DEPARTMENTS: int = 20
+
+
+def page(model, keys: tuple, order_by_field: str = 'id'):
+    return statements.select_page(
+        model,
+        keys,
+        (),
+        order_by_field,
+        OrderEnum.ASCENDING,
+        columns=model.response_columns
+        if hasattr(model, 'response_columns') else ()
+    )
+
+
+async def seed(session) -> list[Seed]:
+    seeds: list[Seed] = [
+        await seed_organization(
+            session,
+            EMPLOYEES,
+            TASKS_PER_EMPLOYEE,
+            COMMENTS_PER_TASK,
+            DEPARTMENTS
+        )
+        for _ in range(ORGANIZATIONS)
+    ]
+    response = await session.execute(
+        select(Task.id, Task.assignee).where(
+            Task.id.in_([pk for item in seeds for pk in item.task_ids])
+        )
+    )
+    await session.execute(insert(Score.__table__), [
+        {
+            'task_id': task_id,
+            'employee_id': assignee,
+            'in_time': 1,
+            'integrity': 5,
+            'quality': 5
+        }
+        for task_id, assignee in response.all()
+    ])
+
+    start_at: datetime = datetime.now(timezone.utc)
+    for item in seeds:
+        response = await session.execute(
+            insert(Meeting.__table__).returning(Meeting.__table__.c.id),
+            [
+                {
+                    'created_by': item.employee_ids[0],
+                    'description': 'check',
+                    'start_at': start_at + timedelta(hours=number),
+                    'end_at': start_at + timedelta(hours=number, minutes=30)
+                }
+                for number in range(EMPLOYEES)
+            ]
+        )
+        await session.execute(insert(Employee_Meeting.__table__), [
+            {'meeting_id': meeting_id, 'employee_id': employee_id}
+            for meeting_id, employee_id in zip(
+                response.scalars().all(),
+                item.employee_ids
+            )
+        ])
+
+    await session.execute(text(
+        'ANALYZE employee, department, task, comment, score, employee_meeting'
+    ))
+    return seeds
+
+
+async def main() -> None:
+    async with rolled_back_uow() as uow:
+        session = uow._session
+        seeds: list[Seed] = await seed(session)
+        item: Seed = seeds[ORGANIZATIONS // 2]
+        owner_id: int = item.employee_ids[0]
+        employee_id: int = item.employee_ids[1]
+        response = await session.execute(
+            select(Employee_Meeting.meeting_id)
+            .where(Employee_Meeting.employee_id == employee_id)
+        )
+        meeting_id: int = response.scalar_one()
+        limits: dict = {'offset': 0, 'limit': 10}
+
+        checks: list[tuple[str, str, object, dict]] = [
+            (
+                'permission check by user',
+                'ix_employee_user_id',
+                statements.select_by(Employee, ('user_id', )),
+                {'user_id': item.user_ids[1]}
+            ),
+            (
+                'organization employees page',
+                'ix_employee_organization_id_id',
+                page(Employee, ('organization_id', )),
+                {'organization_id': item.organization_id, **limits}
+            ),
+            (
+                'department employees page',
+                'ix_employee_department_id_id',
+                page(Employee, ('department_id', )),
+                {'department_id': item.department_id, **limits}
+            ),
+            (
+                'organization departments',
+                'ix_department_organization_id_id',
+                statements.select_by(Department, ('organization_id', )),
+                {'organization_id': item.organization_id}
+            ),
+            (
+                '/users/tasks of assignee',
+                'ix_task_assignee_id',
+                page(Task, ('assignee', )),
+                {'assignee': employee_id, **limits}
+            ),
+            (
+                '/users/tasks of assignee by status',
+                'ix_task_assignee_id',
+                page(Task, ('assignee', 'status')),
+                {'assignee': employee_id, 'status': 1, **limits}
+            ),
+            (
+                '/users/tasks of assignee by deadline',
+                'ix_task_assignee_id',
+                page(Task, ('assignee', ), 'deadline'),
+                {'assignee': employee_id, **limits}
+            ),
+            (
+                '/users/tasks of assignee by status and deadline',
+                'ix_task_assignee_id',
+                page(Task, ('assignee', 'status'), 'deadline'),
+                {'assignee': employee_id, 'status': 1, **limits}
+            ),
+            (
+                '/users/tasks of owner',
+                'ix_task_created_by_id',
+                page(Task, ('created_by', )),
+                {'created_by': owner_id, **limits}
+            ),
+            (
+                '/users/tasks of owner by status',
+                'ix_task_created_by_id',
+                page(Task, ('created_by', 'status')),
+                {'created_by': owner_id, 'status': 1, **limits}
+            ),
+            (
+                '/users/tasks of owner by deadline',
+                'ix_task_created_by_id',
+                page(Task, ('created_by', ), 'deadline'),
+                {'created_by': owner_id, **limits}
+            ),
+            (
+                '/users/tasks of owner by status and deadline',
+                'ix_task_created_by_id',
+                page(Task, ('created_by', 'status'), 'deadline'),
+                {'created_by': owner_id, 'status': 1, **limits}
+            ),
+            (
+                '/task/{id}/comments page',
+                'ix_comment_task_id_id',
+                page(Comment, ('task_id', )),
+                {'task_id': item.task_ids[0], **limits}
+            ),
+            (
+                '/users/scores page',
+                'ix_score_employee_id_id',
+                page(Score, ('employee_id', )),
+                {'employee_id': employee_id, **limits}
+            ),
+            (
+                'meetings of employee',
+                'ix_employee_meeting_employee_id',
+                statements.select_by(Employee_Meeting, ('employee_id', )),
+                {'employee_id': employee_id}
+            ),
+            (
+                'attendees of meeting',
+                'ix_employee_meeting_meeting_id',
+                statements.select_by(Employee_Meeting, ('meeting_id', )),
+                {'meeting_id': meeting_id}
+            ),
+        ]
+        failed: list[str] = []
+        for title, index, stmt, params in checks:
+            plan: str = await explain(session, stmt, params)
+            print(f'-- {title}: expects {index}')
+            print(plan, end='\n\n')
+            if index not in plan:
+                failed.append(title)
+
+        expect(not failed, f'indexes are not used by: {failed}')
+
+    print('index plans: ok')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,118 @@
+"""
+Counts the SQL statements of the reads behind the permission checks
+and the detail responses.
+
+The reads pass the loader profile only to repositories that take one,
+so the script can be run on trees before the loader profiles
+to compare the counts.
+
+    python -m scripts.checks.loader_statements
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from inspect import signature
+from typing import Callable, Optional
+
+from sqlalchemy import insert
+
+from scripts.checks.common import (
+    StatementCounter,
+    rolled_back_uow,
+    seed_organization
+)
+from src.models import Employee_Meeting, Meeting
+
+
+EMPLOYEES: int = 20
+TASKS_PER_EMPLOYEE: int = 3
+MEETINGS: int = 10
+
+
+async def read(method: Callable, *args, profile: Optional[str] = None):
+    if profile and 'profile' in signature(method).parameters:
+        return await method(*args, profile=profile)
+
+    return await method(*args)
+
+
+async def main() -> None:
+    counter = StatementCounter()
+    async with rolled_back_uow() as uow:
+        session = uow._session
+        seed = await seed_organization(
+            session,
+            EMPLOYEES,
+            TASKS_PER_EMPLOYEE
+        )
+        start_at: datetime = datetime.now(timezone.utc)
+        table = Meeting.__table__
+        response = await session.execute(
+            insert(table).returning(table.c.id),
+            [
+                {
+                    'created_by': seed.employee_ids[0],
+                    'description': 'check',
+                    'start_at': start_at + timedelta(hours=number),
+                    'end_at': start_at + timedelta(hours=number, minutes=30)
+                }
+                for number in range(MEETINGS)
+            ]
+        )
+        meeting_ids: list[int] = response.scalars().all()
+        await session.execute(insert(Employee_Meeting.__table__), [
+            {'meeting_id': meeting_id, 'employee_id': employee_id}
+            for meeting_id in meeting_ids
+            for employee_id in seed.employee_ids
+        ])
+
+        async def permission_check() -> None:
+            method = uow.employee_repository.get_by_filters
+            if 'profile' in signature(method).parameters:
+                employee = await method(
+                    profile='auth',
+                    user_id=seed.user_ids[1]
+                )
+            else:
+                employee = await method(user_id=seed.user_ids[1])
+            employee.role.name
+
+        async def task_access_check() -> None:
+            task = await read(
+                uow.task_repository.get,
+                seed.task_ids[0],
+                profile='detail'
+            )
+            task.author.department_id
+            task.performer.department_id
+
+        async def meeting_detail() -> None:
+            meeting = await read(
+                uow.meeting_repository.get,
+                meeting_ids[0],
+                profile='detail'
+            )
+            len(meeting.employees)
+
+        async def department_employees_page() -> None:
+            await uow.employee_repository.get_all(
+                {'department_id': seed.department_id}
+            )
+
+        print(
+            f'statements per read ({EMPLOYEES} employees, '
+            f'{MEETINGS} meetings attended by all):'
+        )
+        for scenario in (
+            permission_check,
+            task_access_check,
+            meeting_detail,
+            department_employees_page
+        ):
+            session.expunge_all()
+            with counter.counting():
+                await scenario()
+            print(f'  {scenario.__name__:<28} {len(counter)}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+"""
+Runs the meeting create and attendee replacement statements
+against the database and checks the resulting attendees.
+
+    python -m scripts.checks.meeting_attendees
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from scripts.checks.common import expect, rolled_back_uow, seed_organization
+from src.models import Employee, Employee_Meeting
+from src.services import MeetingService
+
+
+async def main() -> None:
+    async with rolled_back_uow() as uow:
+        seed = await seed_organization(uow._session, employees=4)
+        first, second, third, fourth = [
+            await uow.employee_repository.get(pk)
+            for pk in seed.employee_ids
+        ]
+        start_at: datetime = datetime.now(timezone.utc) + timedelta(days=1)
+        data: dict = {
+            'created_by': first.id,
+            'description': 'check',
+            'start_at': start_at,
+            'end_at': start_at + timedelta(hours=1)
+        }
+        meeting = await MeetingService.create_meeting_with_employees(
+            uow,
+            data,
+            [first, second, third]
+        )
+        meeting = await MeetingService.get(uow, meeting.id, 'detail')
+        created: set[int] = {emp.id for emp in meeting.employees}
+        expect(
+            created == {first.id, second.id, third.id},
+            f'created attendees: {created}'
+        )
+
+        kept_rows = select(Employee_Meeting.id).where(
+            Employee_Meeting.meeting_id == meeting.id,
+            Employee_Meeting.employee_id.in_((first.id, third.id))
+        )
+        response = await uow._session.execute(kept_rows)
+        kept_ids: set[int] = set(response.scalars())
+
+        employees: list[Employee] = [first, third, fourth]
+        meeting = await MeetingService.update_meeting_with_employees(
+            uow,
+            meeting.id,
+            {'description': 'check update'},
+            employees
+        )
+        updated: set[int] = {emp.id for emp in meeting.employees}
+        expect(
+            updated == {first.id, third.id, fourth.id},
+            f'updated attendees: {updated}'
+        )
+        expect(meeting.description == 'check update', 'data not updated')
+        response = await uow._session.execute(kept_rows)
+        expect(
+            set(response.scalars()) == kept_ids,
+            'rows of the kept attendees are rewritten'
+        )
+
+        meeting = await MeetingService.update_meeting_with_employees(
+            uow,
+            meeting.id,
+            {},
+            []
+        )
+        expect(not meeting.employees, 'attendees not cleared')
+
+    print('meeting attendees: ok')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
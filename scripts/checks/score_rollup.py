@@ -0,0 +1,106 @@
+"""
+Runs the daily score rollup against the database and checks
+that reruns and scores committed late with a smaller id
+leave the rollups equal to the aggregated scores.
+
+    python -m scripts.checks.score_rollup
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, insert, select, text
+
+from scripts.checks.common import expect, rolled_back_uow, seed_organization
+from src.core.constants import SCORE_ROLLUP_RESCAN_IDS
+from src.models import Score, ScoreDaily
+
+
+async def main() -> None:
+    async with rolled_back_uow() as uow:
+        session = uow._session
+        repository = uow.score_repository
+        seed = await seed_organization(
+            session,
+            employees=3,
+            tasks_per_employee=4
+        )
+        late_task_id: int = seed.task_ids.pop()
+        response = await session.execute(
+            text("SELECT nextval(pg_get_serial_sequence('score', 'id'))")
+        )
+        late_id: int = response.scalar_one()
+
+        now: datetime = datetime.now(timezone.utc)
+        await session.execute(insert(Score.__table__), [
+            {
+                'task_id': task_id,
+                'employee_id': seed.employee_ids[number % 3],
+                'in_time': 1 + number % 5,
+                'integrity': 2,
+                'quality': 3,
+                'created_at': now - timedelta(days=1 + number % 2)
+            }
+            for number, task_id in enumerate(seed.task_ids)
+        ])
+
+        async def rollup() -> int:
+            return await repository.rollup_daily(
+                timedelta(0),
+                SCORE_ROLLUP_RESCAN_IDS
+            )
+
+        async def compare(message: str) -> None:
+            day = func.date(func.timezone('UTC', Score.created_at))
+            response = await session.execute(
+                select(
+                    Score.employee_id,
+                    day,
+                    func.count(),
+                    func.sum(Score.in_time),
+                    func.sum(Score.integrity),
+                    func.sum(Score.quality)
+                )
+                .where(Score.employee_id.in_(seed.employee_ids))
+                .group_by(Score.employee_id, day)
+            )
+            expected: set[tuple] = set(map(tuple, response.all()))
+            response = await session.execute(
+                select(
+                    ScoreDaily.employee_id,
+                    ScoreDaily.day,
+                    ScoreDaily.scores_count,
+                    ScoreDaily.in_time_sum,
+                    ScoreDaily.integrity_sum,
+                    ScoreDaily.quality_sum
+                )
+                .where(ScoreDaily.employee_id.in_(seed.employee_ids))
+            )
+            actual: set[tuple] = set(map(tuple, response.all()))
+            expect(actual == expected, f'{message}: {actual} != {expected}')
+
+        count: int = await rollup()
+        expect(count >= len(seed.task_ids), f'first run counted {count}')
+        await compare('first run')
+
+        await rollup()
+        await compare('rerun')
+
+        await session.execute(insert(Score.__table__), [
+            {
+                'id': late_id,
+                'task_id': late_task_id,
+                'employee_id': seed.employee_ids[0],
+                'in_time': 5,
+                'integrity': 5,
+                'quality': 5,
+                'created_at': now - timedelta(days=1)
+            }
+        ])
+        await rollup()
+        await compare('late score')
+
+    print('score rollup: ok')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
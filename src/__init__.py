@@ -9,7 +9,10 @@ from src.models import (
     Permission,
     Role,
     RolePermission,
+    RollupCheckpoint,
     Score,
+    ScoreDaily,
+    ScoreSummary,
     Task,
     User
 )
@@ -26,7 +29,10 @@ __all__ = [
     'Permission',
     'Role',
     'RolePermission',
+    'RollupCheckpoint',
     'Score',
+    'ScoreDaily',
+    'ScoreSummary',
     'Task',
     'User',
 ]
@@ -11,6 +11,7 @@ from src.api.v1.dependencies.employee import (
 from src.api.v1.dependencies.meeting import (
     get_meeting_create_data,
     get_meeting_delete_data,
+    get_meeting_slots_data,
     get_meeting_update_data
 )
 from src.api.v1.dependencies.organizations import get_current_organization
@@ -22,6 +23,7 @@ from src.api.v1.dependencies.permissions import (
 from src.api.v1.dependencies.score import get_task_score_create_data
 from src.api.v1.dependencies.task import (
     get_current_task,
+    get_search_scope,
     get_task_create_data,
     get_task_to_update,
     get_task_to_delete
@@ -41,8 +43,10 @@ __all__ = [
     'get_department_manager',
     'get_meeting_create_data',
     'get_meeting_delete_data',
+    'get_meeting_slots_data',
     'get_meeting_update_data',
     'get_organization_employee',
+    'get_search_scope',
     'get_task_create_data',
     'get_task_score_create_data',
     'get_task_to_update',
@@ -1,8 +1,8 @@
 from typing import Optional
 
+from src.cache.principal import Principal, principal_cache
 from src.exceptions.auth import AuthorizationError
 from src.exceptions.db import ObjectNotFound
-from src.models.user import User
 from src.services import (
     UserService,
     jwt_service
@@ -13,15 +13,23 @@ from src.units.unit_of_work import UnitOfWork
 async def get_current_user(
     uow: UnitOfWork,
     token: str
-) -> User:
-    """Get current user by valid token."""
+) -> Principal:
+    """
+    Get current user by valid token.
+    The principal is read from the worker cache
+    and loaded from the database only on a miss.
+    """
     data: dict = await jwt_service.read(token)
-    user_id: str = data.get('sub')
-    user: Optional[User] = await UserService.get(uow, int(user_id))
-    if not user:
-        raise ObjectNotFound()
+    user_id: int = int(data.get('sub'))
+    principal: Optional[Principal] = principal_cache.get(user_id)
+    if not principal:
+        principal = await UserService.get_principal(uow, user_id)
+        if not principal:
+            raise ObjectNotFound()
 
-    if not user.is_active:
+        principal_cache.set(principal)
+
+    if not principal.is_active:
         raise AuthorizationError()
 
-    return user
+    return principal
@@ -14,7 +14,7 @@ async def get_comment_create_data(
 ) -> dict:
     """Returns data for creating a comment."""
     author: Employee = await get_department_contributor(uow, token)
-    task: Task = await TaskService.get(uow, task_id)
+    task: Task = await TaskService.get(uow, task_id, 'detail')
     if (
         author.department_id != task.author.department_id
         and author.department_id != task.performer.department_id
@@ -31,6 +31,7 @@ async def get_comment_create_data(
     comment_data: dict = comment_schema.model_dump()
     comment_data.update(
         created_by=author.id,
-        task_id=task.id
+        task_id=task.id,
+        organization_id=task.organization_id
     )
     return comment_data
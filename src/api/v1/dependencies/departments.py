@@ -1,9 +1,10 @@
 from src.api.v1.dependencies.organizations import get_current_organization
 from src.api.v1.dependencies.permissions import get_department_contributor
+from src.cache.principal import Principal
 from src.enums.role import RoleEnum
 from src.exceptions.bases import PermissionDenied
 from src.exceptions.db import ObjectNotFound
-from src.models import Department, Employee, Organization, User
+from src.models import Department, Employee, Organization
 from src.services import DepartmentService
 from src.units.unit_of_work import UnitOfWork
 
@@ -12,7 +13,7 @@ async def get_department_for_admin(
     org_id: int,
     dept_id: int,
     uow: UnitOfWork,
-    user: User
+    user: Principal
 ) -> Department:
     """
     Returns an department db object
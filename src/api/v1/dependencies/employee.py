@@ -1,6 +1,7 @@
 from src.api.v1.dependencies.departments import get_department_for_admin
 from src.api.v1.dependencies.organizations import get_current_organization
 from src.api.v1.schemas.request.employee import EmployeeSchema
+from src.cache.principal import Principal
 from src.exceptions.auth import PermissionDenied
 from src.exceptions.db import ObjectNotFound
 from src.models import Department, Employee, Organization, User
@@ -11,7 +12,7 @@ from src.units.unit_of_work import UnitOfWork
 async def get_organization_employee(
     org_id: int,
     uow: UnitOfWork,
-    user: User,
+    user: Principal,
     employee_schema: EmployeeSchema
 ) -> Employee:
     """
@@ -53,7 +54,7 @@ async def get_department_employee(
     org_id: int,
     dept_id: int,
     uow: UnitOfWork,
-    user: User,
+    user: Principal,
     employee_schema: EmployeeSchema
 ) -> Employee:
     """
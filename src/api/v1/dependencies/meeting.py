@@ -1,9 +1,11 @@
-from datetime import datetime
+from datetime import timedelta
+from typing import Optional
 
 from src.api.v1.dependencies.permissions import get_department_manager
 from src.api.v1.schemas.request.meeting import (
     MeetingCreateSchema,
     MeetingDeleteSchema,
+    MeetingSlotsSchema,
     MeetingUpdateSchema
 )
 from src.enums.role import RoleEnum
@@ -61,7 +63,12 @@ async def get_meeting_update_data(
 
     _verify_booking_creator(manager, meeting)
 
-    data: dict = await _filter_create_update_data(uow, manager, data)
+    data: dict = await _filter_create_update_data(
+        uow,
+        manager,
+        data,
+        meeting_id
+    )
     data.update(meeting=meeting)
 
     return data
@@ -92,29 +99,71 @@ async def get_meeting_delete_data(
     return {'meeting': meeting}
 
 
+async def get_meeting_slots_data(
+    org_id: int,
+    dept_id: int,
+    uow: UnitOfWork,
+    token: str,
+    slots_schema: MeetingSlotsSchema
+) -> dict:
+    """
+    Recieve data to search free meeting slots.
+    Only the organization employees available to the manager
+    are taken into account.
+    """
+    manager: Employee = await get_department_manager(uow, token)
+    _verify_attach_to_org_and_dept(manager, org_id, dept_id)
+
+    data: dict = slots_schema.model_dump()
+    employees: list[Employee] = await EmployeeService.get_by_field_contains(
+        uow,
+        'id',
+        data.pop('employee_ids'),
+        'auth'
+    )
+    employees = [emp for emp in employees if emp.organization_id == org_id]
+    data.update(
+        employee_ids=[emp.id for emp in _filter_scheduled(manager, employees)],
+        duration=timedelta(minutes=data.pop('duration_minutes'))
+    )
+    return data
+
+
 async def _filter_create_update_data(
     uow: UnitOfWork,
     manager: Employee,
-    data: dict
+    data: dict,
+    meeting_id: Optional[int] = None
 ) -> dict:
-    """Filter data to create or update meeting object."""
+    """
+    Filter data to create or update meeting object.
+    The occupied employees are found in one query,
+    the updated meeting itself is ignored.
+    The employees are read with their roles: the manager may be
+    among them and the re-read replaces his loaded state.
+    """
     employee_ids: list[int] = data.pop('employee_ids')
     employees: list[Employee] = await EmployeeService.get_by_field_contains(
         uow,
         'id',
-        employee_ids
+        employee_ids,
+        'auth'
     )
-    occupied_employees: list[Employee] = []
-    _filter_out(
-        manager,
-        employees,
-        occupied_employees,
+    occupied_ids: set[int] = await MeetingService.get_occupied_employee_ids(
+        uow,
+        [emp.id for emp in _filter_scheduled(manager, employees)],
         data.get('start_at'),
-        data.get('end_at')
+        data.get('end_at'),
+        meeting_id
     )
-    unoccupied_employees: list[Employee] = [
-        emp for emp in employees if emp not in occupied_employees
-    ]
+    occupied_employees: list[Employee] = []
+    unoccupied_employees: list[Employee] = []
+    for employee in employees:
+        if employee.id in occupied_ids:
+            occupied_employees.append(employee)
+        else:
+            unoccupied_employees.append(employee)
+
     data.update(
         created_by=manager.id,
         unoccupied_employees=unoccupied_employees,
@@ -123,33 +172,21 @@ async def _filter_create_update_data(
     return data
 
 
-def _filter_out(
+def _filter_scheduled(
     manager: Employee,
-    employees: list[Employee],
-    occupied: list[Employee],
-    start_at: datetime,
-    end_at: datetime
-) -> None:
+    employees: list[Employee]
+) -> list[Employee]:
     """
-    Collects a list of occupied employees
-    and filters them out from the bulk.
-    ---
-    It's making in place.
+    Returns the employees whose meetings are checked for the manager.
+    The department manager checks only his department employees.
     """
-    for employee in employees:
-        if (
-            manager.role.name != RoleEnum.ADMIN
-            and manager.department_id != employee.department_id
-        ):
-            continue
-
-        for meeting in employee.meetings:
-            if (
-                meeting.start_at < start_at < meeting.end_at
-                or meeting.start_at < end_at < meeting.end_at
-            ):
-                occupied.append(employee)
-                break
+    if manager.role.name == RoleEnum.ADMIN:
+        return employees
+
+    return [
+        emp for emp in employees
+        if emp.department_id == manager.department_id
+    ]
 
 
 def _verify_attach_to_org_and_dept(
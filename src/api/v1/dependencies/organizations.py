@@ -1,6 +1,7 @@
+from src.cache.principal import Principal
 from src.exceptions.bases import PermissionDenied
 from src.exceptions.db import ObjectNotFound
-from src.models import Organization, User
+from src.models import Organization
 from src.services import OrganizationService
 from src.units.unit_of_work import UnitOfWork
 
@@ -8,7 +9,7 @@ from src.units.unit_of_work import UnitOfWork
 async def get_current_organization(
     org_id: int,
     uow: UnitOfWork,
-    current_user: User
+    current_user: Principal
 ) -> Organization:
     """Returns an organization database object."""
     organization: Organization = await OrganizationService.get(uow, org_id)
@@ -1,24 +1,25 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import Depends
 
 from src.api.v1.dependencies.auth import get_current_user
+from src.cache.permissions import permission_registry
+from src.cache.principal import Principal
 from src.enums.permission import (
-    CONTRIBUTOR_PERMISSIONS,
-    MANAGER_PERMISSIONS,
-    PermissionEnum
+    CONTRIBUTOR_PERMISSIONS_MASK,
+    MANAGER_PERMISSIONS_MASK
 )
 from src.enums.role import RoleEnum
 from src.exceptions.bases import PermissionDenied
 from src.exceptions.db import ObjectNotFound
-from src.models import Employee, User
-from src.services import EmployeeService
+from src.models import Employee
+from src.services import EmployeeService, RolePermissionService
 from src.units.unit_of_work import UnitOfWork
 
 
 async def get_current_superuser(
-    user: Annotated[User, Depends(get_current_user)]
-) -> User:
+    user: Annotated[Principal, Depends(get_current_user)]
+) -> Principal:
     """Gets user with superuser permission."""
     if not user.is_superuser:
         raise PermissionDenied()
@@ -26,10 +27,10 @@ async def get_current_superuser(
     return user
 
 
-async def get_current_admin(uow: UnitOfWork, token: str) -> User:
+async def get_current_admin(uow: UnitOfWork, token: str) -> Principal:
     """Gets user with admin role."""
-    user: User = await get_current_user(uow, token)
-    if user.role.name != RoleEnum.ADMIN:
+    user: Principal = await get_current_user(uow, token)
+    if user.role_name != RoleEnum.ADMIN:
         raise PermissionDenied()
 
     return user
@@ -43,8 +44,12 @@ async def get_department_manager(uow: UnitOfWork, token: str) -> Employee:
         - delete;
         - read.
     """
-    user: User = await get_current_user(uow, token)
-    return await _get_employee_with_permissions(uow, user, MANAGER_PERMISSIONS)
+    user: Principal = await get_current_user(uow, token)
+    return await _get_employee_with_permissions(
+        uow,
+        user,
+        MANAGER_PERMISSIONS_MASK
+    )
 
 
 async def get_department_contributor(uow: UnitOfWork, token: str) -> Employee:
@@ -54,21 +59,22 @@ async def get_department_contributor(uow: UnitOfWork, token: str) -> Employee:
         - edit;
         - read.
     """
-    user: User = await get_current_user(uow, token)
+    user: Principal = await get_current_user(uow, token)
     return await _get_employee_with_permissions(
         uow,
         user,
-        CONTRIBUTOR_PERMISSIONS
+        CONTRIBUTOR_PERMISSIONS_MASK
     )
 
 
 async def _get_employee_with_permissions(
     uow: UnitOfWork,
-    user: User,
-    necessary_permissions: tuple[PermissionEnum]
+    user: Principal,
+    necessary_permissions: int
 ) -> Employee:
     employee: Employee = await EmployeeService.get_by_filters(
         uow,
+        profile='auth',
         user_id=user.id
     )
 
@@ -79,11 +85,26 @@ async def _get_employee_with_permissions(
         }
         raise ObjectNotFound(extra_msg=error_info)
 
-    available_permissions: set = set(
-        perm.name for perm in employee.role.permissions
+    available_permissions: int = await _get_role_permissions(
+        uow,
+        employee.role_id
     )
-    for permission in necessary_permissions:
-        if permission not in available_permissions:
-            raise PermissionDenied()
+    if available_permissions & necessary_permissions != necessary_permissions:
+        raise PermissionDenied()
 
     return employee
+
+
+async def _get_role_permissions(uow: UnitOfWork, role_id: int) -> int:
+    """
+    Returns the role permissions bitmask.
+    The registry is recompiled if it's stale or doesn't know the role.
+    """
+    mask: Optional[int] = permission_registry.get(role_id)
+    if mask is None:
+        permission_registry.compile(
+            await RolePermissionService.get_bindings(uow)
+        )
+        mask = permission_registry.get(role_id) or 0
+
+    return mask
@@ -23,7 +23,11 @@ async def get_task_create_data(
 ) -> dict:
     """Returns data for creating a task."""
     author: Employee = await get_department_manager(uow, token)
-    assignee: Employee = await EmployeeService.get(uow, task_schema.assignee)
+    assignee: Employee = await EmployeeService.get(
+        uow,
+        task_schema.assignee,
+        'auth'
+    )
     if not assignee:
         raise ObjectNotFound()
 
@@ -47,6 +51,7 @@ async def get_task_create_data(
     task_data: dict = task_schema.model_dump()
     task_data.update(
         created_by=author.id,
+        organization_id=author.organization_id,
         status=StatusEnum.NEW
     )
     return task_data
@@ -134,7 +139,7 @@ async def get_current_task(
 ) -> Task:
     """Returns Task from the current department."""
     contributor: Employee = await get_department_contributor(uow, token)
-    task: Task = await TaskService.get(uow, task_id)
+    task: Task = await TaskService.get(uow, task_id, 'detail')
     if not task:
         raise ObjectNotFound()
 
@@ -149,3 +154,26 @@ async def get_current_task(
         raise PermissionDenied(extra_msg=error_info)
 
     return task
+
+
+async def get_search_scope(uow: UnitOfWork, token: str) -> dict:
+    """
+    Returns the search scope of the current contributor:
+    the whole organization for the admin, otherwise the department
+    of the organization.
+    """
+    contributor: Employee = await get_department_contributor(uow, token)
+    if contributor.role.name == RoleEnum.ADMIN:
+        return {'organization_id': contributor.organization_id}
+
+    if contributor.department_id is None:
+        error_info: dict = {
+            'reason': 'Permission denied',
+            'description': 'The employee doesn\'t belong to any department'
+        }
+        raise PermissionDenied(extra_msg=error_info)
+
+    return {
+        'organization_id': contributor.organization_id,
+        'department_id': contributor.department_id
+    }
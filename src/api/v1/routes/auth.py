@@ -3,10 +3,14 @@ from typing import Optional
 from fastapi import APIRouter, status
 
 from src.api.v1.schemas.request.auth import AuthUser
-from src.api.v1.schemas.request.user import UserCreateSchema
+from src.api.v1.schemas.request.user import (
+    SetPasswordSchema,
+    UserCreateSchema
+)
 from src.api.v1.schemas.response.user import UserResponseSchema
 from src.cache.redis import RedisClient
-from src.dependencies import UOWDep
+from src.core.constants import SET_PASSWORD_KEY_PREFIX
+from src.dependencies import UOWDep, UnitOfWorkRoute
 from src.models import User
 from src.services import (
     UserService,
@@ -15,7 +19,11 @@ from src.services import (
 from src.services.utils import user_signup_preparation
 
 
-router = APIRouter(prefix='/auth', tags=['Auth'])
+router = APIRouter(
+    prefix='/auth',
+    tags=['Auth'],
+    route_class=UnitOfWorkRoute
+)
 
 
 @router.post('/signin')
@@ -68,3 +76,28 @@ async def registering_user(
     )
     await RedisClient.remove(code)
     return created_user.to_pydantic_schema()
+
+
+@router.post('/set-password', response_model=UserResponseSchema)
+async def set_password(
+    password_schema: SetPasswordSchema,
+    uow: UOWDep,
+    code: str
+):
+    """
+    Sets the password of the imported user by the one-time code
+    sent to his email.
+
+    Requireds:
+        - query parameter: code -- set password token;
+        - new password.
+    """
+    key: str = f'{SET_PASSWORD_KEY_PREFIX}{code}'
+    details: dict = await RedisClient.get_cache(key)
+    user: User = await UserService.set_password_by_code(
+        uow,
+        details,
+        password_schema.password
+    )
+    await RedisClient.remove(key)
+    return user.to_pydantic_schema()
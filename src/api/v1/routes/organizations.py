@@ -1,4 +1,4 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, Response, status
 
 from src.api.v1.dependencies import (
     get_current_admin,
@@ -6,6 +6,7 @@ from src.api.v1.dependencies import (
     get_department_for_employee,
     get_meeting_create_data,
     get_meeting_delete_data,
+    get_meeting_slots_data,
     get_meeting_update_data,
     get_current_organization,
     get_department_employee,
@@ -22,12 +23,31 @@ from src.api.v1.schemas.response import (
     department as dept_res_schema,
     employee as emp_res_schema,
     meeting as meet_res_schema,
-    organization as org_res_schema
+    organization as org_res_schema,
+    score as score_res_schema
 )
-from src.background.app import send_email_org_invite
+from src.background.app import (
+    send_email_org_invite,
+    send_email_org_invites,
+    send_email_set_passwords
+)
+from src.cache.principal import Principal
 from src.cache.redis import RedisClient
-from src.core.constants import INVITE_EXPIRE_SECONDS
-from src.dependencies import TokenDeps, UOWDep, QueryParamDeps
+from src.core.constants import (
+    EMPLOYEE_IMPORT_EMAIL_CHUNK_SIZE,
+    INVITE_BATCH_CHUNK_SIZE,
+    INVITE_EXPIRE_SECONDS,
+    SET_PASSWORD_EXPIRE_SECONDS,
+    SET_PASSWORD_KEY_PREFIX
+)
+from src.core.responses import negotiate_response
+from src.dependencies import (
+    LeaderboardParamDeps,
+    TokenDeps,
+    UOWDep,
+    QueryParamDeps,
+    UnitOfWorkRoute
+)
 from src.enums.role import RoleEnum
 from src.exceptions.db import ObjectNotFound
 from src.models import (
@@ -35,8 +55,7 @@ from src.models import (
     Employee,
     Meeting,
     Organization,
-    Role,
-    User
+    Role
 )
 from src.services import (
     DepartmentService,
@@ -44,14 +63,24 @@ from src.services import (
     MeetingService,
     OrganizationService,
     RoleService,
+    ScoreService,
     UserService
 )
 
-from src.services.utils import recieve_selection_data
+from src.services.utils import (
+    get_invitation_details,
+    recieve_selection_data
+)
+from src.utils.imports import iter_records
+from src.utils.pagination import set_next_cursor
 from src.utils.security import generate_url_token
 
 
-router = APIRouter(prefix='/org', tags=['Organization'])
+router = APIRouter(
+    prefix='/org',
+    tags=['Organization'],
+    route_class=UnitOfWorkRoute
+)
 
 
 @router.get(
@@ -61,7 +90,8 @@ router = APIRouter(prefix='/org', tags=['Organization'])
 async def get_all_organizations(
     uow: UOWDep,
     token: TokenDeps,
-    query_params: QueryParamDeps
+    query_params: QueryParamDeps,
+    request: Request
 ):
     """
     Returns a list of all organizations.
@@ -74,21 +104,25 @@ async def get_all_organizations(
         - `offset`: number of skip;
         - `limit`: limit the number of results;
         - `sort_by`: sort by field name;
-        - `sort`: ascending or descending.
+        - `sort`: ascending or descending;
+        - `cursor`: cursor of the next page from `X-Next-Cursor` header.
     """
-    current_admin: User = await get_current_admin(uow, token)
+    current_admin: Principal = await get_current_admin(uow, token)
     data: dict = recieve_selection_data(
         'user_id',
         current_admin.id,
         query_params
     )
-    organizations: list[Organization] = (
-        await OrganizationService.get_all(uow, data)
+    organizations, next_cursor = (
+        await OrganizationService.get_page(uow, data, 'detail')
     )
-    return [
+    content: list = [
         organization.to_pydantic_schema()
         for organization in organizations
     ]
+    response: Response = negotiate_response(request, content)
+    set_next_cursor(response, next_cursor)
+    return response
 
 
 @router.post(
@@ -100,6 +134,7 @@ async def create_organization(
     org_schema: org_schema.OrganizationCreateSchema,
     uow: UOWDep,
     token: TokenDeps,
+    request: Request
 ):
     """
     Сreation of an organization.
@@ -109,7 +144,7 @@ async def create_organization(
         - authenticated by token;
         - permission to create organization.
     """
-    current_admin: User = await get_current_admin(uow, token)
+    current_admin: Principal = await get_current_admin(uow, token)
     organization_data: dict = org_schema.model_dump()
     organization_data['user_id'] = current_admin.id
     organization: Organization = (
@@ -119,7 +154,11 @@ async def create_organization(
             organization_data
         )
     )
-    return organization.to_pydantic_schema()
+    return negotiate_response(
+        request,
+        organization.to_pydantic_schema(),
+        status.HTTP_201_CREATED
+    )
 
 
 @router.post('/{org_id}/invite')
@@ -138,12 +177,74 @@ async def create_user_invite(
         - authenticated by token;
         - permission to invite user in current organization.
     """
-    current_admin: User = await get_current_admin(uow, token)
+    current_admin: Principal = await get_current_admin(uow, token)
     organization: Organization = (
         await get_current_organization(org_id, uow, current_admin)
     )
     key: str = generate_url_token()
-    invation_details: dict = {
+    invation_details: dict = get_invitation_details(
+        current_admin,
+        organization,
+        invite_schema.email
+    )
+    await RedisClient.set_cache(key, invation_details, INVITE_EXPIRE_SECONDS)
+    invation_details['code'] = key
+    send_email_org_invite.delay(invation_details)
+    invation_details.pop('code')
+    invation_details['status'] = 'Pending'
+    return invation_details
+
+
+@router.post('/{org_id}/invite/batch')
+async def create_user_invites(
+    org_id: int,
+    uow: UOWDep,
+    token: TokenDeps,
+    invite_schema: invite_schema.InvitionBatchCreateSchema
+):
+    """
+    Invite users in organization by ID.
+    All invite codes are stored by one Redis round trip
+    and the emails are sent by a few chunked background tasks.
+
+    Requireds:
+        - organization ID;
+        - invitees emails;
+        - authenticated by token;
+        - permission to invite user in current organization.
+    """
+    current_admin: Principal = await get_current_admin(uow, token)
+    organization: Organization = (
+        await get_current_organization(org_id, uow, current_admin)
+    )
+    invites: dict[str, dict] = {}
+    statuses: list[dict] = []
+    for email in invite_schema.emails:
+        if email.lower() in invites:
+            statuses.append({'email': email, 'status': 'Duplicate'})
+            continue
+
+        invites[email.lower()] = get_invitation_details(
+            current_admin,
+            organization,
+            email
+        )
+        statuses.append({'email': email, 'status': 'Pending'})
+
+    codes: dict[str, dict] = {
+        generate_url_token(): details for details in invites.values()
+    }
+    await RedisClient.set_many(codes, INVITE_EXPIRE_SECONDS)
+
+    messages: list[dict] = [
+        {**details, 'code': code} for code, details in codes.items()
+    ]
+    for index in range(0, len(messages), INVITE_BATCH_CHUNK_SIZE):
+        send_email_org_invites.delay(
+            messages[index:index + INVITE_BATCH_CHUNK_SIZE]
+        )
+
+    return {
         'invited_by': {
             'id': current_admin.id,
             'email': current_admin.email,
@@ -152,16 +253,8 @@ async def create_user_invite(
             'id': organization.id,
             'name': organization.name,
         },
-        'invitee': {
-            'email': invite_schema.email,
-        }
+        'invitees': statuses
     }
-    await RedisClient.set_cache(key, invation_details, INVITE_EXPIRE_SECONDS)
-    invation_details['code'] = key
-    send_email_org_invite.delay(invation_details)
-    invation_details.pop('code')
-    invation_details['status'] = 'Pending'
-    return invation_details
 
 
 @router.patch(
@@ -172,7 +265,8 @@ async def update_organization(
     org_id: int,
     uow: UOWDep,
     token: TokenDeps,
-    org_schema: org_schema.OrganizationCreateSchema
+    org_schema: org_schema.OrganizationCreateSchema,
+    request: Request
 ):
     """
     Update organization by ID.
@@ -183,7 +277,7 @@ async def update_organization(
         - authenticated by token;
         - permission to update organization.
     """
-    current_admin: User = await get_current_admin(uow, token)
+    current_admin: Principal = await get_current_admin(uow, token)
     organization: Organization = (
         await get_current_organization(org_id, uow, current_admin)
     )
@@ -195,9 +289,10 @@ async def update_organization(
     )
     organization: Organization = await OrganizationService.get(
         uow,
-        organization.id
+        organization.id,
+        'detail'
     )
-    return organization.to_pydantic_schema()
+    return negotiate_response(request, organization.to_pydantic_schema())
 
 
 @router.delete(
@@ -217,7 +312,7 @@ async def delete_organization(
         - authenticated by token;
         - permission to delete organization.
     """
-    current_admin: User = await get_current_admin(uow, token)
+    current_admin: Principal = await get_current_admin(uow, token)
     organization: Organization = (
         await get_current_organization(org_id, uow, current_admin)
     )
@@ -239,7 +334,8 @@ async def get_all_employees_in_organization(
     org_id: int,
     uow: UOWDep,
     token: TokenDeps,
-    query_params: QueryParamDeps
+    query_params: QueryParamDeps,
+    request: Request
 ):
     """
     Returns list of employees of the organization.
@@ -253,9 +349,10 @@ async def get_all_employees_in_organization(
         - `offset`: number of skip;
         - `limit`: limit the number of results;
         - `sort_by`: sort by field name;
-        - `sort`: ascending or descending.
+        - `sort`: ascending or descending;
+        - `cursor`: cursor of the next page from `X-Next-Cursor` header.
     """
-    current_admin: User = await get_current_admin(uow, token)
+    current_admin: Principal = await get_current_admin(uow, token)
     organization: Organization = (
         await get_current_organization(org_id, uow, current_admin)
     )
@@ -264,12 +361,83 @@ async def get_all_employees_in_organization(
         organization.id,
         query_params
     )
-    employees: list[Employee] = await EmployeeService.get_all(uow, data)
+    rows, next_cursor = await EmployeeService.get_rows_page(
+        uow,
+        Employee.response_columns,
+        data
+    )
+    content: list = [Employee.row_to_pydantic_schema(row) for row in rows]
+    response: Response = negotiate_response(request, content)
+    set_next_cursor(response, next_cursor)
+    return response
 
-    return [
-        employee.to_pydantic_schema()
-        for employee in employees
-    ]
+
+@router.post(
+    '/{org_id}/employees/import',
+    response_model=emp_res_schema.EmployeeImportReportSchema
+)
+async def import_employees_to_organization(
+    org_id: int,
+    uow: UOWDep,
+    token: TokenDeps,
+    request: Request
+):
+    """
+    Bulk import of users as employees of the organization.
+    The body is a streamed `text/csv` upload with a header row
+    or `application/x-ndjson` with one object per line.
+    Each row has `email`, `username`
+    and optional `department` name and `role` name.
+    The created users get one-time links to set their passwords
+    by email in chunked background tasks.
+    Returns the number of created employees and errors of skipped rows.
+
+    Requireds:
+        - organization ID;
+        - authenticated by token;
+        - permission to invite user in current organization.
+    """
+    current_admin: Principal = await get_current_admin(uow, token)
+    organization: Organization = (
+        await get_current_organization(org_id, uow, current_admin)
+    )
+    records = iter_records(
+        request.stream(),
+        request.headers.get('content-type', '')
+    )
+    report: dict = await EmployeeService.import_employees(
+        uow,
+        organization.id,
+        records
+    )
+    users: list[dict] = report.pop('users')
+
+    async def send_set_password_links() -> None:
+        codes: dict[str, dict] = {
+            generate_url_token(): user for user in users
+        }
+        await RedisClient.set_many(
+            {
+                f'{SET_PASSWORD_KEY_PREFIX}{code}': {'user_id': user['id']}
+                for code, user in codes.items()
+            },
+            SET_PASSWORD_EXPIRE_SECONDS
+        )
+        messages: list[dict] = [
+            {
+                'code': code,
+                'email': user['email'],
+                'username': user['username'],
+                'organization': {'name': organization.name}
+            }
+            for code, user in codes.items()
+        ]
+        chunk_size: int = EMPLOYEE_IMPORT_EMAIL_CHUNK_SIZE
+        for index in range(0, len(messages), chunk_size):
+            send_email_set_passwords.delay(messages[index:index + chunk_size])
+
+    await uow.after_commit(send_set_password_links)
+    return report
 
 
 @router.post(
@@ -294,7 +462,7 @@ async def remove_employee_from_organization(
         - authenticated by token;
         - permission to remove employee from organization.
     """
-    current_admin: User = await get_current_admin(uow, token)
+    current_admin: Principal = await get_current_admin(uow, token)
     employee: Employee = await get_organization_employee(
         org_id,
         uow,
@@ -316,7 +484,8 @@ async def get_all_departments_in_organization(
     org_id: int,
     uow: UOWDep,
     token: TokenDeps,
-    query_params: QueryParamDeps
+    query_params: QueryParamDeps,
+    request: Request
 ):
     """
     Returns all departments of the current organization.
@@ -330,9 +499,10 @@ async def get_all_departments_in_organization(
         - `offset`: number of skip;
         - `limit`: limit the number of results;
         - `sort_by`: sort by field name;
-        - `sort`: ascending or descending.
+        - `sort`: ascending or descending;
+        - `cursor`: cursor of the next page from `X-Next-Cursor` header.
     """
-    current_admin: User = await get_current_admin(uow, token)
+    current_admin: Principal = await get_current_admin(uow, token)
     organization: Organization = (
         await get_current_organization(org_id, uow, current_admin)
     )
@@ -341,11 +511,16 @@ async def get_all_departments_in_organization(
         organization.id,
         query_params
     )
-    departments: list[Department] = await DepartmentService.get_all(uow, data)
-    return [
+    departments, next_cursor = (
+        await DepartmentService.get_page(uow, data, 'detail')
+    )
+    content: list = [
         department.to_pydantic_schema()
         for department in departments
     ]
+    response: Response = negotiate_response(request, content)
+    set_next_cursor(response, next_cursor)
+    return response
 
 
 @router.post(
@@ -368,7 +543,7 @@ async def create_department(
         - authenticated by token;
         - permission to create department.
     """
-    current_admin: User = await get_current_admin(uow, token)
+    current_admin: Principal = await get_current_admin(uow, token)
     organization: Organization = (
         await get_current_organization(org_id, uow, current_admin)
     )
@@ -379,7 +554,9 @@ async def create_department(
         organization_id=organization.id
     )
     department: Department = await DepartmentService.create(uow, dept_data)
-    department: Department = await DepartmentService.get(uow, department.id)
+    department: Department = (
+        await DepartmentService.get(uow, department.id, 'detail')
+    )
     return department.to_pydantic_schema()
 
 
@@ -404,7 +581,7 @@ async def update_department(
         - authenticated by token;
         - permission to update department.
     """
-    current_admin: User = await get_current_admin(uow, token)
+    current_admin: Principal = await get_current_admin(uow, token)
     department: Department = await get_department_for_admin(
         org_id,
         dept_id,
@@ -417,7 +594,9 @@ async def update_department(
         department.id,
         dept_update_data
     )
-    department: Department = await DepartmentService.get(uow, department.id)
+    department: Department = (
+        await DepartmentService.get(uow, department.id, 'detail')
+    )
     return department.to_pydantic_schema()
 
 
@@ -440,7 +619,7 @@ async def delete_department(
         - authenticated by token;
         - permission to delete department.
     """
-    current_admin: User = await get_current_admin(uow, token)
+    current_admin: Principal = await get_current_admin(uow, token)
     department: Department = await get_department_for_admin(
         org_id,
         dept_id,
@@ -465,7 +644,8 @@ async def get_all_employees_in_department(
     dept_id: int,
     uow: UOWDep,
     token: TokenDeps,
-    query_params: QueryParamDeps
+    query_params: QueryParamDeps,
+    request: Request
 ):
     """
     Returns list of department employees.
@@ -480,7 +660,8 @@ async def get_all_employees_in_department(
         - `offset`: number of skip;
         - `limit`: limit the number of results;
         - `sort_by`: sort by field name;
-        - `sort`: ascending or descending.
+        - `sort`: ascending or descending;
+        - `cursor`: cursor of the next page from `X-Next-Cursor` header.
     """
     department: Department = await get_department_for_employee(
         org_id,
@@ -493,11 +674,15 @@ async def get_all_employees_in_department(
         department.id,
         query_params
     )
-    employees: list[Employee] = await EmployeeService.get_all(uow, data)
-    return [
-        employee.to_pydantic_schema()
-        for employee in employees
-    ]
+    rows, next_cursor = await EmployeeService.get_rows_page(
+        uow,
+        Employee.response_columns,
+        data
+    )
+    content: list = [Employee.row_to_pydantic_schema(row) for row in rows]
+    response: Response = negotiate_response(request, content)
+    set_next_cursor(response, next_cursor)
+    return response
 
 
 @router.post(
@@ -523,7 +708,7 @@ async def add_employee_to_department(
         - authenticated by token;
         - permission to add employee to a department.
     """
-    current_admin: User = await get_current_admin(uow, token)
+    current_admin: Principal = await get_current_admin(uow, token)
     employee: Employee = await get_organization_employee(
         org_id,
         uow,
@@ -551,7 +736,9 @@ async def add_employee_to_department(
             'role_id': employee_schema.role_id
         }
     )
-    department: Department = await DepartmentService.get(uow, department.id)
+    department: Department = (
+        await DepartmentService.get(uow, department.id, 'detail')
+    )
 
     return department.to_pydantic_schema()
 
@@ -577,7 +764,7 @@ async def update_department_employee_role(
         - authenticated by token;
         - permission to update employees role.
     """
-    current_admin: User = await get_current_admin(uow, token)
+    current_admin: Principal = await get_current_admin(uow, token)
     employee: Employee = await get_department_employee(
         org_id,
         dept_id,
@@ -595,7 +782,7 @@ async def update_department_employee_role(
         {'role_id': role.id}
     )
     department: Department = (
-        await DepartmentService.get(uow, employee.department_id)
+        await DepartmentService.get(uow, employee.department_id, 'detail')
     )
 
     return department.to_pydantic_schema()
@@ -624,7 +811,7 @@ async def remove_employee_from_department(
         - authenticated by token;
         - permission to remove employee from department.
     """
-    current_admin: User = await get_current_admin(uow, token)
+    current_admin: Principal = await get_current_admin(uow, token)
     employee: Employee = await get_department_employee(
         org_id,
         dept_id,
@@ -649,12 +836,51 @@ async def remove_employee_from_department(
         }
     )
     department: Department = (
-        await DepartmentService.get(uow, dept_id)
+        await DepartmentService.get(uow, dept_id, 'detail')
     )
 
     return department.to_pydantic_schema()
 
 
+@router.post(
+    '/{org_id}/department/{dept_id}/meeting/slots',
+    response_model=list[meet_res_schema.MeetingSlotSchema]
+)
+async def get_meeting_slots(
+    org_id: int,
+    dept_id: int,
+    uow: UOWDep,
+    token: TokenDeps,
+    slots_schema: meet_schema.MeetingSlotsSchema
+):
+    """
+    Search of the earliest common free slots of the employees
+    within the working hours of the period.
+
+    Requireds:
+        - employee IDs, search period, duration and working hours;
+        - organization ID;
+        - department ID;
+        - authenticated by token;
+        - permission to create meeting.
+    """
+    slots_data: dict = await get_meeting_slots_data(
+        org_id,
+        dept_id,
+        uow,
+        token,
+        slots_schema
+    )
+    slots: list[tuple] = await MeetingService.get_free_slots(
+        uow,
+        **slots_data
+    )
+    return [
+        meet_res_schema.MeetingSlotSchema(start_at=start_at, end_at=end_at)
+        for start_at, end_at in slots
+    ]
+
+
 @router.post(
     '/{org_id}/department/{dept_id}/meeting',
     status_code=status.HTTP_201_CREATED,
@@ -694,7 +920,7 @@ async def booking_meeting(
         meeting_data,
         unoccupied_employees
     )
-    meeting: Meeting = await MeetingService.get(uow, meeting.id)
+    meeting: Meeting = await MeetingService.get(uow, meeting.id, 'detail')
     return meet_res_schema.MeetingWithWithOccupiedEmployees(
         **meeting.to_pydantic_schema().model_dump(),
         occupied_employees=[
@@ -786,3 +1012,87 @@ async def remove_booking_meeting(
     meeting: Meeting = await MeetingService.delete(uow, meeting.id)
 
     return
+
+
+@router.get(
+    '/{org_id}/leaderboard',
+    response_model=list[score_res_schema.LeaderboardEntrySchema]
+)
+async def get_organization_leaderboard(
+    org_id: int,
+    uow: UOWDep,
+    token: TokenDeps,
+    query_params: LeaderboardParamDeps,
+    request: Request
+):
+    """
+    Returns employees of the organization
+    with the highest average score.
+
+    Requireds:
+        - organization ID;
+        - authenticated by token;
+        - permission to view the organization.
+    ---
+    Optional query parameters:
+        - `days`: length of the window in days;
+        - `limit`: number of employees.
+    """
+    current_admin: Principal = await get_current_admin(uow, token)
+    organization: Organization = (
+        await get_current_organization(org_id, uow, current_admin)
+    )
+    rows: list = await ScoreService.get_leaderboard(
+        uow,
+        organization_id=organization.id,
+        **query_params
+    )
+    content: list = [
+        score_res_schema.LeaderboardEntrySchema.model_construct(**row)
+        for row in rows
+    ]
+    return negotiate_response(request, content)
+
+
+@router.get(
+    '/{org_id}/department/{dept_id}/leaderboard',
+    response_model=list[score_res_schema.LeaderboardEntrySchema]
+)
+async def get_department_leaderboard(
+    org_id: int,
+    dept_id: int,
+    uow: UOWDep,
+    token: TokenDeps,
+    query_params: LeaderboardParamDeps,
+    request: Request
+):
+    """
+    Returns employees of the department
+    with the highest average score.
+
+    Requireds:
+        - organization ID;
+        - department ID;
+        - authenticated by token;
+        - permission to view the department.
+    ---
+    Optional query parameters:
+        - `days`: length of the window in days;
+        - `limit`: number of employees.
+    """
+    department: Department = await get_department_for_employee(
+        org_id,
+        dept_id,
+        uow,
+        token
+    )
+    rows: list = await ScoreService.get_leaderboard(
+        uow,
+        department_id=department.id,
+        **query_params
+    )
+    content: list = [
+        score_res_schema.LeaderboardEntrySchema.model_construct(**row)
+        for row in rows
+    ]
+    return negotiate_response(request, content)
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, Response, status
 
 from src.api.v1.dependencies import (
     get_task_to_update,
     get_comment_create_data,
     get_current_task,
+    get_search_scope,
     get_task_create_data,
     get_task_score_create_data,
     get_task_to_delete
@@ -15,8 +16,18 @@ from src.api.v1.schemas.request import (
 )
 from src.api.v1.schemas.response.comment import CommentResponseSchema
 from src.api.v1.schemas.response.score import ScoreResponseSchema
-from src.api.v1.schemas.response.task import TaskResponseSchema
-from src.dependencies import TokenDeps, QueryParamDeps, UOWDep
+from src.api.v1.schemas.response.task import (
+    TaskResponseSchema,
+    TaskSearchResultSchema
+)
+from src.core.responses import negotiate_response
+from src.dependencies import (
+    TokenDeps,
+    QueryParamDeps,
+    SearchParamDeps,
+    UOWDep,
+    UnitOfWorkRoute
+)
 from src.models import Comment, Score, Task
 from src.services import (
     CommentService,
@@ -24,9 +35,14 @@ from src.services import (
     TaskService
 )
 from src.services.utils import recieve_selection_data
+from src.utils.pagination import set_next_cursor
 
 
-router = APIRouter(prefix='/task', tags=['Task'])
+router = APIRouter(
+    prefix='/task',
+    tags=['Task'],
+    route_class=UnitOfWorkRoute
+)
 
 
 @router.post(
@@ -55,6 +71,41 @@ async def create_task(
     return task.to_pydantic_schema()
 
 
+@router.get(
+    '/search',
+    response_model=list[TaskSearchResultSchema]
+)
+async def search_tasks(
+    uow: UOWDep,
+    token: TokenDeps,
+    search_params: SearchParamDeps,
+    request: Request
+):
+    """
+    Full-text search over names and descriptions of tasks
+    and contents of comments ordered by rank.
+
+    Requireds:
+        - search query;
+        - authenticated by token;
+        - permission to view tasks in department.
+    ---
+    Query parameters:
+        - `q`: web search query, quoted phrases and `-word` are supported;
+        - `limit`: limit the number of results;
+        - `cursor`: cursor of the next page from `X-Next-Cursor` header.
+    """
+    scope: dict = await get_search_scope(uow, token)
+    rows, next_cursor = await TaskService.search(uow, **search_params, **scope)
+    content: list = [
+        TaskSearchResultSchema.model_construct(**row)
+        for row in rows
+    ]
+    response: Response = negotiate_response(request, content)
+    set_next_cursor(response, next_cursor)
+    return response
+
+
 @router.patch(
     '/{task_id}',
     response_model=TaskResponseSchema
@@ -91,7 +142,8 @@ async def get_task_comments(
     task_id: int,
     uow: UOWDep,
     token: TokenDeps,
-    query_params: QueryParamDeps
+    query_params: QueryParamDeps,
+    request: Request
 ):
     """
     Getting all comments for task.
@@ -105,16 +157,20 @@ async def get_task_comments(
         - `offset`: number of skip;
         - `limit`: limit the number of results;
         - `sort_by`: sort by field name;
-        - `sort`: ascending or descending.
+        - `sort`: ascending or descending;
+        - `cursor`: cursor of the next page from `X-Next-Cursor` header.
     """
     task: Task = await get_current_task(task_id, uow, token)
     data: dict = recieve_selection_data('task_id', task.id, query_params)
-    comments: list[Comment] = await CommentService.get_all(uow, data)
-
-    return [
-        comment.to_pydantic_schema()
-        for comment in comments
-    ]
+    rows, next_cursor = await CommentService.get_rows_page(
+        uow,
+        Comment.response_columns,
+        data
+    )
+    content: list = [Comment.row_to_pydantic_schema(row) for row in rows]
+    response: Response = negotiate_response(request, content)
+    set_next_cursor(response, next_cursor)
+    return response
 
 
 @router.post(
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 
 from src.api.v1.dependencies import get_current_user
 from src.api.v1.schemas.request.user import PasswordSchema
@@ -9,14 +9,16 @@ from src.api.v1.schemas.response.task_score import (
     ScoreWithTasks
 )
 from src.api.v1.schemas.response.task import TaskResponseSchema
-from src.dependencies import TokenDeps, QueryParamDeps, UOWDep
-from src.enums.role import RoleEnum
-from src.models import (
-    Employee,
-    Score,
-    Task,
-    User
+from src.cache.principal import Principal
+from src.core.responses import negotiate_response
+from src.dependencies import (
+    TokenDeps,
+    QueryParamDeps,
+    UOWDep,
+    UnitOfWorkRoute
 )
+from src.enums.role import RoleEnum
+from src.models import Employee, Task, User
 from src.services import (
     EmployeeService,
     ScoreService,
@@ -25,9 +27,14 @@ from src.services import (
     jwt_service
 )
 from src.services.utils import convert_status, recieve_selection_data
+from src.utils.pagination import set_next_cursor
 
 
-router = APIRouter(prefix='/users', tags=['Users'])
+router = APIRouter(
+    prefix='/users',
+    tags=['Users'],
+    route_class=UnitOfWorkRoute
+)
 
 
 @router.get('/me')
@@ -41,12 +48,13 @@ async def read_current_user(
     Requireds:
         - authenticated by token.
     """
-    user: User = await get_current_user(uow, token)
+    principal: Principal = await get_current_user(uow, token)
     employee: Employee = await EmployeeService.get_by_filters(
         uow,
-        user_id=user.id
+        user_id=principal.id
     )
     if not employee:
+        user: User = await UserService.get(uow, principal.id)
         return user.to_pydantic_schema()
 
     return employee.to_pydantic_schema()
@@ -65,7 +73,8 @@ async def change_password(
         - password data;
         - authenticated by token.
     """
-    user: User = await get_current_user(uow, token)
+    principal: Principal = await get_current_user(uow, token)
+    user: User = await UserService.get(uow, principal.id)
     user: User = await UserService.change_password(
         uow,
         user,
@@ -82,6 +91,7 @@ async def get_employee_tasks(
     uow: UOWDep,
     token: TokenDeps,
     query_params: QueryParamDeps,
+    request: Request,
     status: Optional[str] = None
 ):
     """
@@ -95,11 +105,13 @@ async def get_employee_tasks(
         - `limit`: limit the number of results;
         - `sort_by`: sort by field name;
         - `sort`: ascending or descending;
+        - `cursor`: cursor of the next page from `X-Next-Cursor` header;
         - `status`: task status in `new`, `in_progres` or `done`.
     """
-    user: User = await get_current_user(uow, token)
+    user: Principal = await get_current_user(uow, token)
     employee: Employee = await EmployeeService.get_by_filters(
         uow,
+        profile='auth',
         user_id=user.id
     )
     if employee.role.name == RoleEnum.OWNER:
@@ -111,12 +123,15 @@ async def get_employee_tasks(
     if status:
         data['filters']['status'] = convert_status(status)
 
-    tasks: list[Task] = await TaskService.get_all(uow, data)
-
-    return [
-        task.to_pydantic_schema()
-        for task in tasks
-    ]
+    rows, next_cursor = await TaskService.get_rows_page(
+        uow,
+        Task.response_columns,
+        data
+    )
+    content: list = [Task.row_to_pydantic_schema(row) for row in rows]
+    response: Response = negotiate_response(request, content)
+    set_next_cursor(response, next_cursor)
+    return response
 
 
 @router.get(
@@ -126,10 +141,12 @@ async def get_employee_tasks(
 async def get_employee_scores(
     uow: UOWDep,
     token: TokenDeps,
-    query_params: QueryParamDeps
+    query_params: QueryParamDeps,
+    response: Response
 ):
     """
-    Receives a list of scores for a specific employee.
+    Receives a list of scores for a specific employee
+    with the average score over all his scores.
 
     Requireds:
         - authenticated by token.
@@ -138,9 +155,10 @@ async def get_employee_scores(
         - `offset`: number of skip;
         - `limit`: limit the number of results;
         - `sort_by`: sort by field name;
-        - `sort`: ascending or descending.
+        - `sort`: ascending or descending;
+        - `cursor`: cursor of the next page from `X-Next-Cursor` header.
     """
-    user: User = await get_current_user(uow, token)
+    user: Principal = await get_current_user(uow, token)
     employee: Employee = await EmployeeService.get_by_filters(
         uow,
         user_id=user.id
@@ -150,26 +168,16 @@ async def get_employee_scores(
         employee.id,
         query_params
     )
-    scores: list[Score] = await ScoreService.get_all(uow, data)
-    avg_score: float = 0.0
-
-    if not scores:
-        return ScoreWithTasks(average_score=avg_score, tasks=[])
-
-    total: int = 0
-    task_ids: list = []
-    for score in scores:
-        total += score.in_time + score.integrity + score.quality
-        task_ids.append(score.task_id)
-
-    avg_score = total / len(scores)
+    scores, next_cursor = await ScoreService.get_page(uow, data, 'list')
+    set_next_cursor(response, next_cursor)
+    avg_score: float = await ScoreService.get_average_score(uow, employee.id)
 
     return ScoreWithTasks(
         average_score=avg_score,
         tasks=[
             TaskWithScore(
                 task=score.task.to_pydantic_schema(),
-                score=score.task.score.to_pydantic_data()
+                score=score.to_pydantic_data()
             )
             for score in scores
         ]
@@ -1,6 +1,8 @@
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, EmailStr, Field, field_validator
+
+from src.enums.role import RoleEnum
 
 
 class EmployeeSchema(BaseModel):
@@ -9,3 +11,21 @@ class EmployeeSchema(BaseModel):
     department_id: Optional[int] = None
     user_id: int
     role_id: Optional[int] = None
+
+
+class EmployeeImportSchema(BaseModel):
+
+    email: EmailStr
+    username: str = Field(min_length=1)
+    department: Optional[str] = None
+    role: RoleEnum = RoleEnum.VIEWER
+
+    @field_validator('department', mode='before')
+    @classmethod
+    def validate_department(cls, department: Any) -> Any:
+        return department or None
+
+    @field_validator('role', mode='before')
+    @classmethod
+    def validate_role(cls, role: Any) -> Any:
+        return role or RoleEnum.VIEWER
@@ -1,6 +1,16 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
+
+from src.core.constants import INVITE_BATCH_MAX_SIZE
 
 
 class InvitionCreateSchema(BaseModel):
 
     email: EmailStr
+
+
+class InvitionBatchCreateSchema(BaseModel):
+
+    emails: list[EmailStr] = Field(
+        min_length=1,
+        max_length=INVITE_BATCH_MAX_SIZE
+    )
@@ -1,6 +1,12 @@
-from datetime import datetime
+from datetime import datetime, time, timedelta
 
-from pydantic import BaseModel
+from pydantic import AwareDatetime, BaseModel, Field, model_validator
+
+from src.core.constants import (
+    MEETING_SLOTS_DEFAULT_LIMIT,
+    MEETING_SLOTS_MAX_DAYS,
+    MEETING_SLOTS_MAX_LIMIT
+)
 
 
 class MeetingCreateSchema(BaseModel):
@@ -19,3 +25,36 @@ class MeetingUpdateSchema(MeetingCreateSchema):
 class MeetingDeleteSchema(BaseModel):
 
     id: int
+
+
+class MeetingSlotsSchema(BaseModel):
+
+    employee_ids: list[int] = Field(min_length=1)
+    start_at: AwareDatetime
+    end_at: AwareDatetime
+    duration_minutes: int = Field(gt=0)
+    work_start: time = time(9)
+    work_end: time = time(18)
+    limit: int = Field(
+        default=MEETING_SLOTS_DEFAULT_LIMIT,
+        gt=0,
+        le=MEETING_SLOTS_MAX_LIMIT
+    )
+
+    @model_validator(mode='after')
+    def validate_period(self) -> 'MeetingSlotsSchema':
+        if self.start_at >= self.end_at:
+            raise ValueError('The search period must end after it starts')
+
+        if self.end_at - self.start_at > timedelta(
+            days=MEETING_SLOTS_MAX_DAYS
+        ):
+            raise ValueError(
+                f'The search period must not exceed '
+                f'{MEETING_SLOTS_MAX_DAYS} days'
+            )
+
+        if self.work_start >= self.work_end:
+            raise ValueError('The working day must end after it starts')
+
+        return self
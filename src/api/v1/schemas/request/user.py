@@ -24,3 +24,13 @@ class PasswordSchema(BaseModel):
     @classmethod
     def validate_password(cls, password: str) -> str:
         return password_validator(password)
+
+
+class SetPasswordSchema(BaseModel):
+
+    password: str
+
+    @field_validator('password')
+    @classmethod
+    def validate_password(cls, password: str) -> str:
+        return password_validator(password)
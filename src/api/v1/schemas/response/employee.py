@@ -18,3 +18,15 @@ class EmployeeResponseSchema(BaseModel):
 class DismissedEmployeeSchema(BaseModel):
 
     dismissed_employee: EmployeeResponseSchema
+
+
+class EmployeeImportErrorSchema(BaseModel):
+
+    row: int
+    errors: list[str]
+
+
+class EmployeeImportReportSchema(BaseModel):
+
+    created: int
+    errors: list[EmployeeImportErrorSchema] = []
@@ -20,3 +20,9 @@ class MeetingResponseSchema(BaseModel):
 class MeetingWithWithOccupiedEmployees(MeetingResponseSchema):
 
     occupied_employees: list[EmployeeResponseSchema] = []
+
+
+class MeetingSlotSchema(BaseModel):
+
+    start_at: datetime
+    end_at: datetime
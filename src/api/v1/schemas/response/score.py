@@ -13,3 +13,10 @@ class ScoreResponseSchema(BaseModel):
     quality: int = Field(default=1, qe=1, le=10)
     created_at: datetime
     updated_at: datetime
+
+
+class LeaderboardEntrySchema(BaseModel):
+
+    employee_id: int
+    average_score: float
+    scores_count: int
@@ -24,3 +24,12 @@ class DeletedTaskResponseSchema(BaseModel):
     description: Optional[str] = None
     deleted_by: int
     status: str
+
+
+class TaskSearchResultSchema(BaseModel):
+
+    kind: str
+    id: int
+    task_id: int
+    rank: float
+    headline: str
@@ -1,17 +1,95 @@
-import smtplib
+import asyncio
+import os
+from smtplib import SMTPException
 
 from celery import Celery
+from celery.signals import worker_init, worker_process_shutdown
+from prometheus_client import (
+    CollectorRegistry,
+    multiprocess,
+    start_http_server
+)
 
-from src.background.tasks.smtp import get_email_invite_template
+from src.background.mailer import close_smtp_pool, get_smtp_pool
+from src.background.tasks.scores import rollup_daily_scores
+from src.background.tasks.smtp import (
+    get_email_invite_template,
+    get_email_set_password_template
+)
+from src.core.constants import (
+    SCORE_ROLLUP_INTERVAL_SECONDS,
+    SMTP_TASK_MAX_RETRIES
+)
 from src.core.settings.base import settings
 
 
 celery = Celery('tasks', broker=str(settings.REDIS_URL))
 
 
+@worker_init.connect
+def start_metrics_server(**kwargs) -> None:
+    """
+    Exposes the metrics of the worker on `CELERY_METRICS_PORT`.
+    With `PROMETHEUS_MULTIPROC_DIR` set the metrics of all
+    the pool processes are collected from the directory.
+    """
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        start_http_server(settings.CELERY_METRICS_PORT)
+        return
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    start_http_server(settings.CELERY_METRICS_PORT, registry=registry)
+
+
+@worker_process_shutdown.connect
+def close_worker_smtp_pool(pid: int, **kwargs) -> None:
+    close_smtp_pool()
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        multiprocess.mark_process_dead(pid)
+
+
 @celery.task
 def send_email_org_invite(data: dict) -> None:
-    email_msg = get_email_invite_template(data)
-    with smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-        server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-        server.send_message(email_msg)
+    get_smtp_pool().send_messages([get_email_invite_template(data)])
+
+
+@celery.task
+def send_email_org_invites(data_list: list[dict]) -> None:
+    """
+    Sends the chunk of invitations over one pooled SMTP session.
+    A refused recipient doesn't stop the rest of the chunk.
+    """
+    get_smtp_pool().send_messages(
+        get_email_invite_template(data) for data in data_list
+    )
+
+
+@celery.task(
+    autoretry_for=(SMTPException, OSError),
+    retry_backoff=True,
+    max_retries=SMTP_TASK_MAX_RETRIES
+)
+def send_email_set_passwords(data_list: list[dict]) -> None:
+    """
+    Sends the chunk of one-time set password links
+    of the imported users over one pooled SMTP session.
+    A failed chunk is retried, the links stay valid until they expire.
+    """
+    get_smtp_pool().send_messages(
+        get_email_set_password_template(data) for data in data_list
+    )
+
+
+@celery.task
+def rollup_scores() -> int:
+    """Recomputes the daily rollups touched by the new scores."""
+    return asyncio.run(rollup_daily_scores())
+
+
+celery.conf.beat_schedule = {
+    rollup_scores.name: {
+        'task': rollup_scores.name,
+        'schedule': SCORE_ROLLUP_INTERVAL_SECONDS,
+    },
+}
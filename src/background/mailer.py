@@ -0,0 +1,209 @@
+import logging
+import smtplib
+from contextlib import contextmanager
+from email.message import EmailMessage
+from queue import Empty, Full, LifoQueue
+from time import monotonic, perf_counter
+from typing import Generator, Iterable, Optional, Union
+
+from src.core.metrics import (
+    SMTP_CONNECTIONS_OPENED,
+    SMTP_MESSAGES_SENT,
+    SMTP_SEND_SECONDS
+)
+from src.core.settings.base import settings
+
+
+logger = logging.getLogger(__name__)
+
+SMTPConnection = Union[smtplib.SMTP, smtplib.SMTP_SSL]
+
+
+class SMTPPool:
+    """
+    Per-process pool of logged in SMTP connections.
+    A connection idle longer than `idle_timeout` is checked by NOOP
+    before reuse and replaced if the server has dropped it.
+
+    Args:
+        - `host`: SMTP server host;
+        - `port`: SMTP server port;
+        - `user`: login user;
+        - `password`: login password;
+        - `use_ssl`: connect over implicit TLS;
+        - `size`: maximum number of idle connections;
+        - `idle_timeout`: seconds of idleness before the NOOP check;
+        - `timeout`: socket timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        use_ssl: bool,
+        size: int,
+        idle_timeout: float,
+        timeout: float
+    ) -> None:
+        self._host = host
+        self._port = port
+        self._user = user
+        self._password = password
+        self._use_ssl = use_ssl
+        self._idle_timeout = idle_timeout
+        self._timeout = timeout
+        self._idle: LifoQueue[tuple[float, SMTPConnection]] = (
+            LifoQueue(maxsize=size)
+        )
+
+    def _open(self) -> SMTPConnection:
+        smtp_class: type[SMTPConnection] = (
+            smtplib.SMTP_SSL if self._use_ssl else smtplib.SMTP
+        )
+        connection: SMTPConnection = smtp_class(
+            self._host,
+            self._port,
+            timeout=self._timeout
+        )
+        connection.login(self._user, self._password)
+        SMTP_CONNECTIONS_OPENED.inc()
+        return connection
+
+    @staticmethod
+    def _close(connection: SMTPConnection) -> None:
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
+
+    def _is_alive(self, connection: SMTPConnection) -> bool:
+        try:
+            return connection.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _acquire(self) -> SMTPConnection:
+        while True:
+            try:
+                released_at, connection = self._idle.get_nowait()
+            except Empty:
+                return self._open()
+
+            if (
+                monotonic() - released_at < self._idle_timeout
+                or self._is_alive(connection)
+            ):
+                return connection
+
+            self._close(connection)
+
+    def _release(self, connection: SMTPConnection) -> None:
+        try:
+            self._idle.put_nowait((monotonic(), connection))
+        except Full:
+            self._close(connection)
+
+    @contextmanager
+    def connection(self) -> Generator[SMTPConnection, None, None]:
+        """
+        Yields a logged in connection and returns it to the pool.
+        The connection is closed if the session fails with any error.
+        """
+        connection: SMTPConnection = self._acquire()
+        released: bool = False
+        try:
+            yield connection
+            self._release(connection)
+            released = True
+        finally:
+            if not released:
+                connection.close()
+
+    def send_messages(self, messages: Iterable[EmailMessage]) -> int:
+        """
+        Sends the messages over one session and returns the number sent.
+        The session is reopened once if the server drops it,
+        messages refused or failed by the server are logged and skipped.
+        """
+        messages: list[EmailMessage] = list(messages)
+        index: int = 0
+        sent: int = 0
+        retried: bool = False
+        while index < len(messages):
+            try:
+                with self.connection() as connection:
+                    for message in messages[index:]:
+                        sent += self._send(connection, message)
+                        index += 1
+
+            except smtplib.SMTPServerDisconnected:
+                if retried:
+                    raise
+
+                retried = True
+
+        return sent
+
+    @staticmethod
+    def _send(connection: SMTPConnection, message: EmailMessage) -> bool:
+        start: float = perf_counter()
+        try:
+            connection.send_message(message)
+        except smtplib.SMTPRecipientsRefused:
+            SMTP_MESSAGES_SENT.labels('refused').inc()
+            logger.warning('Message to %s is refused', message['To'])
+            return False
+        except smtplib.SMTPResponseException as exc:
+            SMTP_MESSAGES_SENT.labels('failed').inc()
+            logger.warning(
+                'Message to %s is failed: %s %s',
+                message['To'],
+                exc.smtp_code,
+                exc.smtp_error
+            )
+            return False
+
+        SMTP_SEND_SECONDS.observe(perf_counter() - start)
+        SMTP_MESSAGES_SENT.labels('sent').inc()
+        return True
+
+    def close(self) -> None:
+        """Closes all the idle connections."""
+        while True:
+            try:
+                _, connection = self._idle.get_nowait()
+            except Empty:
+                return
+
+            self._close(connection)
+
+
+_pool: Optional[SMTPPool] = None
+
+
+def get_smtp_pool() -> SMTPPool:
+    """Returns the SMTP pool of the worker process."""
+    global _pool
+    if _pool is None:
+        _pool = SMTPPool(
+            settings.SMTP_HOST,
+            settings.SMTP_PORT,
+            settings.SMTP_USER,
+            settings.SMTP_PASSWORD,
+            settings.SMTP_USE_SSL,
+            settings.SMTP_POOL_SIZE,
+            settings.SMTP_IDLE_TIMEOUT,
+            settings.SMTP_TIMEOUT
+        )
+
+    return _pool
+
+
+def close_smtp_pool() -> None:
+    """Closes the SMTP pool of the worker process."""
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        _pool = None
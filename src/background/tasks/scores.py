@@ -0,0 +1,14 @@
+from src.db.engine import engine
+from src.dependencies.unit_of_work import get_uow
+from src.services import ScoreService
+
+
+async def rollup_daily_scores() -> int:
+    """
+    Recomputes the daily rollups touched by the new scores.
+    The engine is disposed since every task runs in a new event loop.
+    """
+    try:
+        return await ScoreService.rollup_daily(next(get_uow()))
+    finally:
+        await engine.dispose()
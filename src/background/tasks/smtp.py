@@ -1,8 +1,9 @@
 from email.message import EmailMessage
 
-from src.core.constants import INVITE_URL_PREFIX
+from src.core.constants import INVITE_URL_PREFIX, SET_PASSWORD_URL_PREFIX
 from src.core.settings.base import settings
 from src.templates.invite import get_invite_content_template
+from src.templates.set_password import get_set_password_content_template
 
 
 def get_email_invite_template(data: dict) -> EmailMessage:
@@ -21,3 +22,22 @@ def get_email_invite_template(data: dict) -> EmailMessage:
 
     email_msg.set_content(content, subtype='html')
     return email_msg
+
+
+def get_email_set_password_template(data: dict) -> EmailMessage:
+    org_name: str = data.get('organization').get('name')
+    code: str = data.get('code')
+    url: str = f'{settings.ADDRESS_URL}{SET_PASSWORD_URL_PREFIX}?code={code}'
+    content: str = get_set_password_content_template(
+        org_name,
+        data.get('username'),
+        url
+    )
+
+    email_msg = EmailMessage()
+    email_msg['Subject'] = 'Вы добавлены в организацию'
+    email_msg['From'] = settings.SMTP_USER
+    email_msg['To'] = data.get('email')
+
+    email_msg.set_content(content, subtype='html')
+    return email_msg
@@ -0,0 +1,167 @@
+import logging
+from typing import Any, Optional
+
+import orjson
+from redis.exceptions import RedisError
+
+from src.cache import invalidation
+from src.cache.memory import TTLCache
+from src.cache.redis import RedisClient
+from src.core.constants import (
+    ENTITY_CACHE_LOCAL_TTL_SECONDS,
+    ENTITY_CACHE_MAXSIZE,
+    ENTITY_CACHE_NEGATIVE_TTL_SECONDS,
+    ENTITY_INVALIDATION_CHANNEL
+)
+
+
+logger = logging.getLogger(__name__)
+
+_local = TTLCache(ENTITY_CACHE_MAXSIZE, ENTITY_CACHE_LOCAL_TTL_SECONDS)
+
+_MISSING = object()
+
+
+class EntityCache:
+    """
+    Read-through cache of the service objects by ID and lookup fields.
+    The per-worker cache is layered over the shared Redis cache,
+    missing objects are cached for a short time as well.
+    The cache is bypassed by units of work with pending writes.
+
+    Args:
+        - `ttl`: time to live of the cached object in seconds;
+        Optional:
+        - `lookups`: fields of `get_by_filters` served from the cache;
+        - `negative_ttl`: time to live of the missing object in seconds.
+    """
+
+    def __init__(
+        self,
+        ttl: int,
+        lookups: tuple[str, ...] = (),
+        negative_ttl: int = ENTITY_CACHE_NEGATIVE_TTL_SECONDS
+    ) -> None:
+        self._ttl = ttl
+        self._lookups = lookups
+        self._negative_ttl = negative_ttl
+        self._namespace: str = ''
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._namespace = f'entity:{owner._repository}'
+
+    def _key(self, field: str, value: Any) -> str:
+        return f'{self._namespace}:{field}:{value}'
+
+    async def _read(self, key: str) -> Any:
+        value: Any = _local.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        try:
+            value = await RedisClient.get_cache(key)
+        except RedisError:
+            logger.warning('Entity cache is unavailable')
+            return _MISSING
+
+        if value is None:
+            return _MISSING
+
+        ttl: int = self._ttl if value else self._negative_ttl
+        _local.set(key, value, min(ttl, ENTITY_CACHE_LOCAL_TTL_SECONDS))
+        return value
+
+    async def _write(self, key: str, value: Any) -> None:
+        ttl: int = self._ttl if value else self._negative_ttl
+        _local.set(key, value, min(ttl, ENTITY_CACHE_LOCAL_TTL_SECONDS))
+        try:
+            await RedisClient.set_cache(key, value, ttl)
+        except RedisError:
+            logger.warning('Entity cache is unavailable')
+
+    def accepts(self, filters: dict) -> bool:
+        """Whether the filters are a lookup served from the cache."""
+        if len(filters) != 1:
+            return False
+
+        (field, value), = filters.items()
+        return field in self._lookups and value is not None
+
+    async def get(self, uow, repository, pk: int) -> Optional[Any]:
+        """Returns the object by ID if it exists."""
+        if uow.has_writes:
+            return await repository.get(pk)
+
+        key: str = self._key('id', pk)
+        data: Any = await self._read(key)
+        if data is not _MISSING:
+            return repository.from_cache(data) if data else None
+
+        obj: Optional[Any] = await repository.get(pk)
+        await self._write(key, repository.to_cache(obj) if obj else {})
+        return obj
+
+    async def get_by(
+        self,
+        uow,
+        repository,
+        field: str,
+        value: Any
+    ) -> Optional[Any]:
+        """
+        Returns the object by the lookup field value if it exists.
+        The cached ID is verified against the object field value.
+        """
+        if uow.has_writes:
+            return await repository.get_by_filters(**{field: value})
+
+        key: str = self._key(field, value)
+        pk: Any = await self._read(key)
+        if pk is not _MISSING:
+            if not pk:
+                return None
+
+            obj: Optional[Any] = await self.get(uow, repository, pk)
+            if obj is not None and getattr(obj, field) == value:
+                return obj
+
+        obj = await repository.get_by_filters(**{field: value})
+        await self._write(key, obj.id if obj else 0)
+        if obj:
+            data: dict = repository.to_cache(obj)
+            await self._write(self._key('id', obj.id), data)
+
+        return obj
+
+    def keys(self, obj: Any) -> list[str]:
+        """Returns the cache keys of the object."""
+        keys: list[str] = [self._key('id', obj.id)]
+        keys.extend(
+            self._key(field, getattr(obj, field)) for field in self._lookups
+        )
+        return keys
+
+    async def invalidate(self, obj: Any) -> None:
+        """Removes the object from the caches of all workers."""
+        keys: list[str] = self.keys(obj)
+        evict(keys)
+        try:
+            await RedisClient.remove(*keys)
+            await invalidation.publish(
+                ENTITY_INVALIDATION_CHANNEL,
+                orjson.dumps(keys).decode()
+            )
+        except RedisError:
+            logger.warning('Entity cache is unavailable')
+
+
+def evict(keys: list[str]) -> None:
+    """Removes the keys from the local cache."""
+    for key in keys:
+        _local.pop(key)
+
+
+invalidation.register_handler(
+    ENTITY_INVALIDATION_CHANNEL,
+    lambda message: evict(orjson.loads(message))
+)
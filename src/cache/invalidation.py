@@ -0,0 +1,65 @@
+import asyncio
+import logging
+from typing import Callable
+
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from src.cache.redis import RedisClient
+from src.core.constants import INVALIDATION_RECONNECT_SECONDS
+
+
+logger = logging.getLogger(__name__)
+
+_handlers: dict[str, Callable[[str], None]] = {}
+
+
+def register_handler(channel: str, handler: Callable[[str], None]) -> None:
+    """
+    Registers the handler of invalidation messages.
+
+    Args:
+        - `channel`: Redis channel name;
+        - `handler`: callable that receives the decoded message.
+    """
+    _handlers[channel] = handler
+
+
+async def publish(channel: str, message: str) -> None:
+    """Notifies all the application workers about invalidation."""
+    await RedisClient.publish(channel, message)
+
+
+async def listen() -> None:
+    """
+    Dispatches invalidation messages to the registered handlers.
+    A failed handler is logged and skipped,
+    the listener resubscribes if Redis fails.
+    """
+    while True:
+        try:
+            pubsub: PubSub = await RedisClient.subscribe(*_handlers)
+            try:
+                async for message in pubsub.listen():
+                    if message['type'] == 'message':
+                        _dispatch(message)
+            finally:
+                await pubsub.aclose()
+
+        except RedisError:
+            logger.warning(
+                'Invalidation listener lost connection to Redis',
+                exc_info=True
+            )
+            await asyncio.sleep(INVALIDATION_RECONNECT_SECONDS)
+        except Exception:
+            logger.exception('Invalidation listener failed')
+            await asyncio.sleep(INVALIDATION_RECONNECT_SECONDS)
+
+
+def _dispatch(message: dict) -> None:
+    try:
+        channel: str = message['channel'].decode()
+        _handlers[channel](message['data'].decode())
+    except Exception:
+        logger.exception('Invalidation message %r is not handled', message)
@@ -0,0 +1,61 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    In-process LRU mapping with per-entry expiration.
+
+    Args:
+        - `maxsize`: maximum number of entries,
+        the least recently used entry is evicted first;
+        - `ttl`: default time to live of an entry in seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value of key if it exists and is not expired."""
+        item: Optional[tuple[float, Any]] = self._data.get(key)
+        if item is None:
+            return default
+
+        expire_at, value = item
+        if expire_at <= monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None
+    ) -> None:
+        """Set key to hold the value for `ttl` seconds."""
+        ttl = self._ttl if ttl is None else ttl
+        if ttl <= 0:
+            self._data.pop(key, None)
+            return
+
+        self._data[key] = (monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Removes the key. A key is ignored if it does not exist."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all keys."""
+        self._data.clear()
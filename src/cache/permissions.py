@@ -0,0 +1,59 @@
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from sqlalchemy import Row
+
+from src.cache import invalidation
+from src.core.constants import PERMISSIONS_INVALIDATION_CHANNEL
+from src.enums.permission import PERMISSION_BITS
+
+
+class PermissionRegistry:
+    """
+    Role ID to permission bitmask mapping compiled from the database.
+    The registry is marked stale in all workers through Redis pub/sub
+    when the role bindings change and is recompiled on next access.
+    """
+
+    def __init__(self) -> None:
+        self._masks: dict[int, int] = {}
+        self._stale: bool = True
+
+    def get(self, role_id: int) -> Optional[int]:
+        """Returns the role bitmask if the registry is up to date."""
+        if self._stale:
+            return None
+
+        return self._masks.get(role_id)
+
+    def compile(self, bindings: Iterable[Row]) -> None:
+        """
+        Compiles the registry.
+
+        Args:
+            - `bindings`: rows of the form (role_id, permission_name),
+            permission name is None for roles without permissions.
+        """
+        masks: defaultdict[int, int] = defaultdict(int)
+        for role_id, permission_name in bindings:
+            masks[role_id] |= PERMISSION_BITS.get(permission_name, 0)
+
+        self._masks = dict(masks)
+        self._stale = False
+
+    def mark_stale(self) -> None:
+        """Forces recompilation on next access in the current worker."""
+        self._stale = True
+
+    async def invalidate(self) -> None:
+        """Forces recompilation on next access in all workers."""
+        self.mark_stale()
+        await invalidation.publish(PERMISSIONS_INVALIDATION_CHANNEL, '*')
+
+
+permission_registry = PermissionRegistry()
+
+invalidation.register_handler(
+    PERMISSIONS_INVALIDATION_CHANNEL,
+    lambda message: permission_registry.mark_stale()
+)
@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from src.cache import invalidation
+from src.cache.memory import TTLCache
+from src.core.constants import (
+    PRINCIPAL_CACHE_MAXSIZE,
+    PRINCIPAL_CACHE_TTL_SECONDS,
+    PRINCIPAL_INVALIDATION_CHANNEL
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Compact snapshot of the authenticated user."""
+
+    id: int
+    email: str
+    is_active: bool
+    is_superuser: bool
+    role_name: str
+    employee_id: Optional[int] = None
+    department_id: Optional[int] = None
+    organization_id: Optional[int] = None
+
+
+class PrincipalCache:
+    """
+    Per-worker cache of principals by user ID.
+    Entries are evicted in all workers through Redis pub/sub
+    when the user or his employee record changes.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._cache = TTLCache(maxsize, ttl)
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        """Returns the cached principal if it exists."""
+        return self._cache.get(user_id)
+
+    def set(self, principal: Principal) -> None:
+        """Caches the principal."""
+        self._cache.set(principal.id, principal)
+
+    def evict(self, user_id: int) -> None:
+        """Removes the principal from the local cache."""
+        self._cache.pop(user_id)
+
+    async def invalidate(self, user_id: int) -> None:
+        """Removes the principal from the caches of all workers."""
+        self.evict(user_id)
+        await invalidation.publish(
+            PRINCIPAL_INVALIDATION_CHANNEL,
+            str(user_id)
+        )
+
+
+principal_cache = PrincipalCache(
+    PRINCIPAL_CACHE_MAXSIZE,
+    PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+invalidation.register_handler(
+    PRINCIPAL_INVALIDATION_CHANNEL,
+    lambda message: principal_cache.evict(int(message))
+)
@@ -1,51 +1,210 @@
-import json
-from typing import Any, Optional
+import zlib
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Generator, Iterable, Optional
 
-from aioredis import Redis, from_url
+import orjson
+from redis.asyncio import ConnectionPool, Redis
+from redis.asyncio.client import Pipeline, PubSub
 
-from src import main
+from src.core.metrics import REDIS_COMMAND_SECONDS
 from src.core.settings.base import settings
 
 
+_ZLIB_HEADER: bytes = b'\x78'
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serializes the value with orjson.
+    Values larger than the compression threshold are compressed by zlib.
+    """
+    data: bytes = orjson.dumps(value)
+    threshold: int = settings.REDIS_COMPRESSION_THRESHOLD
+    if threshold and len(data) >= threshold:
+        return zlib.compress(data)
+
+    return data
+
+
+def loads(data: Optional[bytes]) -> Any:
+    """Deserializes the value stored by `dumps`."""
+    if data is None:
+        return None
+
+    if data[:1] == _ZLIB_HEADER:
+        data = zlib.decompress(data)
+
+    return orjson.loads(data)
+
+
+@contextmanager
+def _timed(command: str) -> Generator[None, None, None]:
+    started: float = perf_counter()
+    try:
+        yield
+    finally:
+        REDIS_COMMAND_SECONDS.labels(command).observe(
+            perf_counter() - started
+        )
+
+
 class RedisClient:
+    """
+    Redis access layer for the web, worker and CLI processes.
+    The connection pool is created on first use in the process.
+    """
+
+    _pool: Optional[ConnectionPool] = None
+    _redis: Optional[Redis] = None
 
-    @staticmethod
-    async def init_redis() -> Redis:
+    @classmethod
+    def get_redis(cls) -> Redis:
+        """Returns the client bound to the process connection pool."""
+        if cls._redis is None:
+            cls._pool = ConnectionPool.from_url(
+                str(settings.REDIS_URL),
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL
+            )
+            cls._redis = Redis(connection_pool=cls._pool)
+
+        return cls._redis
+
+    @classmethod
+    async def init_redis(cls) -> Redis:
         """Initialize Redis client."""
-        return from_url(str(settings.REDIS_URL))
+        return cls.get_redis()
+
+    @classmethod
+    async def close(cls) -> None:
+        """Closes the client and disconnects the pool."""
+        if cls._redis is None:
+            return
 
-    @staticmethod
+        await cls._redis.aclose()
+        await cls._pool.disconnect()
+        cls._redis = None
+        cls._pool = None
+
+    @classmethod
+    def pipeline(cls) -> Pipeline:
+        """
+        Returns a pipeline that sends the buffered commands
+        in one round trip on `execute`.
+        """
+        return cls.get_redis().pipeline(transaction=False)
+
+    @classmethod
     async def set_cache(
+        cls,
         key: str,
         value: Any,
         expire: Optional[int] = None
     ) -> None:
-        """Set key to hold the string value."""
-        await main.app.state.redis.set(key, json.dumps(value), expire)
+        """Set key to hold the serialized value."""
+        with _timed('set'):
+            await cls.get_redis().set(key, dumps(value), ex=expire)
 
-    @staticmethod
-    async def get_cache(key: str) -> Any:
+    @classmethod
+    async def get_cache(cls, key: str) -> Any:
         """Get the value of key."""
-        value: Optional[Any] = await main.app.state.redis.get(key)
-        if value:
-            return json.loads(value)
+        with _timed('get'):
+            value: Optional[bytes] = await cls.get_redis().get(key)
+
+        return loads(value)
+
+    @classmethod
+    async def set_many(
+        cls,
+        mapping: dict[str, Any],
+        expire: Optional[int] = None
+    ) -> None:
+        """
+        Set keys to hold the serialized values in one round trip.
+
+        Args:
+            - `mapping`: dict of the form {key: value};
+            Optional:
+            - `expire`: keys timeout in seconds.
+        """
+        if not mapping:
+            return
+
+        pipe: Pipeline = cls.pipeline()
+        if expire:
+            for key, value in mapping.items():
+                pipe.set(key, dumps(value), ex=expire)
+        else:
+            pipe.mset({key: dumps(value) for key, value in mapping.items()})
 
-    @staticmethod
-    async def add_values_to_key(key: str, *values) -> None:
+        with _timed('mset'):
+            await pipe.execute()
+
+    @classmethod
+    async def get_many(cls, keys: Iterable[str]) -> list[Any]:
+        """
+        Get the values of all the given keys in one round trip.
+        None is returned for every key that does not exist.
+        """
+        keys: list[str] = list(keys)
+        if not keys:
+            return []
+
+        with _timed('mget'):
+            values: list[Optional[bytes]] = await cls.get_redis().mget(keys)
+
+        return [loads(value) for value in values]
+
+    @classmethod
+    async def add_values_to_key(cls, key: str, *values) -> None:
         """Add the specified members to the set stored at key."""
-        await main.app.state.redis.sadd(key, *values)
+        with _timed('sadd'):
+            await cls.get_redis().sadd(key, *values)
 
-    @staticmethod
-    async def set_expire(key: str, seconds: int) -> None:
+    @classmethod
+    async def set_expire(cls, key: str, seconds: int) -> None:
         """Set a timeout on key."""
-        await main.app.state.redis.expire(key, seconds)
+        with _timed('expire'):
+            await cls.get_redis().expire(key, seconds)
 
-    @staticmethod
-    async def get_values_from_key(key: str) -> set[bytes]:
+    @classmethod
+    async def get_values_from_key(cls, key: str) -> set[bytes]:
         """Returns all the members of the set value stored at key."""
-        return await main.app.state.redis.smembers(key)
+        with _timed('smembers'):
+            return await cls.get_redis().smembers(key)
 
-    @staticmethod
-    async def remove(*keys) -> None:
+    @classmethod
+    async def remove(cls, *keys) -> None:
         """Removes the specified keys. A key is ignored if it does not exist"""
-        await main.app.state.redis.delete(*keys)
+        with _timed('delete'):
+            await cls.get_redis().delete(*keys)
+
+    @classmethod
+    async def publish(cls, channel: str, message: str) -> None:
+        """Posts a message to the given channel."""
+        with _timed('publish'):
+            await cls.get_redis().publish(channel, message)
+
+    @classmethod
+    async def subscribe(cls, *channels) -> PubSub:
+        """
+        Returns the pub/sub object subscribed to the given channels.
+        It has its own connection without the socket timeout,
+        so waiting for a message doesn't time out on an idle channel.
+        """
+        pool = ConnectionPool.from_url(
+            str(settings.REDIS_URL),
+            max_connections=1,
+            socket_keepalive=True,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL
+        )
+        pubsub: PubSub = Redis(connection_pool=pool).pubsub()
+        try:
+            await pubsub.subscribe(*channels)
+        except BaseException:
+            await pubsub.aclose()
+            raise
+
+        return pubsub
@@ -50,6 +50,106 @@ class ErrorCode:
 
 INVITE_EXPIRE_SECONDS: int = 60*60*24*7
 
+INVITE_BATCH_MAX_SIZE: int = 5000
+
+INVITE_BATCH_CHUNK_SIZE: int = 200
+
+SET_PASSWORD_EXPIRE_SECONDS: int = 60*60*24*7
+
+SMTP_TASK_MAX_RETRIES: int = 5
+
+###############################################################################
+# CACHE
+###############################################################################
+
+INVALIDATION_RECONNECT_SECONDS: int = 1
+
+PRINCIPAL_CACHE_MAXSIZE: int = 10000
+
+PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+
+PRINCIPAL_INVALIDATION_CHANNEL: str = 'invalidate:principal'
+
+JWT_CACHE_MAXSIZE: int = 10000
+
+PERMISSIONS_INVALIDATION_CHANNEL: str = 'invalidate:permissions'
+
+ENTITY_CACHE_MAXSIZE: int = 10000
+
+ENTITY_CACHE_LOCAL_TTL_SECONDS: int = 30
+
+ENTITY_CACHE_NEGATIVE_TTL_SECONDS: int = 10
+
+ENTITY_INVALIDATION_CHANNEL: str = 'invalidate:entity'
+
+ORGANIZATION_CACHE_TTL_SECONDS: int = 60*10
+
+DEPARTMENT_CACHE_TTL_SECONDS: int = 60*10
+
+ROLE_CACHE_TTL_SECONDS: int = 60*60
+
+EMPLOYEE_CACHE_TTL_SECONDS: int = 60
+
+###############################################################################
+# PAGINATION
+###############################################################################
+
+NEXT_CURSOR_HEADER: str = 'X-Next-Cursor'
+
+###############################################################################
+# MEETING
+###############################################################################
+
+MEETING_SLOTS_MAX_DAYS: int = 31
+
+MEETING_SLOTS_DEFAULT_LIMIT: int = 5
+
+MEETING_SLOTS_MAX_LIMIT: int = 50
+
+###############################################################################
+# LEADERBOARD
+###############################################################################
+
+SCORE_ROLLUP_NAME: str = 'score_daily'
+
+SCORE_ROLLUP_INTERVAL_SECONDS: int = 60*5
+
+SCORE_ROLLUP_LAG_SECONDS: int = 60
+
+SCORE_ROLLUP_RESCAN_IDS: int = 10000
+
+LEADERBOARD_DEFAULT_DAYS: int = 30
+
+LEADERBOARD_MAX_DAYS: int = 366
+
+LEADERBOARD_DEFAULT_LIMIT: int = 10
+
+LEADERBOARD_MAX_LIMIT: int = 100
+
+###############################################################################
+# SEARCH
+###############################################################################
+
+SEARCH_TS_CONFIG: str = 'simple'
+
+SEARCH_HEADLINE_OPTIONS: str = 'MaxFragments=2, MaxWords=30, MinWords=10'
+
+SEARCH_QUERY_MAX_LENGTH: int = 256
+
+SEARCH_DEFAULT_LIMIT: int = 20
+
+SEARCH_MAX_LIMIT: int = 100
+
+SEARCH_MAX_CANDIDATES: int = 5000
+
+###############################################################################
+# IMPORT
+###############################################################################
+
+EMPLOYEE_IMPORT_BATCH_SIZE: int = 1000
+
+EMPLOYEE_IMPORT_EMAIL_CHUNK_SIZE: int = 100
+
 ###############################################################################
 # SUPERUSER DATA
 ###############################################################################
@@ -63,3 +163,7 @@ SUPERUSER_PASSWORD: str = str(os.getenv('SUPERUSER_PASSWORD', 'Qwerty_123'))
 ###############################################################################
 
 INVITE_URL_PREFIX: str = 'api/v1/auth/signup'
+
+SET_PASSWORD_URL_PREFIX: str = 'api/v1/auth/set-password'
+
+SET_PASSWORD_KEY_PREFIX: str = 'set-password:'
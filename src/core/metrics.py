@@ -0,0 +1,76 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+
+###############################################################################
+# DATABASE
+###############################################################################
+
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    'db_pool_checkout_seconds',
+    'Time spent waiting for a connection from the pool'
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    'db_pool_checked_out',
+    'Connections currently checked out from the pool'
+)
+
+DB_POOL_SATURATION = Gauge(
+    'db_pool_saturation_ratio',
+    'Checked out connections to the pool capacity ratio'
+)
+
+###############################################################################
+# AUTH
+###############################################################################
+
+JWT_CACHE_HITS = Counter(
+    'jwt_cache_hits_total',
+    'Access tokens served from the verified payload cache'
+)
+
+JWT_CACHE_MISSES = Counter(
+    'jwt_cache_misses_total',
+    'Access tokens verified and decoded'
+)
+
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    'password_hash_queue_depth',
+    'Password hash operations waiting for or running on the pool'
+)
+
+PASSWORD_HASH_SECONDS = Histogram(
+    'password_hash_seconds',
+    'Password hash operation latency including the pool wait',
+    ['operation']
+)
+
+###############################################################################
+# CACHE
+###############################################################################
+
+REDIS_COMMAND_SECONDS = Histogram(
+    'redis_command_seconds',
+    'Redis command latency including the round trip',
+    ['command']
+)
+
+###############################################################################
+# MAIL
+###############################################################################
+
+SMTP_CONNECTIONS_OPENED = Counter(
+    'smtp_connections_opened_total',
+    'SMTP connections opened and logged in'
+)
+
+SMTP_MESSAGES_SENT = Counter(
+    'smtp_messages_total',
+    'Messages handed to the SMTP server',
+    ['status']
+)
+
+SMTP_SEND_SECONDS = Histogram(
+    'smtp_send_seconds',
+    'Latency of sending one message over an open session'
+)
@@ -0,0 +1,76 @@
+from datetime import date, datetime
+from typing import Any
+
+import msgpack
+import orjson
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+MSGPACK_MEDIA_TYPE: str = 'application/msgpack'
+
+
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+
+    raise TypeError(f'{type(obj).__name__} is not JSON serializable')
+
+
+def _msgpack_default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+
+    raise TypeError(f'{type(obj).__name__} is not MessagePack serializable')
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized by orjson.
+    Built Pydantic models are dumped without validation.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+class MsgPackResponse(Response):
+    """
+    MessagePack response.
+    Built Pydantic models are dumped without validation.
+    """
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, default=_msgpack_default)
+
+
+def negotiate_response(
+    request: Request,
+    content: Any,
+    status_code: int = 200
+) -> Response:
+    """
+    Returns MessagePack response if the client accepts it
+    and JSON response otherwise.
+    Returned response skips `response_model` validation,
+    so the content must be already built from trusted data.
+
+    Args:
+        - `request`: current request;
+        - `content`: models, DTOs or primitives to serialize;
+        - `status_code`: response status code (default 200).
+    """
+    if MSGPACK_MEDIA_TYPE in request.headers.get('accept', ''):
+        return MsgPackResponse(content, status_code)
+
+    return ORJSONResponse(content, status_code)
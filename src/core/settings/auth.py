@@ -8,6 +8,7 @@ class AuthConfig(BaseSettings):
     ACCESS_JWT_EXPIRE_MINUTES: int = 60*24*7
     REFRESH_JWT_EXPIRE_MINUTES: int = 60*24*30
     RESET_JWT_EXPIRE_MINUTES: int = 30
+    PASSWORD_HASH_WORKERS: int = 2
 
     model_config = SettingsConfigDict(
         env_file='.env',
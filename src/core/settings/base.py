@@ -7,12 +7,32 @@ class BaseConfig(BaseSettings):
     DATABASE_URL: PostgresDsn
     REDIS_URL: RedisDsn
 
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 60*30
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP: int = 5
+    DB_STATEMENT_CACHE_SIZE: int = 256
+    DB_QUERY_CACHE_SIZE: int = 500
+
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT: float = 5
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+    REDIS_COMPRESSION_THRESHOLD: int = 1024
+
     ADDRESS_URL: HttpUrl
 
     SMTP_USER: str
     SMTP_PASSWORD: str
     SMTP_HOST: str
     SMTP_PORT: int
+    SMTP_USE_SSL: bool = True
+    SMTP_POOL_SIZE: int = 2
+    SMTP_IDLE_TIMEOUT: float = 30
+    SMTP_TIMEOUT: float = 30
+
+    CELERY_METRICS_PORT: int = 9808
 
     model_config = SettingsConfigDict(
         env_file='.env',
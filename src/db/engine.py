@@ -1,6 +1,63 @@
-from sqlalchemy.ext.asyncio import create_async_engine
+import asyncio
+from time import perf_counter
 
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.core.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_SECONDS,
+    DB_POOL_SATURATION
+)
 from src.core.settings.base import settings
 
 
-engine = create_async_engine(str(settings.DATABASE_URL))
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that reports the connection checkout wait time."""
+
+    def _do_get(self):
+        start: float = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(perf_counter() - start)
+
+
+engine = create_async_engine(
+    str(settings.DATABASE_URL),
+    poolclass=InstrumentedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args={
+        'prepared_statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE
+    }
+)
+
+
+@event.listens_for(engine.sync_engine, 'checkout')
+@event.listens_for(engine.sync_engine, 'checkin')
+def _track_pool_usage(*args) -> None:
+    checked_out: int = engine.pool.checkedout()
+    capacity: int = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    DB_POOL_CHECKED_OUT.set(checked_out)
+    DB_POOL_SATURATION.set(checked_out / capacity)
+
+
+async def warm_up_pool(connections: int) -> None:
+    """
+    Opens the pool connections in advance
+    so the first requests don't pay for the connection setup.
+    """
+    async def ping() -> None:
+        connection: AsyncConnection
+        async with engine.connect() as connection:
+            await connection.execute(text('SELECT 1'))
+
+    await asyncio.gather(
+        *(ping() for _ in range(min(connections, settings.DB_POOL_SIZE)))
+    )
@@ -2,12 +2,17 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import HTTPException
+from sqlalchemy import event
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session
 
 from src.db.engine import engine
 
 
+HAS_WRITES_KEY: str = 'has_writes'
+
+
 LocalSession = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -15,6 +20,30 @@ LocalSession = async_sessionmaker(
 )
 
 
+@event.listens_for(Session, 'do_orm_execute')
+def _mark_statement_writes(orm_execute_state: ORMExecuteState) -> None:
+    """Marks the session transaction that executes DML statements."""
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info[HAS_WRITES_KEY] = True
+
+
+@event.listens_for(Session, 'before_flush')
+def _mark_flush_writes(session: Session, flush_context, instances) -> None:
+    """Marks the session transaction that flushes changed objects."""
+    if session.new or session.dirty or session.deleted:
+        session.info[HAS_WRITES_KEY] = True
+
+
+@event.listens_for(Session, 'after_commit')
+@event.listens_for(Session, 'after_rollback')
+def _reset_writes(session: Session) -> None:
+    session.info.pop(HAS_WRITES_KEY, None)
+
+
 @asynccontextmanager
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     session = LocalSession()
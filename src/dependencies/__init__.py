@@ -1,10 +1,17 @@
 from src.dependencies.auth import TokenDeps
-from src.dependencies.common import QueryParamDeps
-from src.dependencies.unit_of_work import UOWDep
+from src.dependencies.common import (
+    LeaderboardParamDeps,
+    QueryParamDeps,
+    SearchParamDeps
+)
+from src.dependencies.unit_of_work import UOWDep, UnitOfWorkRoute
 
 
 __all__ = [
     'TokenDeps',
+    'LeaderboardParamDeps',
     'QueryParamDeps',
+    'SearchParamDeps',
     'UOWDep',
+    'UnitOfWorkRoute',
 ]
@@ -1,7 +1,16 @@
 from typing import Annotated, Optional
 
-from fastapi import Depends
+from fastapi import Depends, Query
 
+from src.core.constants import (
+    LEADERBOARD_DEFAULT_DAYS,
+    LEADERBOARD_DEFAULT_LIMIT,
+    LEADERBOARD_MAX_DAYS,
+    LEADERBOARD_MAX_LIMIT,
+    SEARCH_DEFAULT_LIMIT,
+    SEARCH_MAX_LIMIT,
+    SEARCH_QUERY_MAX_LENGTH
+)
 from src.enums.sql import OrderEnum
 
 
@@ -9,7 +18,8 @@ async def query_params_get_list(
     offset: int = 0,
     limit: int = 5,
     sort_by: Optional[str] = None,
-    sort: Optional[str] = OrderEnum.ASCENDING.value
+    sort: Optional[str] = OrderEnum.ASCENDING.value,
+    cursor: Optional[str] = None
 ) -> dict:
     """
     Common query parameters to get a list of objects.
@@ -18,14 +28,59 @@ async def query_params_get_list(
         - `offset`: number of skip;
         - `limit`: limit the number of results;
         - `sort_by`: sort by field name;
-        - `sort`: ascending or descending.
+        - `sort`: ascending or descending;
+        - `cursor`: cursor of the next page from the previous response.
     """
     return {
         'offset': offset,
         'limit': limit,
         'order': sort,
-        'order_by_field': sort_by
+        'order_by_field': sort_by,
+        'cursor': cursor
     }
 
 
 QueryParamDeps: type[dict] = Annotated[dict, Depends(query_params_get_list)]
+
+
+async def query_params_leaderboard(
+    days: int = Query(LEADERBOARD_DEFAULT_DAYS, gt=0, le=LEADERBOARD_MAX_DAYS),
+    limit: int = Query(
+        LEADERBOARD_DEFAULT_LIMIT,
+        gt=0,
+        le=LEADERBOARD_MAX_LIMIT
+    )
+) -> dict:
+    """
+    Query parameters of the leaderboard.
+
+    Args:
+        - `days`: length of the window in days;
+        - `limit`: number of employees.
+    """
+    return {'days': days, 'limit': limit}
+
+
+LeaderboardParamDeps: type[dict] = Annotated[
+    dict,
+    Depends(query_params_leaderboard)
+]
+
+
+async def query_params_search(
+    q: str = Query(min_length=1, max_length=SEARCH_QUERY_MAX_LENGTH),
+    limit: int = Query(SEARCH_DEFAULT_LIMIT, gt=0, le=SEARCH_MAX_LIMIT),
+    cursor: Optional[str] = None
+) -> dict:
+    """
+    Query parameters of the full-text search.
+
+    Args:
+        - `q`: web search query;
+        - `limit`: limit the number of results;
+        - `cursor`: cursor of the next page from the previous response.
+    """
+    return {'query': q, 'limit': limit, 'cursor': cursor}
+
+
+SearchParamDeps: type[dict] = Annotated[dict, Depends(query_params_search)]
@@ -1,6 +1,7 @@
-from typing import Any, Annotated, Generator
+from typing import Any, Annotated, AsyncGenerator, Callable, Generator
 
-from fastapi import Depends
+from fastapi import Depends, Request, Response
+from fastapi.routing import APIRoute
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.sessions import LocalSession
@@ -12,4 +13,37 @@ def get_uow() -> Generator[AsyncSession, Any, Any]:
     yield UnitOfWork(LocalSession)
 
 
-UOWDep: type[UnitOfWork] = Annotated[UnitOfWork, Depends(get_uow)]
+async def get_request_uow(
+    request: Request
+) -> AsyncGenerator[UnitOfWork, None]:
+    """
+    Generates Unit Of Work with one session and transaction per request.
+    Services entering it reuse the request transaction.
+    """
+    uow = UnitOfWork(LocalSession)
+    async with uow:
+        request.state.uow = uow
+        yield uow
+
+
+class UnitOfWorkRoute(APIRoute):
+    """
+    Route that commits the request Unit Of Work
+    once the endpoint has returned and before the response is sent.
+    """
+
+    def get_route_handler(self) -> Callable:
+        route_handler: Callable = super().get_route_handler()
+
+        async def handler(request: Request) -> Response:
+            response: Response = await route_handler(request)
+            uow: UnitOfWork = getattr(request.state, 'uow', None)
+            if uow:
+                await uow.commit()
+
+            return response
+
+        return handler
+
+
+UOWDep: type[UnitOfWork] = Annotated[UnitOfWork, Depends(get_request_uow)]
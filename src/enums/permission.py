@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Iterable
 
 
 class PermissionEnum(str, Enum):
@@ -23,3 +24,24 @@ CONTRIBUTOR_PERMISSIONS: tuple[PermissionEnum] = (
     PermissionEnum.EDIT,
     PermissionEnum.READ,
 )
+
+
+PERMISSION_BITS: dict[PermissionEnum, int] = {
+    permission: 1 << index
+    for index, permission in enumerate(PermissionEnum)
+}
+
+
+def to_bitmask(permissions: Iterable[str]) -> int:
+    """Compiles permission names into a bitmask of `PermissionEnum`."""
+    mask: int = 0
+    for permission in permissions:
+        mask |= PERMISSION_BITS.get(permission, 0)
+
+    return mask
+
+
+MANAGER_PERMISSIONS_MASK: int = to_bitmask(MANAGER_PERMISSIONS)
+
+
+CONTRIBUTOR_PERMISSIONS_MASK: int = to_bitmask(CONTRIBUTOR_PERMISSIONS)
@@ -18,3 +18,8 @@ class AuthorizationError(PermissionDenied):
 class InvationCodeError(BadRequest):
 
     DETAIL = 'Unknown invitation code'
+
+
+class SetPasswordCodeError(BadRequest):
+
+    DETAIL = 'Unknown set password code'
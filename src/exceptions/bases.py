@@ -51,6 +51,18 @@ class NotFound(BaseHTTPException):
     STATUS_CODE = status.HTTP_404_NOT_FOUND
 
 
+class UnsupportedMediaType(BaseHTTPException):
+
+    STATUS_CODE = status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+    DETAIL = 'Unsupported media type'
+
+
+class UnprocessableEntity(BaseHTTPException):
+
+    STATUS_CODE = status.HTTP_422_UNPROCESSABLE_ENTITY
+    DETAIL = 'Unprocessable entity'
+
+
 class ConflictError(BaseHTTPException):
 
     STATUS_CODE = status.HTTP_409_CONFLICT
@@ -1,6 +1,25 @@
-from src.exceptions.bases import BadRequest
+from src.exceptions.bases import (
+    BadRequest,
+    UnprocessableEntity,
+    UnsupportedMediaType
+)
 
 
 class InvalidData(BadRequest):
 
     DETAIL = 'Invalid data'
+
+
+class InvalidCursor(BadRequest):
+
+    DETAIL = 'Invalid pagination cursor'
+
+
+class InvalidSortField(UnprocessableEntity):
+
+    DETAIL = 'Invalid sort field'
+
+
+class UnsupportedImportFormat(UnsupportedMediaType):
+
+    DETAIL = 'Only text/csv and application/x-ndjson uploads are supported'
@@ -1,29 +1,76 @@
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 from typing import Generator
 
 from fastapi import FastAPI
+from prometheus_client import make_asgi_app
+from sqlalchemy.exc import SQLAlchemyError
 
 from src.api.v1.routers import api_v1_router
+from src.cache import invalidation
+from src.cache.permissions import permission_registry
 from src.cache.redis import RedisClient
 from src.core.constants import TITLE_APP, DESCRIPTION_APP
+from src.core.responses import ORJSONResponse
+from src.core.settings.base import settings
+from src.db.engine import engine, warm_up_pool
+from src.dependencies.unit_of_work import get_uow
+from src.services import RolePermissionService
+
+
+logger = logging.getLogger(__name__)
+
+
+async def load_permission_registry() -> None:
+    """
+    Compiles the role permissions registry.
+    If the database isn't ready yet, it's compiled on first access.
+    """
+    try:
+        permission_registry.compile(
+            await RolePermissionService.get_bindings(next(get_uow()))
+        )
+    except (SQLAlchemyError, OSError):
+        logger.warning('Permission registry will be loaded on first access')
+
+
+async def prepare_database() -> None:
+    """Warms up the connection pool and loads static data."""
+    try:
+        await warm_up_pool(settings.DB_POOL_WARMUP)
+    except (SQLAlchemyError, OSError):
+        logger.warning('Database is unavailable, pool warm-up is skipped')
+        return
+
+    await load_permission_registry()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> Generator:
-    """Lifespan for redis client."""
-    app.state.redis = await RedisClient.init_redis()
+    """
+    Lifespan for redis client, cache invalidation listener,
+    database connection pool and role permissions registry.
+    """
+    await RedisClient.init_redis()
+    listener: asyncio.Task = asyncio.create_task(invalidation.listen())
+    await prepare_database()
     yield
-    await app.state.redis.close()
+    listener.cancel()
+    await RedisClient.close()
+    await engine.dispose()
 
 
 def create_app() -> FastAPI:
     app = FastAPI(
         title=TITLE_APP,
         description=DESCRIPTION_APP,
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse
     )
 
     app.include_router(api_v1_router)
+    app.mount('/metrics', make_asgi_app())
 
     return app
 
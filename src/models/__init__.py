@@ -8,7 +8,10 @@ from src.models.organization import Organization
 from src.models.permission import Permission
 from src.models.role import Role
 from src.models.role_permission import RolePermission
+from src.models.rollup_checkpoint import RollupCheckpoint
 from src.models.score import Score
+from src.models.score_daily import ScoreDaily
+from src.models.score_summary import ScoreSummary
 from src.models.task import Task
 from src.models.user import User
 
@@ -24,7 +27,10 @@ __all__ = [
     'Permission',
     'Role',
     'RolePermission',
+    'RollupCheckpoint',
     'Score',
+    'ScoreDaily',
+    'ScoreSummary',
     'Task',
     'User',
 ]
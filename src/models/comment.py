@@ -1,17 +1,39 @@
-from sqlalchemy import ForeignKey
+from sqlalchemy import Computed, ForeignKey, Index, RowMapping
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.api.v1.schemas.response.comment import CommentResponseSchema
+from src.core.constants import SEARCH_TS_CONFIG
 from src.models.bases import Base
+from src.models.mixins.organizations import RefOrganizationMixin
 from src.models.mixins.task import RefTaskMixin
 
 
-class Comment(RefTaskMixin, Base):
+class Comment(RefTaskMixin, RefOrganizationMixin, Base):
 
     __tablename__ = 'comment'
+    __table_args__ = (
+        Index('ix_comment_task_id_id', 'task_id', 'id'),
+        Index(
+            'ix_comment_organization_id_search_vector',
+            'organization_id',
+            'search_vector',
+            postgresql_using='gin'
+        ),
+    )
+
+    response_columns = tuple(CommentResponseSchema.model_fields)
 
     created_by: Mapped[int] = mapped_column(ForeignKey('employee.id'))
     content: Mapped[str]
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"to_tsvector('{SEARCH_TS_CONFIG}', content)",
+            persisted=True
+        ),
+        deferred=True
+    )
 
     def to_pydantic_schema(self) -> CommentResponseSchema:
         return CommentResponseSchema(
@@ -22,3 +44,8 @@ class Comment(RefTaskMixin, Base):
             created_at=self.created_at,
             updated_at=self.updated_at
         )
+
+    @staticmethod
+    def row_to_pydantic_schema(row: RowMapping) -> CommentResponseSchema:
+        """Builds the schema from a database row without validation."""
+        return CommentResponseSchema.model_construct(**row)
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, relationship
 
 from src.api.v1.schemas.response.department import DepartmentResponseSchema
@@ -15,11 +16,14 @@ if TYPE_CHECKING:
 class Department(RefUserMixin, GenericFieldsMixin, RefOrganizationMixin, Base):
 
     __tablename__ = 'department'
+    __table_args__ = (
+        Index('ix_department_organization_id_id', 'organization_id', 'id'),
+    )
     _organization_back_populates = 'departments'
 
     employees: Mapped[list['Employee']] = relationship(
         back_populates='department',
-        lazy='selectin'
+        lazy='raise'
     )
 
     def to_pydantic_schema(
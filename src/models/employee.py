@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Index, RowMapping, text
 from sqlalchemy.orm import Mapped, relationship
 
 from src.api.v1.schemas.response.employee import EmployeeResponseSchema
@@ -13,14 +14,26 @@ if TYPE_CHECKING:
 class Employee(GenericUDORMixin, Base):
 
     __tablename__ = 'employee'
+    __table_args__ = (
+        Index('ix_employee_user_id', 'user_id'),
+        Index('ix_employee_organization_id_id', 'organization_id', 'id'),
+        Index(
+            'ix_employee_department_id_id',
+            'department_id',
+            'id',
+            postgresql_where=text('department_id IS NOT NULL')
+        ),
+    )
     _organization_back_populates = 'employees'
     _department_back_populates = 'employees'
     _department_id_nullable = True
 
+    response_columns = tuple(EmployeeResponseSchema.model_fields)
+
     meetings: Mapped[list['Meeting']] = relationship(
         secondary='employee_meeting',
         back_populates='employees',
-        lazy='selectin'
+        lazy='raise'
     )
 
     def to_pydantic_schema(self) -> EmployeeResponseSchema:
@@ -33,3 +46,8 @@ class Employee(GenericUDORMixin, Base):
             created_at=self.created_at,
             updated_at=self.updated_at
         )
+
+    @staticmethod
+    def row_to_pydantic_schema(row: RowMapping) -> EmployeeResponseSchema:
+        """Builds the schema from a database row without validation."""
+        return EmployeeResponseSchema.model_construct(**row)
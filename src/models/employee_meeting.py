@@ -8,7 +8,11 @@ class Employee_Meeting(Base):
 
     __tablename__ = 'employee_meeting'
 
-    employee_id: Mapped[int] = mapped_column(ForeignKey('employee.id'))
+    employee_id: Mapped[int] = mapped_column(
+        ForeignKey('employee.id'),
+        index=True
+    )
     meeting_id: Mapped[int] = mapped_column(
-        ForeignKey('meeting.id', ondelete='CASCADE')
+        ForeignKey('meeting.id', ondelete='CASCADE'),
+        index=True
     )
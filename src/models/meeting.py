@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy import DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.api.v1.schemas.response.meeting import MeetingResponseSchema
@@ -23,7 +23,7 @@ class Meeting(Base):
     employees: Mapped[list['Employee']] = relationship(
         secondary='employee_meeting',
         back_populates='meetings',
-        lazy='selectin'
+        lazy='raise'
     )
 
     def to_pydantic_schema(self) -> MeetingResponseSchema:
@@ -40,3 +40,10 @@ class Meeting(Base):
                 for emp in self.employees
             ]
         )
+
+
+Index(
+    'ix_meeting_period',
+    func.tstzrange(Meeting.start_at, Meeting.end_at),
+    postgresql_using='gist'
+)
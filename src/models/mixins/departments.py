@@ -14,7 +14,7 @@ class RefDepartmentMixin:
         - `department_id`: Foreign Key to Department id
         that can be nullable (default -- False);
         - `department`: relationship to Department table
-        with back populates (default -- None) and lazy select IN loading.
+        with back populates (default -- None) that raises on lazy load.
     """
 
     _department_back_populates: Optional[str] = None
@@ -32,5 +32,5 @@ class RefDepartmentMixin:
         return relationship(
             Department,
             back_populates=cls._department_back_populates,
-            lazy='selectin'
+            lazy='raise'
         )
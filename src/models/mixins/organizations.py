@@ -13,7 +13,7 @@ class RefOrganizationMixin:
 
         - `organization_id`: Foreign Key to Organization id;
         - `organization`: relationship to Organization table
-        with back populates (default -- None) and lazy select IN loading.
+        with back populates (default -- None) that raises on lazy load.
     """
 
     _organization_back_populates: Optional[str] = None
@@ -27,5 +27,5 @@ class RefOrganizationMixin:
         return relationship(
             Organization,
             back_populates=cls._organization_back_populates,
-            lazy='selectin'
+            lazy='raise'
         )
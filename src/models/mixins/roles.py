@@ -29,5 +29,5 @@ class RefRoleMixin:
         return relationship(
             Role,
             back_populates=cls._role_back_populates,
-            lazy='joined'
+            lazy='raise'
         )
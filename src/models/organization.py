@@ -18,11 +18,11 @@ class Organization(RefUserMixin, GenericFieldsMixin, Base):
 
     employees: Mapped[list['Employee']] = relationship(
         back_populates='organization',
-        lazy='selectin'
+        lazy='raise'
     )
     departments: Mapped[list['Department']] = relationship(
         back_populates='organization',
-        lazy='selectin'
+        lazy='raise'
     )
 
     def to_pydantic_schema(self) -> OrganizationResponseSchema:
@@ -16,5 +16,5 @@ class Permission(GenericFieldsMixin, Base):
     roles: Mapped[list['Role']] = relationship(
         secondary='role_permission',
         back_populates='permissions',
-        lazy='selectin'
+        lazy='raise'
     )
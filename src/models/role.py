@@ -16,5 +16,5 @@ class Role(GenericFieldsMixin, Base):
     permissions: Mapped[list['Permission']] = relationship(
         secondary='role_permission',
         back_populates='roles',
-        lazy='selectin'
+        lazy='raise'
     )
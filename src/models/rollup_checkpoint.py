@@ -0,0 +1,11 @@
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.bases import Base
+
+
+class RollupCheckpoint(Base):
+
+    __tablename__ = 'rollup_checkpoint'
+
+    name: Mapped[str] = mapped_column(unique=True)
+    last_id: Mapped[int] = mapped_column(default=0)
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.api.v1.schemas.response.score import ScoreResponseSchema
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
 class Score(RefTaskMixin, Base):
 
     __tablename__ = 'score'
+    __table_args__ = (Index('ix_score_employee_id_id', 'employee_id', 'id'), )
     _task_is_unique = True
 
     employee_id: Mapped[int] = mapped_column(ForeignKey('employee.id'))
@@ -23,7 +24,7 @@ class Score(RefTaskMixin, Base):
 
     task: Mapped['Task'] = relationship(
         back_populates='score',
-        lazy='selectin'
+        lazy='raise'
     )
 
     def to_pydantic_data(self) -> ScoreResponseSchema:
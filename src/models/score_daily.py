@@ -0,0 +1,28 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.bases import Base
+
+
+class ScoreDaily(Base):
+
+    __tablename__ = 'score_daily'
+    __table_args__ = (
+        UniqueConstraint('employee_id', 'day'),
+        Index('ix_score_daily_organization_id_day', 'organization_id', 'day'),
+        Index('ix_score_daily_department_id_day', 'department_id', 'day'),
+    )
+
+    employee_id: Mapped[int] = mapped_column(
+        ForeignKey('employee.id', ondelete='CASCADE')
+    )
+    organization_id: Mapped[int]
+    department_id: Mapped[Optional[int]]
+    day: Mapped[date]
+    scores_count: Mapped[int] = mapped_column(default=0)
+    in_time_sum: Mapped[int] = mapped_column(default=0)
+    integrity_sum: Mapped[int] = mapped_column(default=0)
+    quality_sum: Mapped[int] = mapped_column(default=0)
@@ -0,0 +1,27 @@
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.bases import Base
+
+
+class ScoreSummary(Base):
+
+    __tablename__ = 'score_summary'
+
+    employee_id: Mapped[int] = mapped_column(
+        ForeignKey('employee.id', ondelete='CASCADE'),
+        unique=True
+    )
+    scores_count: Mapped[int] = mapped_column(default=0)
+    in_time_sum: Mapped[int] = mapped_column(default=0)
+    integrity_sum: Mapped[int] = mapped_column(default=0)
+    quality_sum: Mapped[int] = mapped_column(default=0)
+
+    @property
+    def average_score(self) -> float:
+        """Average sum of the score dimensions per task."""
+        if not self.scores_count:
+            return 0.0
+
+        total: int = self.in_time_sum + self.integrity_sum + self.quality_sum
+        return total / self.scores_count
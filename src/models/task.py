@@ -1,38 +1,64 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, RowMapping
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.api.v1.schemas.response.task import TaskResponseSchema
+from src.core.constants import SEARCH_TS_CONFIG
 from src.enums.status import STATUS_STATES
 from src.models.bases import Base
 from src.models.mixins.common import GenericFieldsMixin
+from src.models.mixins.organizations import RefOrganizationMixin
 
 if TYPE_CHECKING:
     from src.models.employee import Employee
     from src.models.score import Score
 
 
-class Task(GenericFieldsMixin, Base):
+class Task(GenericFieldsMixin, RefOrganizationMixin, Base):
 
     __tablename__ = 'task'
+    __table_args__ = (
+        Index('ix_task_assignee_id', 'assignee', 'id'),
+        Index('ix_task_created_by_id', 'created_by', 'id'),
+        Index(
+            'ix_task_organization_id_search_vector',
+            'organization_id',
+            'search_vector',
+            postgresql_using='gin'
+        ),
+    )
     _name_unique = False
 
+    response_columns = tuple(TaskResponseSchema.model_fields)
+
     created_by: Mapped[int] = mapped_column(ForeignKey('employee.id'))
     assignee: Mapped[int] = mapped_column(ForeignKey('employee.id'))
     status: Mapped[int]
     deadline: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_TS_CONFIG}', "
+            "coalesce(name, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_TS_CONFIG}', "
+            "coalesce(description, '')), 'B')",
+            persisted=True
+        ),
+        deferred=True
+    )
 
     author: Mapped['Employee'] = relationship(
         foreign_keys='Task.created_by',
-        lazy='selectin'
+        lazy='raise'
     )
     performer: Mapped['Employee'] = relationship(
         foreign_keys='Task.assignee',
-        lazy='selectin'
+        lazy='raise'
     )
-    score: Mapped['Score'] = relationship(back_populates='task', lazy='joined')
+    score: Mapped['Score'] = relationship(back_populates='task', lazy='raise')
 
     def to_pydantic_schema(self) -> TaskResponseSchema:
         status: str = STATUS_STATES.get(self.status).name.title()
@@ -47,3 +73,9 @@ class Task(GenericFieldsMixin, Base):
             updated_at=self.updated_at,
             deadline=self.deadline
         )
+
+    @staticmethod
+    def row_to_pydantic_schema(row: RowMapping) -> TaskResponseSchema:
+        """Builds the schema from a database row without validation."""
+        status: str = STATUS_STATES.get(row['status']).name.title()
+        return TaskResponseSchema.model_construct(**{**row, 'status': status})
@@ -1,16 +1,25 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import TypeVar, Optional
 
 from sqlalchemy import (
+    RowMapping,
+    Select,
     delete as sql_delete,
-    select,
     update as sql_update
 )
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 
 from src.enums.sql import OrderEnum
 from src.exceptions.db import ObjectNotFound
+from src.exceptions.request import InvalidCursor, InvalidSortField
 from src.models.bases import Base
+from src.repositories import statements
+from src.utils.pagination import decode_cursor, encode_cursor
 
 
 SQLModelType = TypeVar('SQLModelType', bound=Base)
@@ -21,24 +30,43 @@ class AbstractBaseRepository(ABC):
     _model = None
 
     @abstractmethod
-    async def get(self, pk: int):
-        """Returns an object from the database by ID."""
+    async def get(self, pk: int, profile: Optional[str] = None):
+        """
+        Returns an object from the database by ID.
+
+        Args:
+            - `pk`: object ID;
+            Optional:
+            - `profile`: name of the relationships loader profile.
+        """
         raise NotImplementedError
 
     @abstractmethod
-    async def get_by_filters(self, **filters):
+    async def get_by_filters(
+        self,
+        *,
+        profile: Optional[str] = None,
+        **filters
+    ):
         """Returns an object from the database by filters."""
         raise NotImplementedError
 
     @abstractmethod
-    async def get_by_field_contains(self, field: str, values: list):
+    async def get_by_field_contains(
+        self,
+        field: str,
+        values: list,
+        profile: Optional[str] = None
+    ):
         """
         Returns a list of objects from the database
         by fieled contains values.
 
         Args:
             - `field`: model attribute;
-            - `values`: list of values to select.
+            - `values`: list of values to select;
+            Optional:
+            - `profile`: name of the relationships loader profile.
         """
         raise NotImplementedError
 
@@ -49,7 +77,8 @@ class AbstractBaseRepository(ABC):
         offset: int = 0,
         limit: int = 100,
         order_by_field: Optional[str] = None,
-        order: OrderEnum = OrderEnum.ASCENDING
+        order: OrderEnum = OrderEnum.ASCENDING,
+        profile: Optional[str] = None
     ):
         """
         Returns a list of objects from the database.
@@ -61,7 +90,64 @@ class AbstractBaseRepository(ABC):
             - `offset`: number of skip rows;
             - `limit`: number of rows;
             - `order_by_field`: order by field;
-            - `order`: ascending or descending.
+            - `order`: ascending or descending;
+            - `profile`: name of the relationships loader profile.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_page(
+        self,
+        filters: Optional[dict] = None,
+        offset: int = 0,
+        limit: int = 100,
+        order_by_field: Optional[str] = None,
+        order: OrderEnum = OrderEnum.ASCENDING,
+        cursor: Optional[str] = None,
+        profile: Optional[str] = None
+    ):
+        """
+        Returns a page of objects from the database
+        and the cursor of the next page.
+
+        Args:
+            Optional:
+            - `filters`: dict of the form
+            {field_name: field_value} to filter by;
+            - `offset`: number of skip rows, ignored with the cursor;
+            - `limit`: number of rows;
+            - `order_by_field`: order by field;
+            - `order`: ascending or descending;
+            - `cursor`: cursor of the page returned earlier;
+            - `profile`: name of the relationships loader profile.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_rows_page(
+        self,
+        columns: tuple[str, ...],
+        filters: Optional[dict] = None,
+        offset: int = 0,
+        limit: int = 100,
+        order_by_field: Optional[str] = None,
+        order: OrderEnum = OrderEnum.ASCENDING,
+        cursor: Optional[str] = None
+    ):
+        """
+        Returns a page of rows with the specified columns
+        and the cursor of the next page.
+
+        Args:
+            - `columns`: names of the columns to select;
+            Optional:
+            - `filters`: dict of the form
+            {field_name: field_value} to filter by;
+            - `offset`: number of skip rows, ignored with the cursor;
+            - `limit`: number of rows;
+            - `order_by_field`: order by field;
+            - `order`: ascending or descending;
+            - `cursor`: cursor of the page returned earlier.
         """
         raise NotImplementedError
 
@@ -70,6 +156,24 @@ class AbstractBaseRepository(ABC):
         """Creates a new object in the database."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def create_missing(
+        self,
+        rows: list[dict],
+        index_elements: Optional[tuple[str, ...]] = None
+    ):
+        """
+        Inserts the rows that do not conflict with existing ones
+        and returns the created objects.
+
+        Args:
+            - `rows`: list of dicts with data to create;
+            Optional:
+            - `index_elements`: unique columns to check for conflicts,
+            all unique constraints are checked by default.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def update(self, pk: int, data: dict):
         """
@@ -87,31 +191,95 @@ class AbstractBaseRepository(ABC):
         raise NotImplementedError
 
 
+def _split_filters(
+    filters: dict
+) -> tuple[tuple[str, ...], tuple[str, ...], dict]:
+    """
+    Splits filters into the statement shape and parameters.
+
+    Returns:
+        - sorted keys compared by equality;
+        - sorted keys compared with NULL;
+        - statement parameters.
+    """
+    keys: list[str] = []
+    null_keys: list[str] = []
+    for key in sorted(filters):
+        if filters[key] is None:
+            null_keys.append(key)
+        else:
+            keys.append(key)
+
+    params: dict = {key: filters[key] for key in keys}
+    return tuple(keys), tuple(null_keys), params
+
+
 class SQLAlchemyRepository(AbstractBaseRepository):
+    """
+    Reads use prebuilt statements of the `statements` module
+    and refresh objects already present in the session
+    so that a request-scoped session sees its own writes.
+
+    Relationships raise on lazy load. Reads take the name
+    of a loader profile from `_loader_profiles` that eager loads
+    exactly the relationships the caller needs.
+    """
 
     _model: type[SQLModelType]
+    _cursor_fields: tuple[str, ...] = ('id', 'created_at')
+    _loader_profiles: dict[str, tuple] = {}
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    async def get(self, pk: int) -> Optional[SQLModelType]:
-        stmt = select(self._model).where(self._model.id == pk)
-        response = await self._session.execute(stmt)
+    def _options(self, profile: Optional[str]) -> tuple:
+        """Returns the loader options of the profile."""
+        if not profile:
+            return ()
+
+        return self._loader_profiles[profile]
+
+    async def get(
+        self,
+        pk: int,
+        profile: Optional[str] = None
+    ) -> Optional[SQLModelType]:
+        stmt = statements.select_by(
+            self._model,
+            ('id', ),
+            options=self._options(profile)
+        )
+        response = await self._session.execute(stmt, {'id': pk})
         return response.scalar_one_or_none()
 
-    async def get_by_filters(self, **filters) -> Optional[SQLModelType]:
-        stmt = select(self._model).filter_by(**filters)
-        response = await self._session.execute(stmt)
+    async def get_by_filters(
+        self,
+        *,
+        profile: Optional[str] = None,
+        **filters
+    ) -> Optional[SQLModelType]:
+        keys, null_keys, params = _split_filters(filters)
+        stmt = statements.select_by(
+            self._model,
+            keys,
+            null_keys,
+            self._options(profile)
+        )
+        response = await self._session.execute(stmt, params)
         return response.scalar_one_or_none()
 
     async def get_by_field_contains(
         self,
         field: str,
-        values: list
+        values: list,
+        profile: Optional[str] = None
     ) -> list[SQLModelType]:
-        stmt = select(self._model)
-        stmt = stmt.where(getattr(self._model, field).in_(values))
-        response = await self._session.execute(stmt)
+        stmt = statements.select_in(
+            self._model,
+            field,
+            self._options(profile)
+        )
+        response = await self._session.execute(stmt, {'values': values})
         return response.scalars().all()
 
     async def get_all(
@@ -120,33 +288,261 @@ class SQLAlchemyRepository(AbstractBaseRepository):
         offset: int = 0,
         limit: int = 10,
         order_by_field: Optional[str] = None,
-        order: OrderEnum = OrderEnum.ASCENDING
+        order: OrderEnum = OrderEnum.ASCENDING,
+        profile: Optional[str] = None
     ) -> list[SQLModelType]:
-        stmt = select(self._model)
-        if filters:
-            stmt = stmt.filter_by(**filters)
-
-        stmt = stmt.offset(offset).limit(limit)
+        keys, null_keys, params = _split_filters(filters or {})
+        if (
+            not order_by_field
+            or order_by_field not in statements.column_names(self._model)
+        ):
+            order_by_field = 'id'
+
+        stmt = statements.select_page(
+            self._model,
+            keys,
+            null_keys,
+            order_by_field,
+            order,
+            self._options(profile)
+        )
+        params.update(offset=offset, limit=limit)
+        response = await self._session.execute(stmt, params)
+        return response.scalars().all()
 
-        columns = self._model.__table__.columns
-        if not order_by_field or order_by_field not in columns:
-            order_by_field = self._model.id
+    async def get_page(
+        self,
+        filters: Optional[dict] = None,
+        offset: int = 0,
+        limit: int = 10,
+        order_by_field: Optional[str] = None,
+        order: OrderEnum = OrderEnum.ASCENDING,
+        cursor: Optional[str] = None,
+        profile: Optional[str] = None
+    ) -> tuple[list[SQLModelType], Optional[str]]:
+        """
+        Sorting is restricted to `_cursor_fields`
+        so that every page is read from an index.
+        """
+        order_by_field = self._sort_field(order_by_field)
+
+        stmt, params = self._page_statement(
+            filters,
+            offset,
+            limit,
+            order_by_field,
+            order,
+            cursor,
+            options=self._options(profile)
+        )
+        response = await self._session.execute(stmt, params)
+        objs: list[SQLModelType] = response.scalars().all()
+
+        next_cursor: Optional[str] = None
+        if objs and len(objs) == limit:
+            last: SQLModelType = objs[-1]
+            next_cursor = encode_cursor(
+                order_by_field,
+                order,
+                getattr(last, order_by_field),
+                last.id
+            )
+
+        return objs, next_cursor
+
+    async def get_rows_page(
+        self,
+        columns: tuple[str, ...],
+        filters: Optional[dict] = None,
+        offset: int = 0,
+        limit: int = 10,
+        order_by_field: Optional[str] = None,
+        order: OrderEnum = OrderEnum.ASCENDING,
+        cursor: Optional[str] = None
+    ) -> tuple[list[RowMapping], Optional[str]]:
+        """
+        Same as `get_page` but selects only the `columns`
+        and returns row mappings without ORM objects hydration.
+        """
+        order_by_field = self._sort_field(order_by_field)
+
+        columns = tuple(dict.fromkeys((*columns, order_by_field, 'id')))
+        stmt, params = self._page_statement(
+            filters,
+            offset,
+            limit,
+            order_by_field,
+            order,
+            cursor,
+            columns=columns
+        )
+        response = await self._session.execute(stmt, params)
+        rows: list[RowMapping] = response.mappings().all()
+
+        next_cursor: Optional[str] = None
+        if rows and len(rows) == limit:
+            last: RowMapping = rows[-1]
+            next_cursor = encode_cursor(
+                order_by_field,
+                order,
+                last[order_by_field],
+                last['id']
+            )
+
+        return rows, next_cursor
+
+    def _sort_field(self, order_by_field: Optional[str]) -> str:
+        """
+        Returns the field to sort the page by, `id` by default.
+        Raises `InvalidSortField` listing `_cursor_fields`
+        for any other field.
+        """
+        if not order_by_field:
+            return 'id'
+
+        if order_by_field not in self._cursor_fields:
+            error_info: dict = {
+                'reason': 'Invalid sort field',
+                'description': (
+                    f'Sorting by {order_by_field!r} is not supported, '
+                    'allowed fields: ' + ', '.join(self._cursor_fields)
+                )
+            }
+            raise InvalidSortField(extra_msg=error_info)
+
+        return order_by_field
+
+    def _page_statement(
+        self,
+        filters: Optional[dict],
+        offset: int,
+        limit: int,
+        order_by_field: str,
+        order: OrderEnum,
+        cursor: Optional[str],
+        options: tuple = (),
+        columns: tuple[str, ...] = ()
+    ) -> tuple[Select, dict]:
+        """Returns the page statement with its parameters."""
+        keys, null_keys, params = _split_filters(filters or {})
+        if cursor:
+            stmt: Select = statements.select_after(
+                self._model,
+                keys,
+                null_keys,
+                order_by_field,
+                order,
+                options,
+                columns
+            )
+            params.update(
+                self._read_cursor(cursor, order_by_field, order),
+                limit=limit
+            )
         else:
-            order_by_field = getattr(self._model, order_by_field)
+            stmt: Select = statements.select_page(
+                self._model,
+                keys,
+                null_keys,
+                order_by_field,
+                order,
+                options,
+                columns
+            )
+            params.update(offset=offset, limit=limit)
+
+        return stmt, params
+
+    def _read_cursor(
+        self,
+        cursor: str,
+        order_by_field: str,
+        order: OrderEnum
+    ) -> dict:
+        """
+        Returns the cursor position parameters.
+        The cursor must be issued for the same sorting.
+        """
+        values: list = decode_cursor(cursor)
+        if len(values) != 4 or values[:2] != [order_by_field, order]:
+            raise InvalidCursor()
 
-        if order == OrderEnum.ASCENDING:
-            stmt = stmt.order_by(order_by_field.asc())
-        else:
-            stmt = stmt.order_by(order_by_field.desc())
+        value, pk = values[2:]
+        if not isinstance(pk, int):
+            raise InvalidCursor()
 
-        response = await self._session.execute(stmt)
-        return response.scalars().all()
+        column = getattr(self._model, order_by_field)
+        if column.type.python_type is datetime:
+            try:
+                value = datetime.fromisoformat(value)
+            except (TypeError, ValueError):
+                raise InvalidCursor()
+
+        return {'cursor_value': value, 'cursor_id': pk}
+
+    def to_cache(self, obj: SQLModelType) -> dict:
+        """
+        Returns the object column values to cache.
+        Datetime values are stored in ISO 8601 format.
+        """
+        data: dict = {
+            name: getattr(obj, name)
+            for name in statements.column_names(self._model)
+        }
+        for name in statements.datetime_column_names(self._model):
+            if data[name] is not None:
+                data[name] = data[name].isoformat()
+
+        return data
+
+    def from_cache(self, data: dict) -> SQLModelType:
+        """
+        Returns the persistent object of the session
+        built from the cached column values without a query.
+        The object already present in the session is returned as is.
+        """
+        key: tuple = identity_key(self._model, data['id'])
+        obj: Optional[SQLModelType] = self._session.identity_map.get(key)
+        if obj is not None:
+            return obj
+
+        obj = self._model.__mapper__.class_manager.new_instance()
+        datetime_names: frozenset = (
+            statements.datetime_column_names(self._model)
+        )
+        for name in statements.column_names(self._model):
+            value = data.get(name)
+            if value is not None and name in datetime_names:
+                value = datetime.fromisoformat(value)
+
+            set_committed_value(obj, name, value)
+
+        make_transient_to_detached(obj)
+        self._session.add(obj)
+        return obj
 
     async def create(self, data: dict) -> SQLModelType:
         db_obj = self._model(**data)
         self._session.add(db_obj)
         return db_obj
 
+    async def create_missing(
+        self,
+        rows: list[dict],
+        index_elements: Optional[tuple[str, ...]] = None
+    ) -> list[SQLModelType]:
+        if not rows:
+            return []
+
+        stmt = (
+            pg_insert(self._model)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=index_elements)
+            .returning(self._model)
+        )
+        response = await self._session.execute(stmt)
+        return list(response.scalars())
+
     async def update(self, pk: int, data: dict) -> SQLModelType:
         stmt = sql_update(self._model)
         stmt = stmt.where(self._model.id == pk)
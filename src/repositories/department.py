@@ -1,3 +1,5 @@
+from sqlalchemy.orm import selectinload
+
 from src.models import Department
 from src.repositories.bases import SQLAlchemyRepository
 
@@ -5,3 +7,6 @@ from src.repositories.bases import SQLAlchemyRepository
 class DepartmentRepository(SQLAlchemyRepository):
 
     _model = Department
+    _loader_profiles = {
+        'detail': (selectinload(Department.employees), ),
+    }
@@ -1,7 +1,164 @@
-from src.models import Employee
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    and_,
+    insert,
+    literal,
+    or_,
+    select
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import joinedload
+
+from src.models import Department, Employee, Role, User
 from src.repositories.bases import SQLAlchemyRepository
 
 
+import_staging = Table(
+    'employee_import',
+    MetaData(),
+    Column('row_number', Integer),
+    Column('email', String),
+    Column('username', String),
+    Column('hashed_password', String),
+    Column('department', String),
+    Column('role', String),
+    prefixes=['TEMPORARY'],
+    postgresql_on_commit='DROP'
+)
+
+
 class EmployeeRepository(SQLAlchemyRepository):
 
     _model = Employee
+    _loader_profiles = {
+        'auth': (joinedload(Employee.role), ),
+    }
+
+    async def create_import_staging(self) -> None:
+        """Creates the staging table dropped on transaction commit."""
+        connection = await self._session.connection()
+        await connection.run_sync(import_staging.create)
+
+    async def copy_import_rows(self, records: list[tuple]) -> None:
+        """
+        Loads the rows into the staging table by `COPY`.
+
+        Args:
+            - `records`: tuples ordered as the staging table columns.
+        """
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            import_staging.name,
+            records=records,
+            columns=[column.name for column in import_staging.columns]
+        )
+
+    async def merge_import(self, organization_id: int) -> list[tuple]:
+        """
+        Creates users and employees of the organization
+        from the staging table in one statement.
+        Rows with unknown role or department and existing users are skipped.
+
+        Returns:
+            - (row_number, email, username, role_id, department,
+            department_id, user_id) of every row,
+            `user_id` is None for the skipped rows.
+        """
+        staging = import_staging
+        resolved = (
+            select(
+                staging.c.row_number,
+                staging.c.email,
+                staging.c.username,
+                staging.c.hashed_password,
+                staging.c.department,
+                Role.id.label('role_id'),
+                Department.id.label('department_id')
+            )
+            .outerjoin(Role, Role.name == staging.c.role)
+            .outerjoin(
+                Department,
+                and_(
+                    Department.name == staging.c.department,
+                    Department.organization_id == organization_id
+                )
+            )
+            .cte('resolved')
+        )
+        valid = (
+            select(resolved)
+            .where(
+                resolved.c.role_id.is_not(None),
+                or_(
+                    resolved.c.department.is_(None),
+                    resolved.c.department_id.is_not(None)
+                )
+            )
+            .cte('valid')
+        )
+        new_users = (
+            pg_insert(User)
+            .from_select(
+                [
+                    'email',
+                    'username',
+                    'hashed_password',
+                    'is_active',
+                    'is_superuser',
+                    'role_id'
+                ],
+                select(
+                    valid.c.email,
+                    valid.c.username,
+                    valid.c.hashed_password,
+                    literal(True),
+                    literal(False),
+                    valid.c.role_id
+                )
+            )
+            .on_conflict_do_nothing()
+            .returning(User.id, User.email)
+            .cte('new_users')
+        )
+        new_employees = (
+            insert(self._model)
+            .from_select(
+                ['organization_id', 'department_id', 'user_id', 'role_id'],
+                select(
+                    literal(organization_id),
+                    valid.c.department_id,
+                    new_users.c.id,
+                    valid.c.role_id
+                )
+                .join_from(
+                    new_users,
+                    valid,
+                    valid.c.email == new_users.c.email
+                )
+            )
+            .returning(self._model.user_id)
+            .cte('new_employees')
+        )
+        stmt = (
+            select(
+                resolved.c.row_number,
+                resolved.c.email,
+                resolved.c.username,
+                resolved.c.role_id,
+                resolved.c.department,
+                resolved.c.department_id,
+                new_employees.c.user_id
+            )
+            .outerjoin(new_users, new_users.c.email == resolved.c.email)
+            .outerjoin(
+                new_employees,
+                new_employees.c.user_id == new_users.c.id
+            )
+        )
+        response = await self._session.execute(stmt)
+        return response.all()
@@ -1,4 +1,20 @@
-from sqlalchemy import insert, select
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import (
+    Integer,
+    Select,
+    all_,
+    bindparam,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import selectinload
 
 from src.exceptions.db import ObjectNotFound
 from src.models import Employee, Meeting, Employee_Meeting
@@ -8,14 +24,96 @@ from src.repositories.bases import SQLAlchemyRepository
 class MeetingRepository(SQLAlchemyRepository):
 
     _model = Meeting
+    _loader_profiles = {
+        'detail': (selectinload(Meeting.employees), ),
+    }
+
+    async def get_occupied_employee_ids(
+        self,
+        employee_ids: list[int],
+        start_at: datetime,
+        end_at: datetime,
+        exclude_meeting_id: Optional[int] = None
+    ) -> set[int]:
+        """
+        Returns IDs of the employees that have a meeting
+        overlapping the specified period in one query.
+        The ranges overlap when `start_at < :end_at AND end_at > :start_at`,
+        the predicate is written as a range overlap
+        to be served by the GiST index of the meeting periods.
+
+        Args:
+            - `employee_ids`: IDs of the employees to check;
+            - `start_at`: start of the period;
+            - `end_at`: end of the period;
+            Optional:
+            - `exclude_meeting_id`: ID of the meeting to ignore.
+        """
+        if not employee_ids:
+            return set()
+
+        stmt = self._overlapping(
+            select(Employee_Meeting.employee_id),
+            employee_ids,
+            start_at,
+            end_at
+        )
+        if exclude_meeting_id is not None:
+            stmt = stmt.where(self._model.id != exclude_meeting_id)
+
+        response = await self._session.execute(stmt)
+        return set(response.scalars())
+
+    async def get_busy_intervals(
+        self,
+        employee_ids: list[int],
+        start_at: datetime,
+        end_at: datetime
+    ) -> list[tuple[datetime, datetime]]:
+        """
+        Returns periods of the employees meetings
+        overlapping the specified period in one query.
+        """
+        if not employee_ids:
+            return []
+
+        stmt = self._overlapping(
+            select(self._model.start_at, self._model.end_at),
+            employee_ids,
+            start_at,
+            end_at
+        )
+        response = await self._session.execute(stmt)
+        return [tuple(row) for row in response]
+
+    def _overlapping(
+        self,
+        stmt: Select,
+        employee_ids: list[int],
+        start_at: datetime,
+        end_at: datetime
+    ) -> Select:
+        return (
+            stmt
+            .distinct()
+            .select_from(Employee_Meeting)
+            .join(self._model, self._model.id == Employee_Meeting.meeting_id)
+            .where(
+                Employee_Meeting.employee_id.in_(employee_ids),
+                func.tstzrange(self._model.start_at, self._model.end_at)
+                .op('&&')(func.tstzrange(start_at, end_at))
+            )
+        )
 
     async def create_meeting_with_employees(
         self,
         data: dict,
         employees: list[Employee]
     ) -> Meeting:
-        """Creating meeting with adding employees from list."""
-        meeting: Meeting = self._model(**data)
+        """
+        Creating meeting with adding employees from list
+        by one multi-row insert.
+        """
         stmt = insert(self._model).values(**data).returning(self._model)
         response = await self._session.execute(stmt)
         meeting: Meeting = response.scalar_one_or_none()
@@ -23,14 +121,12 @@ class MeetingRepository(SQLAlchemyRepository):
         if not meeting:
             raise ObjectNotFound()
 
-        for employee in employees:
-            data: dict = {
-                'meeting_id': meeting.id,
-                'employee_id': employee.id
-            }
-            self._session.add(Employee_Meeting(**data))
-
-        self._session.add(meeting)
+        if employees:
+            stmt = insert(Employee_Meeting).values([
+                {'meeting_id': meeting.id, 'employee_id': employee.id}
+                for employee in employees
+            ])
+            await self._session.execute(stmt)
 
         return meeting
 
@@ -40,25 +136,40 @@ class MeetingRepository(SQLAlchemyRepository):
         data: dict,
         employees: list[Employee]
     ) -> Meeting:
-        """Updating meeting with replace employees list."""
-        stmt = select(self._model).where(self._model.id == pk)
-        response = await self._session.execute(stmt)
-        meeting: Meeting = response.scalar_one_or_none()
-
-        if not meeting:
-            raise ObjectNotFound()
-
-        meeting.employees.clear()
-
-        meeting: Meeting = await self.update(pk, data)
-
-        if not meeting:
-            raise ObjectNotFound()
-
-        for employee in employees:
-            stmt = select(Employee).where(Employee.id == employee.id)
-            response = await self._session.execute(stmt)
-            employee: Employee = response.scalar_one_or_none()
-            meeting.employees.append(employee)
-
-        return meeting
+        """
+        Updating meeting with replace employees list.
+        The difference of the attendees is computed in SQL
+        and applied by one delete and one insert.
+        """
+        await self.update(pk, data)
+
+        employee_ids = bindparam(
+            'employee_ids',
+            [employee.id for employee in employees],
+            type_=ARRAY(Integer)
+        )
+        stmt = delete(Employee_Meeting).where(
+            Employee_Meeting.meeting_id == pk,
+            Employee_Meeting.employee_id != all_(employee_ids)
+        )
+        await self._session.execute(stmt)
+
+        added = (
+            func.unnest(employee_ids)
+            .table_valued('employee_id')
+            .render_derived()
+        )
+        attached = (
+            select(Employee_Meeting.id)
+            .where(
+                Employee_Meeting.meeting_id == pk,
+                Employee_Meeting.employee_id == added.c.employee_id
+            )
+        )
+        stmt = insert(Employee_Meeting).from_select(
+            ['meeting_id', 'employee_id'],
+            select(literal(pk), added.c.employee_id).where(~exists(attached))
+        )
+        await self._session.execute(stmt)
+
+        return await self.get(pk, 'detail')
@@ -1,7 +1,16 @@
-from src.models import Organization
+from sqlalchemy.orm import selectinload
+
+from src.models import Department, Organization
 from src.repositories.bases import SQLAlchemyRepository
 
 
 class OrganizationRepository(SQLAlchemyRepository):
 
     _model = Organization
+    _loader_profiles = {
+        'detail': (
+            selectinload(Organization.employees),
+            selectinload(Organization.departments)
+            .selectinload(Department.employees),
+        ),
+    }
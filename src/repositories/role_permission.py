@@ -1,4 +1,5 @@
-from sqlalchemy import select
+from sqlalchemy import Row, String, column, select, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from src.exceptions.db import ObjectNotFound
 from src.models import Permission, Role, RolePermission
@@ -9,27 +10,75 @@ class RolePermissionRepository(SQLAlchemyRepository):
 
     _model = RolePermission
 
+    async def get_bindings(self) -> list[Row]:
+        """Returns (role_id, permission_name) rows for every role."""
+        stmt = (
+            select(Role.id, Permission.name)
+            .outerjoin(self._model, self._model.role_id == Role.id)
+            .outerjoin(Permission, self._model.permission_id == Permission.id)
+        )
+        response = await self._session.execute(stmt)
+        return response.all()
+
     async def add_permissions_to_role(
         self,
         role_name: str,
         permissions: list[str]
     ) -> None:
-        stmt = select(Role).filter_by(name=role_name)
+        stmt = select(Role.id).filter_by(name=role_name)
         response = await self._session.execute(stmt)
-        role: Role = response.scalar_one_or_none()
+        role_id: int = response.scalar_one_or_none()
 
-        if not role:
+        if not role_id:
             raise ObjectNotFound()
 
-        for perm_name in permissions:
-            stmt = select(Permission).filter_by(name=perm_name)
-            response = await self._session.execute(stmt)
-            permission: Permission = response.scalar_one_or_none()
-            if not permission:
-                raise ObjectNotFound()
-
-            data: dict = {
-                'role_id': role.id,
-                'permission_id': permission.id
-            }
-            self._session.add(self._model(**data))
+        stmt = select(Permission.id).where(Permission.name.in_(permissions))
+        response = await self._session.execute(stmt)
+        permission_ids: list[int] = response.scalars().all()
+
+        if len(permission_ids) != len(set(permissions)):
+            raise ObjectNotFound()
+
+        await self.create_missing(
+            [
+                {'role_id': role_id, 'permission_id': permission_id}
+                for permission_id in permission_ids
+            ],
+            ('role_id', 'permission_id')
+        )
+
+    async def bind_permissions(self, bindings: dict[str, list[str]]) -> None:
+        """
+        Binds the permissions to the roles by names in one statement.
+        Existing bindings and unknown names are skipped.
+
+        Args:
+            - `bindings`: dict of the form {role_name: [permission_name]}.
+        """
+        rows: list[tuple[str, str]] = [
+            (role_name, permission_name)
+            for role_name, permission_names in bindings.items()
+            for permission_name in permission_names
+        ]
+        if not rows:
+            return
+
+        names = values(
+            column('role_name', String),
+            column('permission_name', String),
+            name='binding'
+        ).data(rows)
+        stmt = (
+            pg_insert(self._model)
+            .from_select(
+                ['role_id', 'permission_id'],
+                select(Role.id, Permission.id)
+                .select_from(names)
+                .join(Role, Role.name == names.c.role_name)
+                .join(Permission, Permission.name == names.c.permission_name)
+            )
+            .on_conflict_do_nothing(
+                index_elements=['role_id', 'permission_id']
+            )
+        )
+        await self._session.execute(stmt)
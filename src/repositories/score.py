@@ -1,7 +1,233 @@
-from src.models import Score
+from datetime import date, timedelta
+from typing import Optional
+
+from sqlalchemy import Float, RowMapping, and_, cast, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import joinedload
+
+from src.core.constants import SCORE_ROLLUP_NAME
+from src.models import (
+    Employee,
+    RollupCheckpoint,
+    Score,
+    ScoreDaily,
+    ScoreSummary
+)
 from src.repositories.bases import SQLAlchemyRepository
 
 
 class ScoreRepository(SQLAlchemyRepository):
 
     _model = Score
+    _loader_profiles = {
+        'list': (joinedload(Score.task), ),
+    }
+
+    async def add_to_summary(self, score: Score) -> None:
+        """
+        Adds the score to the employee summary by one upsert
+        without reading the employee scores.
+        """
+        stmt = pg_insert(ScoreSummary).values(
+            employee_id=score.employee_id,
+            scores_count=1,
+            in_time_sum=score.in_time,
+            integrity_sum=score.integrity,
+            quality_sum=score.quality
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ScoreSummary.employee_id],
+            set_={
+                'scores_count': ScoreSummary.scores_count + 1,
+                'in_time_sum': (
+                    ScoreSummary.in_time_sum + stmt.excluded.in_time_sum
+                ),
+                'integrity_sum': (
+                    ScoreSummary.integrity_sum + stmt.excluded.integrity_sum
+                ),
+                'quality_sum': (
+                    ScoreSummary.quality_sum + stmt.excluded.quality_sum
+                ),
+                'updated_at': func.now()
+            }
+        )
+        await self._session.execute(stmt)
+
+    async def get_summary(self, employee_id: int) -> Optional[ScoreSummary]:
+        """Returns the employee score summary if he has scores."""
+        stmt = select(ScoreSummary).where(
+            ScoreSummary.employee_id == employee_id
+        )
+        response = await self._session.execute(stmt)
+        return response.scalar_one_or_none()
+
+    async def get_average_score(self, employee_id: int) -> float:
+        """
+        Returns the average score of the employee
+        aggregated over all his scores in SQL.
+        """
+        stmt = select(
+            func.coalesce(
+                func.avg(
+                    self._model.in_time
+                    + self._model.integrity
+                    + self._model.quality
+                ),
+                0
+            )
+        ).where(self._model.employee_id == employee_id)
+        response = await self._session.execute(stmt)
+        return float(response.scalar_one())
+
+    async def rollup_daily(self, lag: timedelta, rescan: int) -> int:
+        """
+        Recomputes the daily rollups of the employee days
+        touched by the scores since the last run
+        and moves the checkpoint in one transaction.
+        Scores younger than `lag` are left for the next run.
+        The last `rescan` ids before the checkpoint are scanned again,
+        so scores committed late with a smaller id are rolled up too.
+        The rollups are recomputed from all scores of the day,
+        so the rescan does not count a score twice;
+        a score committed after `rescan` newer ids is not rolled up
+        until a newer score of the same employee day.
+
+        Args:
+            - `lag`: age of the scores left for the next run;
+            - `rescan`: number of the ids scanned again.
+
+        Returns:
+            - number of the scores aggregated into the rollups.
+        """
+        stmt = (
+            pg_insert(RollupCheckpoint)
+            .values(name=SCORE_ROLLUP_NAME, last_id=0)
+            .on_conflict_do_nothing(index_elements=['name'])
+        )
+        await self._session.execute(stmt)
+
+        stmt = (
+            select(RollupCheckpoint)
+            .where(RollupCheckpoint.name == SCORE_ROLLUP_NAME)
+            .with_for_update()
+        )
+        response = await self._session.execute(stmt)
+        checkpoint: RollupCheckpoint = response.scalar_one()
+
+        ready = self._model.created_at < func.now() - lag
+        stmt = select(func.max(self._model.id)).where(
+            self._model.id > checkpoint.last_id, ready
+        )
+        response = await self._session.execute(stmt)
+        last_id: int = response.scalar_one() or checkpoint.last_id
+
+        day = func.date(func.timezone('UTC', self._model.created_at))
+        touched = (
+            select(self._model.employee_id, day.label('day'))
+            .where(
+                self._model.id > checkpoint.last_id - rescan,
+                self._model.id <= last_id,
+                ready
+            )
+            .distinct()
+            .cte('touched')
+        )
+        rows = (
+            select(
+                self._model.employee_id,
+                Employee.organization_id,
+                Employee.department_id,
+                day,
+                func.count(),
+                func.sum(self._model.in_time),
+                func.sum(self._model.integrity),
+                func.sum(self._model.quality)
+            )
+            .join(Employee, Employee.id == self._model.employee_id)
+            .join(
+                touched,
+                and_(
+                    touched.c.employee_id == self._model.employee_id,
+                    touched.c.day == day
+                )
+            )
+            .where(ready)
+            .group_by(
+                self._model.employee_id,
+                Employee.organization_id,
+                Employee.department_id,
+                day
+            )
+        )
+        stmt = pg_insert(ScoreDaily).from_select(
+            [
+                'employee_id',
+                'organization_id',
+                'department_id',
+                'day',
+                'scores_count',
+                'in_time_sum',
+                'integrity_sum',
+                'quality_sum'
+            ],
+            rows
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ScoreDaily.employee_id, ScoreDaily.day],
+            set_={
+                'organization_id': stmt.excluded.organization_id,
+                'department_id': stmt.excluded.department_id,
+                'scores_count': stmt.excluded.scores_count,
+                'in_time_sum': stmt.excluded.in_time_sum,
+                'integrity_sum': stmt.excluded.integrity_sum,
+                'quality_sum': stmt.excluded.quality_sum,
+                'updated_at': func.now()
+            }
+        ).returning(ScoreDaily.scores_count)
+        response = await self._session.execute(stmt)
+        count: int = sum(response.scalars().all())
+
+        checkpoint.last_id = last_id
+        return count
+
+    async def get_leaderboard(
+        self,
+        since: date,
+        limit: int,
+        **filters
+    ) -> list[RowMapping]:
+        """
+        Returns employees with the highest average score
+        over the daily rollups since the date.
+
+        Args:
+            - `since`: first day of the window;
+            - `limit`: number of employees;
+            - `filters`: `organization_id` or `department_id`.
+        """
+        scores_count = func.sum(ScoreDaily.scores_count)
+        average_score = (
+            cast(
+                func.sum(
+                    ScoreDaily.in_time_sum
+                    + ScoreDaily.integrity_sum
+                    + ScoreDaily.quality_sum
+                ),
+                Float
+            )
+            / scores_count
+        )
+        stmt = (
+            select(
+                ScoreDaily.employee_id,
+                average_score.label('average_score'),
+                scores_count.label('scores_count')
+            )
+            .filter_by(**filters)
+            .where(ScoreDaily.day >= since)
+            .group_by(ScoreDaily.employee_id)
+            .order_by(average_score.desc(), ScoreDaily.employee_id)
+            .limit(limit)
+        )
+        response = await self._session.execute(stmt)
+        return response.mappings().all()
@@ -0,0 +1,145 @@
+"""
+Prebuilt parameterized statements of the base repository.
+
+Statements are cached per model, filter keys shape and loader options,
+so repeated lookups skip Python-side SQL construction
+and reuse the memoized cache key of the compiled statement.
+"""
+from functools import lru_cache
+
+from sqlalchemy import DateTime, Select, bindparam, select, tuple_
+
+from src.enums.sql import OrderEnum
+from src.models.bases import Base
+
+
+STATEMENTS_CACHE_SIZE: int = 512
+
+
+@lru_cache(maxsize=None)
+def column_names(model: type[Base]) -> frozenset[str]:
+    """Returns the model table column names."""
+    return frozenset(model.__table__.columns.keys())
+
+
+@lru_cache(maxsize=None)
+def datetime_column_names(model: type[Base]) -> frozenset[str]:
+    """Returns the model table names of columns with datetime values."""
+    return frozenset(
+        column.key
+        for column in model.__table__.columns
+        if isinstance(column.type, DateTime)
+    )
+
+
+@lru_cache(maxsize=STATEMENTS_CACHE_SIZE)
+def select_by(
+    model: type[Base],
+    keys: tuple[str, ...],
+    null_keys: tuple[str, ...] = (),
+    options: tuple = (),
+    columns: tuple[str, ...] = ()
+) -> Select:
+    """
+    Returns the model select filtered by equality
+    to the bound parameters named after the `keys`
+    and by NULL values of the `null_keys`
+    with the relationship loader `options`.
+    Only the `columns` are selected if they are given.
+    """
+    entities: list = [getattr(model, column) for column in columns]
+    return (
+        select(*entities or [model])
+        .where(*(getattr(model, key) == bindparam(key) for key in keys))
+        .where(*(getattr(model, key).is_(None) for key in null_keys))
+        .options(*options)
+        .execution_options(populate_existing=True)
+    )
+
+
+@lru_cache(maxsize=STATEMENTS_CACHE_SIZE)
+def select_in(
+    model: type[Base],
+    field: str,
+    options: tuple = ()
+) -> Select:
+    """Returns the model select by field contains `values` parameter."""
+    return (
+        select(model)
+        .where(getattr(model, field).in_(bindparam('values', expanding=True)))
+        .options(*options)
+        .execution_options(populate_existing=True)
+    )
+
+
+def _order_by(model: type[Base], order_by_field: str, order: OrderEnum):
+    columns: list = [getattr(model, order_by_field)]
+    if order_by_field != 'id':
+        columns.append(model.id)
+
+    if order == OrderEnum.ASCENDING:
+        return [column.asc() for column in columns]
+
+    return [column.desc() for column in columns]
+
+
+@lru_cache(maxsize=STATEMENTS_CACHE_SIZE)
+def select_page(
+    model: type[Base],
+    keys: tuple[str, ...],
+    null_keys: tuple[str, ...],
+    order_by_field: str,
+    order: OrderEnum,
+    options: tuple = (),
+    columns: tuple[str, ...] = ()
+) -> Select:
+    """
+    Returns the ordered model select filtered by the keys
+    and limited by `offset` and `limit` parameters.
+    Rows with equal sort values are ordered by ID.
+    """
+    return (
+        select_by(model, keys, null_keys, options, columns)
+        .offset(bindparam('offset'))
+        .limit(bindparam('limit'))
+        .order_by(*_order_by(model, order_by_field, order))
+    )
+
+
+@lru_cache(maxsize=STATEMENTS_CACHE_SIZE)
+def select_after(
+    model: type[Base],
+    keys: tuple[str, ...],
+    null_keys: tuple[str, ...],
+    order_by_field: str,
+    order: OrderEnum,
+    options: tuple = (),
+    columns: tuple[str, ...] = ()
+) -> Select:
+    """
+    Returns the ordered model select filtered by the keys
+    that starts after the row with `cursor_value` and `cursor_id`
+    and is limited by `limit` parameter.
+    """
+    if order_by_field == 'id':
+        position = model.id
+        cursor = bindparam('cursor_id', type_=model.id.type)
+    else:
+        column = getattr(model, order_by_field)
+        position = tuple_(column, model.id)
+        cursor = tuple_(
+            bindparam('cursor_value', type_=column.type),
+            bindparam('cursor_id', type_=model.id.type)
+        )
+
+    if order == OrderEnum.ASCENDING:
+        after = position > cursor
+    else:
+        after = position < cursor
+
+    return (
+        select_by(model, keys, null_keys, options, columns)
+        .where(after)
+        .limit(bindparam('limit'))
+        .order_by(*_order_by(model, order_by_field, order))
+    )
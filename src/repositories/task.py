@@ -1,7 +1,173 @@
-from src.models import Task
+from typing import Optional
+
+from sqlalchemy import (
+    Float,
+    RowMapping,
+    Select,
+    String,
+    bindparam,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    union_all
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.orm import joinedload
+
+from src.core.constants import (
+    SEARCH_HEADLINE_OPTIONS,
+    SEARCH_MAX_CANDIDATES,
+    SEARCH_TS_CONFIG
+)
+from src.exceptions.request import InvalidCursor
+from src.models import Comment, Employee, Task
 from src.repositories.bases import SQLAlchemyRepository
+from src.utils.pagination import decode_cursor, encode_cursor
+
+
+SEARCH_KINDS: tuple[str, ...] = ('comment', 'task')
 
 
 class TaskRepository(SQLAlchemyRepository):
 
     _model = Task
+    _cursor_fields = ('id', 'created_at', 'deadline')
+    _loader_profiles = {
+        'detail': (joinedload(Task.author), joinedload(Task.performer)),
+    }
+
+    @staticmethod
+    def _in_department(
+        stmt: Select,
+        department_id: Optional[int] = None
+    ) -> Select:
+        """
+        Filters the tasks of the department.
+        A task belongs to the department of its author or performer.
+        """
+        if department_id is None:
+            return stmt
+
+        employees = select(Employee.id).where(
+            Employee.department_id == department_id
+        )
+        return stmt.where(
+            or_(
+                Task.created_by.in_(employees),
+                Task.assignee.in_(employees)
+            )
+        )
+
+    @staticmethod
+    def _read_search_cursor(cursor: str) -> tuple:
+        values: list = decode_cursor(cursor)
+        if (
+            len(values) != 3
+            or not isinstance(values[0], (int, float))
+            or values[1] not in SEARCH_KINDS
+            or not isinstance(values[2], int)
+        ):
+            raise InvalidCursor()
+
+        return tuple(values)
+
+    async def search(
+        self,
+        query: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        organization_id: Optional[int] = None,
+        department_id: Optional[int] = None
+    ) -> tuple[list[RowMapping], Optional[str]]:
+        """
+        Returns tasks and comments matching the web search query
+        ordered by rank, and the cursor of the next page.
+        Matches of the organization are found by the GIN indexes
+        leading with the organization, the department is filtered
+        among them. Only the first `SEARCH_MAX_CANDIDATES` matches
+        of tasks and of comments are ranked, so a common term
+        doesn't rank every row of the organization;
+        headlines are built only for the rows of the page.
+
+        Args:
+            - `query`: web search query;
+            - `limit`: page size;
+            - `cursor`: cursor of the page returned earlier;
+            - `organization_id`: organization of the contributor;
+            - `department_id`: department of the contributor if he isn't
+            the admin of the organization.
+        """
+        ts_config = literal(SEARCH_TS_CONFIG, REGCONFIG)
+        ts_query = func.websearch_to_tsquery(
+            ts_config,
+            bindparam('query', query, String)
+        )
+        tasks = self._in_department(
+            select(
+                literal('task', String).label('kind'),
+                Task.id,
+                Task.id.label('task_id'),
+                func.ts_rank(Task.search_vector, ts_query, type_=Float)
+                .label('rank'),
+                func.concat_ws(' ', Task.name, Task.description)
+                .label('document')
+            )
+            .select_from(Task)
+            .where(
+                Task.organization_id == organization_id,
+                Task.search_vector.op('@@')(ts_query)
+            ),
+            department_id
+        ).limit(SEARCH_MAX_CANDIDATES)
+        comments = select(
+            literal('comment', String),
+            Comment.id,
+            Comment.task_id,
+            func.ts_rank(Comment.search_vector, ts_query, type_=Float),
+            Comment.content
+        ).where(
+            Comment.organization_id == organization_id,
+            Comment.search_vector.op('@@')(ts_query)
+        )
+        if department_id is not None:
+            comments = comments.join(Task, Task.id == Comment.task_id)
+
+        comments = self._in_department(comments, department_id).limit(
+            SEARCH_MAX_CANDIDATES
+        )
+        matches = union_all(tasks, comments).subquery('matches')
+        page = select(matches).limit(limit).order_by(
+            matches.c.rank.desc(),
+            matches.c.kind.desc(),
+            matches.c.id.desc()
+        )
+        if cursor:
+            page = page.where(
+                tuple_(matches.c.rank, matches.c.kind, matches.c.id)
+                < tuple_(*self._read_search_cursor(cursor))
+            )
+
+        page = page.subquery('page')
+        stmt = select(
+            page.c.kind,
+            page.c.id,
+            page.c.task_id,
+            page.c.rank,
+            func.ts_headline(
+                ts_config,
+                page.c.document,
+                ts_query,
+                SEARCH_HEADLINE_OPTIONS
+            ).label('headline')
+        ).order_by(page.c.rank.desc(), page.c.kind.desc(), page.c.id.desc())
+        response = await self._session.execute(stmt)
+        rows: list[RowMapping] = response.mappings().all()
+
+        next_cursor: Optional[str] = None
+        if rows and len(rows) == limit:
+            last: RowMapping = rows[-1]
+            next_cursor = encode_cursor(last['rank'], last['kind'], last['id'])
+
+        return rows, next_cursor
@@ -1,7 +1,9 @@
-from sqlalchemy import insert, select
+from typing import Optional
+
+from sqlalchemy import Row, insert, select
 
 from src.exceptions import db as db_exc
-from src.models import Employee, Organization, User
+from src.models import Employee, Organization, Role, User
 from src.repositories.bases import SQLAlchemyRepository
 
 
@@ -48,3 +50,27 @@ class UserRepository(SQLAlchemyRepository):
         employee: Employee = Employee(**employee_data)
         self._session.add(employee)
         return user
+
+    async def get_principal(self, pk: int) -> Optional[Row]:
+        """
+        Returns the user columns needed for authorization
+        with the role name and the employee record in one query.
+        """
+        stmt = (
+            select(
+                User.id,
+                User.email,
+                User.is_active,
+                User.is_superuser,
+                Role.name.label('role_name'),
+                Employee.id.label('employee_id'),
+                Employee.department_id,
+                Employee.organization_id
+            )
+            .join(Role, User.role_id == Role.id)
+            .outerjoin(Employee, Employee.user_id == User.id)
+            .where(User.id == pk)
+            .limit(1)
+        )
+        response = await self._session.execute(stmt)
+        return response.one_or_none()
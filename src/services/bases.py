@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod, abstractclassmethod
+from functools import partial
 from typing import TypeVar, Optional
 
 from pydantic import BaseModel
+from sqlalchemy import RowMapping
 
+from src.cache.entity import EntityCache
 from src.models.bases import Base
 from src.units.base import AbstractBaseUnitOfWork
 
@@ -17,7 +20,12 @@ class AbstractBaseService(ABC):
     _repository = None
 
     @abstractclassmethod
-    async def get(cls, uow: type[UOWType], pk: int):
+    async def get(
+        cls,
+        uow: type[UOWType],
+        pk: int,
+        profile: Optional[str] = None
+    ):
         raise NotImplementedError
 
     @abstractclassmethod
@@ -25,22 +33,61 @@ class AbstractBaseService(ABC):
         cls,
         uow: type[UOWType],
         field: str,
-        values: list
+        values: list,
+        profile: Optional[str] = None
     ):
         raise NotImplementedError
 
     @abstractclassmethod
-    async def get_all(cls, uow: type[UOWType], filters: dict):
+    async def get_all(
+        cls,
+        uow: type[UOWType],
+        filters: dict,
+        profile: Optional[str] = None
+    ):
         raise NotImplementedError
 
     @abstractclassmethod
-    async def get_by_filters(cls, uow: type[UOWType], **filters):
+    async def get_page(
+        cls,
+        uow: type[UOWType],
+        filters: dict,
+        profile: Optional[str] = None
+    ):
+        raise NotImplementedError
+
+    @abstractclassmethod
+    async def get_rows_page(
+        cls,
+        uow: type[UOWType],
+        columns: tuple[str, ...],
+        filters: dict
+    ):
+        raise NotImplementedError
+
+    @abstractclassmethod
+    async def get_by_filters(
+        cls,
+        uow: type[UOWType],
+        *,
+        profile: Optional[str] = None,
+        **filters
+    ):
         raise NotImplementedError
 
     @abstractclassmethod
     async def create(cls, uow: type[UOWType], data: dict):
         raise NotImplementedError
 
+    @abstractclassmethod
+    async def create_missing(
+        cls,
+        uow: type[UOWType],
+        rows: list[dict],
+        index_elements: Optional[tuple[str, ...]] = None
+    ):
+        raise NotImplementedError
+
     @abstractclassmethod
     async def update(cls, uow: type[UOWType], pk: int, data: dict):
         raise NotImplementedError
@@ -52,58 +99,158 @@ class AbstractBaseService(ABC):
 
 class StorageBaseService(AbstractBaseService):
 
+    _cache: Optional[EntityCache] = None
+
     @classmethod
-    async def get(cls, uow: type[UOWType], pk: int):
+    async def get(
+        cls,
+        uow: type[UOWType],
+        pk: int,
+        profile: Optional[str] = None
+    ) -> Optional[SQLModelType]:
         """Returns an object from the database by ID.."""
         async with uow:
-            return await uow.__dict__[cls._repository].get(pk)
+            repository = uow.get_repository(cls._repository)
+            if cls._cache and not profile:
+                return await cls._cache.get(uow, repository, pk)
+
+            return await repository.get(pk, profile)
 
     @classmethod
     async def get_by_field_contains(
         cls,
         uow: type[UOWType],
         field: str,
-        values: list
+        values: list,
+        profile: Optional[str] = None
     ) -> list[SQLModelType]:
         """
         Returns a list of objects from the database
         by fieled contains values.
         """
         async with uow:
-            return await uow.__dict__[cls._repository].get_by_field_contains(
-                field=field,
-                values=values
+            return (
+                await uow.get_repository(cls._repository)
+                .get_by_field_contains(
+                    field=field,
+                    values=values,
+                    profile=profile
+                )
             )
 
     @classmethod
     async def get_all(
         cls,
         uow: type[UOWType],
-        filters: Optional[dict] = None
+        filters: Optional[dict] = None,
+        profile: Optional[str] = None
     ) -> list[SQLModelType]:
         """Returns a list of objects from the database.."""
         filters: dict = filters or {}
         async with uow:
-            return await uow.__dict__[cls._repository].get_all(**filters)
+            return (
+                await uow.get_repository(cls._repository)
+                .get_all(**filters, profile=profile)
+            )
+
+    @classmethod
+    async def get_page(
+        cls,
+        uow: type[UOWType],
+        filters: Optional[dict] = None,
+        profile: Optional[str] = None
+    ) -> tuple[list[SQLModelType], Optional[str]]:
+        """
+        Returns a page of objects from the database
+        and the cursor of the next page.
+        """
+        filters: dict = filters or {}
+        async with uow:
+            return (
+                await uow.get_repository(cls._repository)
+                .get_page(**filters, profile=profile)
+            )
+
+    @classmethod
+    async def get_rows_page(
+        cls,
+        uow: type[UOWType],
+        columns: tuple[str, ...],
+        filters: Optional[dict] = None
+    ) -> tuple[list[RowMapping], Optional[str]]:
+        """
+        Returns a page of rows with the specified columns
+        and the cursor of the next page.
+        """
+        filters: dict = filters or {}
+        async with uow:
+            return (
+                await uow.get_repository(cls._repository)
+                .get_rows_page(columns, **filters)
+            )
 
     @classmethod
     async def get_by_filters(
         cls,
         uow: type[UOWType],
+        *,
+        profile: Optional[str] = None,
         **filters
     ) -> Optional[SQLModelType]:
         """Returns an object from the database by filters."""
         async with uow:
-            return (
-                await uow.__dict__[cls._repository]
-                .get_by_filters(**filters)
-            )
+            repository = uow.get_repository(cls._repository)
+            if cls._cache and not profile and cls._cache.accepts(filters):
+                (field, value), = filters.items()
+                return await cls._cache.get_by(uow, repository, field, value)
+
+            return await repository.get_by_filters(profile=profile, **filters)
+
+    @classmethod
+    async def invalidate_cached(
+        cls,
+        uow: type[UOWType],
+        obj: Optional[SQLModelType]
+    ) -> None:
+        """Removes the object from the service cache after commit."""
+        if cls._cache and obj is not None:
+            await uow.after_commit(partial(cls._cache.invalidate, obj))
 
     @classmethod
     async def create(cls, uow: type[UOWType], data: dict) -> SQLModelType:
         """Creates a new object in the database."""
         async with uow:
-            return await uow.__dict__[cls._repository].create(data)
+            obj: SQLModelType = (
+                await uow.get_repository(cls._repository).create(data)
+            )
+            await cls.invalidate_cached(uow, obj)
+            return obj
+
+    @classmethod
+    async def create_missing(
+        cls,
+        uow: type[UOWType],
+        rows: list[dict],
+        index_elements: Optional[tuple[str, ...]] = None
+    ) -> list[SQLModelType]:
+        """
+        Creates the objects that do not exist yet by one statement
+        and returns the created ones.
+
+        Args:
+            - `rows`: list of dicts with data to create;
+            Optional:
+            - `index_elements`: unique columns to check for conflicts.
+        """
+        async with uow:
+            objs: list[SQLModelType] = (
+                await uow.get_repository(cls._repository)
+                .create_missing(rows, index_elements)
+            )
+            for obj in objs:
+                await cls.invalidate_cached(uow, obj)
+
+            return objs
 
     @classmethod
     async def update(
@@ -114,13 +261,21 @@ class StorageBaseService(AbstractBaseService):
     ) -> SQLModelType:
         """Updates an object in the database by ID."""
         async with uow:
-            return await uow.__dict__[cls._repository].update(pk, data)
+            obj: SQLModelType = (
+                await uow.get_repository(cls._repository).update(pk, data)
+            )
+            await cls.invalidate_cached(uow, obj)
+            return obj
 
     @classmethod
     async def delete(cls, uow: type[UOWType], pk: int) -> SQLModelType:
         """Delete an object from the database by ID.."""
         async with uow:
-            return await uow.__dict__[cls._repository].delete(pk=pk)
+            obj: SQLModelType = (
+                await uow.get_repository(cls._repository).delete(pk=pk)
+            )
+            await cls.invalidate_cached(uow, obj)
+            return obj
 
 
 class TokenAbstractBaseService(ABC):
@@ -1,6 +1,9 @@
+from src.cache.entity import EntityCache
+from src.core.constants import DEPARTMENT_CACHE_TTL_SECONDS
 from src.services.bases import StorageBaseService
 
 
 class DepartmentService(StorageBaseService):
 
     _repository = 'department_repository'
+    _cache = EntityCache(DEPARTMENT_CACHE_TTL_SECONDS)
@@ -1,6 +1,168 @@
-from src.services.bases import StorageBaseService
+from functools import partial
+from typing import AsyncIterator, Optional
+
+from pydantic import ValidationError
+
+from src.api.v1.schemas.request.employee import EmployeeImportSchema
+from src.cache.entity import EntityCache
+from src.cache.principal import principal_cache
+from src.core.constants import (
+    EMPLOYEE_CACHE_TTL_SECONDS,
+    EMPLOYEE_IMPORT_BATCH_SIZE
+)
+from src.models import Employee
+from src.repositories.employee import EmployeeRepository
+from src.services.bases import StorageBaseService, UOWType
+from src.utils.security import generate_url_token, pwd_guard
 
 
 class EmployeeService(StorageBaseService):
 
     _repository = 'employee_repository'
+    _cache = EntityCache(EMPLOYEE_CACHE_TTL_SECONDS, lookups=('user_id',))
+
+    @classmethod
+    async def update(
+        cls,
+        uow: type[UOWType],
+        pk: int,
+        data: dict
+    ) -> Employee:
+        """Updates the employee and invalidates his user cached principal."""
+        employee: Employee = await super().update(uow, pk, data)
+        await uow.after_commit(
+            partial(principal_cache.invalidate, employee.user_id)
+        )
+        return employee
+
+    @classmethod
+    async def import_employees(
+        cls,
+        uow: type[UOWType],
+        organization_id: int,
+        records: AsyncIterator[tuple[int, Optional[dict]]]
+    ) -> dict:
+        """
+        Creates users and employees of the organization from the upload.
+        Rows are validated as they arrive, loaded into the staging table
+        in batches, then merged in one statement.
+        Users are created with the placeholder hash of a random secret
+        until they set the password by the emailed one-time link.
+
+        Args:
+            - `organization_id`: organization ID;
+            - `records`: (row number, record) pairs of the upload.
+
+        Returns:
+            - dict with the number of created employees,
+            the errors of the skipped rows
+            and `id`, `email`, `username` of the created users.
+        """
+        errors: list[dict] = []
+        seen: set[str] = set()
+        batch: list[tuple[int, EmployeeImportSchema]] = []
+        placeholder: str = (
+            await pwd_guard.get_password_hash_async(generate_url_token())
+        )
+        async with uow:
+            repository: EmployeeRepository = (
+                uow.get_repository(cls._repository)
+            )
+            await repository.create_import_staging()
+            async for row_number, record in records:
+                if record is None:
+                    errors.append(
+                        {'row': row_number, 'errors': ['Malformed row']}
+                    )
+                    continue
+
+                try:
+                    row = EmployeeImportSchema.model_validate(record)
+                except ValidationError as exc:
+                    errors.append({
+                        'row': row_number,
+                        'errors': [
+                            f"{'.'.join(map(str, error['loc']))}: "
+                            f"{error['msg']}"
+                            for error in exc.errors()
+                        ]
+                    })
+                    continue
+
+                keys: tuple[str, str] = (
+                    f'email:{row.email}',
+                    f'username:{row.username}'
+                )
+                if seen.intersection(keys):
+                    errors.append({
+                        'row': row_number,
+                        'errors': ['Duplicate email or username in the file']
+                    })
+                    continue
+
+                seen.update(keys)
+                batch.append((row_number, row))
+                if len(batch) == EMPLOYEE_IMPORT_BATCH_SIZE:
+                    await cls._load_import_batch(
+                        repository,
+                        batch,
+                        placeholder
+                    )
+                    batch = []
+
+            if batch:
+                await cls._load_import_batch(repository, batch, placeholder)
+
+            merged: list[tuple] = (
+                await repository.merge_import(organization_id)
+            )
+
+        users: list[dict] = []
+        for (
+            row_number,
+            email,
+            username,
+            role_id,
+            department,
+            department_id,
+            user_id
+        ) in merged:
+            if user_id is not None:
+                users.append(
+                    {'id': user_id, 'email': email, 'username': username}
+                )
+                continue
+
+            if role_id is None:
+                reason: str = 'Unknown role'
+            elif department is not None and department_id is None:
+                reason = 'Unknown department'
+            else:
+                reason = 'User with this email or username already exists'
+
+            errors.append({'row': row_number, 'errors': [reason]})
+
+        errors.sort(key=lambda error: error['row'])
+        return {
+            'created': len(users),
+            'errors': errors,
+            'users': users
+        }
+
+    @staticmethod
+    async def _load_import_batch(
+        repository: EmployeeRepository,
+        batch: list[tuple[int, EmployeeImportSchema]],
+        placeholder: str
+    ) -> None:
+        await repository.copy_import_rows([
+            (
+                row_number,
+                row.email,
+                row.username,
+                placeholder,
+                row.department,
+                row.role.value
+            )
+            for row_number, row in batch
+        ])
@@ -1,11 +1,87 @@
+from datetime import datetime, time, timedelta
+from typing import Optional
+
 from src.models import Employee, Meeting
 from src.services.bases import StorageBaseService, UOWType
+from src.utils.scheduling import find_free_slots
 
 
 class MeetingService(StorageBaseService):
 
     _repository = 'meeting_repository'
 
+    @classmethod
+    async def get_occupied_employee_ids(
+        cls,
+        uow: type[UOWType],
+        employee_ids: list[int],
+        start_at: datetime,
+        end_at: datetime,
+        exclude_meeting_id: Optional[int] = None
+    ) -> set[int]:
+        """
+        Returns IDs of the employees busy in the specified period.
+
+        Args:
+            - `employee_ids`: IDs of the employees to check;
+            - `start_at`: start of the period;
+            - `end_at`: end of the period;
+            Optional:
+            - `exclude_meeting_id`: ID of the meeting to ignore.
+        """
+        async with uow:
+            return (
+                await uow.get_repository(cls._repository)
+                .get_occupied_employee_ids(
+                    employee_ids,
+                    start_at,
+                    end_at,
+                    exclude_meeting_id
+                )
+            )
+
+    @classmethod
+    async def get_free_slots(
+        cls,
+        uow: type[UOWType],
+        employee_ids: list[int],
+        start_at: datetime,
+        end_at: datetime,
+        duration: timedelta,
+        work_start: time,
+        work_end: time,
+        limit: int
+    ) -> list[tuple[datetime, datetime]]:
+        """
+        Returns the earliest common free slots of the employees.
+        The busy periods are fetched by one query
+        and merged by a sweep over the working hours.
+
+        Args:
+            - `employee_ids`: IDs of the participants;
+            - `start_at`: start of the search period;
+            - `end_at`: end of the search period;
+            - `duration`: minimal length of the slot;
+            - `work_start`: start of the working day;
+            - `work_end`: end of the working day;
+            - `limit`: maximum number of the slots.
+        """
+        async with uow:
+            busy: list[tuple[datetime, datetime]] = (
+                await uow.get_repository(cls._repository)
+                .get_busy_intervals(employee_ids, start_at, end_at)
+            )
+
+        return find_free_slots(
+            busy,
+            start_at,
+            end_at,
+            duration,
+            work_start,
+            work_end,
+            limit
+        )
+
     @classmethod
     async def create_meeting_with_employees(
         cls,
@@ -22,7 +98,7 @@ class MeetingService(StorageBaseService):
         """
         async with uow:
             return (
-                await uow.__dict__[cls._repository]
+                await uow.get_repository(cls._repository)
                 .create_meeting_with_employees(data, employees)
             )
 
@@ -44,6 +120,6 @@ class MeetingService(StorageBaseService):
         """
         async with uow:
             return (
-                await uow.__dict__[cls._repository]
+                await uow.get_repository(cls._repository)
                 .update_meeting_with_employees(pk, data, employees)
             )
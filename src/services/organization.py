@@ -1,17 +1,24 @@
+from functools import partial
+
+from src.cache.entity import EntityCache
+from src.cache.principal import Principal, principal_cache
+from src.core.constants import ORGANIZATION_CACHE_TTL_SECONDS
 from src.enums.role import RoleEnum
-from src.models import Organization, Role, User
+from src.models import Employee, Organization, Role
 from src.services.bases import StorageBaseService, UOWType
+from src.services.employee import EmployeeService
 
 
 class OrganizationService(StorageBaseService):
 
     _repository = 'organization_repository'
+    _cache = EntityCache(ORGANIZATION_CACHE_TTL_SECONDS)
 
     @classmethod
     async def create_with_employee(
         cls,
         uow: type[UOWType],
-        user: User,
+        user: Principal,
         organization_data: dict
     ) -> Organization:
         role_repo: str = 'role_repository'
@@ -19,10 +26,10 @@ class OrganizationService(StorageBaseService):
 
         async with uow:
             organization: Organization = (
-                await uow.__dict__[cls._repository]
+                await uow.get_repository(cls._repository)
                 .create(organization_data)
             )
-            role: Role = await uow.__dict__[role_repo].get_by_filters(
+            role: Role = await uow.get_repository(role_repo).get_by_filters(
                 name=RoleEnum.ADMIN.value
             )
             employee_data: dict = {
@@ -30,5 +37,15 @@ class OrganizationService(StorageBaseService):
                 'user_id': user.id,
                 'role_id': role.id
             }
-            await uow.__dict__[emp_repo].create(employee_data)
-            return await uow.__dict__[cls._repository].get(organization.id)
+            employee: Employee = (
+                await uow.get_repository(emp_repo).create(employee_data)
+            )
+            await cls.invalidate_cached(uow, organization)
+            await EmployeeService.invalidate_cached(uow, employee)
+            organization: Organization = (
+                await uow.get_repository(cls._repository)
+                .get(organization.id, 'detail')
+            )
+
+        await uow.after_commit(partial(principal_cache.invalidate, user.id))
+        return organization
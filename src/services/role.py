@@ -1,6 +1,9 @@
+from src.cache.entity import EntityCache
+from src.core.constants import ROLE_CACHE_TTL_SECONDS
 from src.services.bases import StorageBaseService
 
 
 class RoleService(StorageBaseService):
 
     _repository = 'role_repository'
+    _cache = EntityCache(ROLE_CACHE_TTL_SECONDS, lookups=('name',))
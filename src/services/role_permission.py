@@ -1,3 +1,6 @@
+from sqlalchemy import Row
+
+from src.cache.permissions import permission_registry
 from src.services.bases import StorageBaseService, UOWType
 
 
@@ -5,6 +8,12 @@ class RolePermissionService(StorageBaseService):
 
     _repository = 'role_permission_repository'
 
+    @classmethod
+    async def get_bindings(cls, uow: type[UOWType]) -> list[Row]:
+        """Returns (role_id, permission_name) rows for every role."""
+        async with uow:
+            return await uow.get_repository(cls._repository).get_bindings()
+
     @classmethod
     async def add_permissions_to_role(
         cls,
@@ -13,7 +22,29 @@ class RolePermissionService(StorageBaseService):
         permissions: list[str]
     ) -> None:
         async with uow:
-            await uow.__dict__[cls._repository].add_permissions_to_role(
+            await uow.get_repository(cls._repository).add_permissions_to_role(
                 role_name,
                 permissions
             )
+
+        await uow.after_commit(permission_registry.invalidate)
+
+    @classmethod
+    async def bind_permissions(
+        cls,
+        uow: type[UOWType],
+        bindings: dict[str, list[str]]
+    ) -> None:
+        """
+        Binds the permissions to the roles by names.
+        Existing bindings are kept.
+
+        Args:
+            - `bindings`: dict of the form {role_name: [permission_name]}.
+        """
+        async with uow:
+            await uow.get_repository(cls._repository).bind_permissions(
+                bindings
+            )
+
+        await uow.after_commit(permission_registry.invalidate)
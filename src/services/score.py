@@ -1,6 +1,78 @@
-from src.services.bases import StorageBaseService
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import RowMapping
+
+from src.core.constants import (
+    SCORE_ROLLUP_LAG_SECONDS,
+    SCORE_ROLLUP_RESCAN_IDS
+)
+from src.models import Score
+from src.services.bases import StorageBaseService, UOWType
 
 
 class ScoreService(StorageBaseService):
 
     _repository = 'score_repository'
+
+    @classmethod
+    async def create(cls, uow: type[UOWType], data: dict) -> Score:
+        """Creates the score and adds it to the employee score summary."""
+        async with uow:
+            score: Score = await super().create(uow, data)
+            await uow.get_repository(cls._repository).add_to_summary(score)
+            return score
+
+    @classmethod
+    async def get_average_score(
+        cls,
+        uow: type[UOWType],
+        employee_id: int
+    ) -> float:
+        """
+        Returns the average score of the employee from his summary.
+        The scores are aggregated in SQL if the summary doesn't exist.
+        """
+        async with uow:
+            repository = uow.get_repository(cls._repository)
+            summary = await repository.get_summary(employee_id)
+            if summary:
+                return summary.average_score
+
+            return await repository.get_average_score(employee_id)
+
+    @classmethod
+    async def rollup_daily(cls, uow: type[UOWType]) -> int:
+        """
+        Recomputes the daily rollups touched by the new scores
+        and returns the number of the aggregated scores.
+        """
+        async with uow:
+            return await uow.get_repository(cls._repository).rollup_daily(
+                timedelta(seconds=SCORE_ROLLUP_LAG_SECONDS),
+                SCORE_ROLLUP_RESCAN_IDS
+            )
+
+    @classmethod
+    async def get_leaderboard(
+        cls,
+        uow: type[UOWType],
+        days: int,
+        limit: int,
+        **filters
+    ) -> list[RowMapping]:
+        """
+        Returns employees with the highest average score
+        over the last days including today by UTC.
+
+        Args:
+            - `days`: length of the window in days;
+            - `limit`: number of employees;
+            - `filters`: `organization_id` or `department_id`.
+        """
+        since = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
+        async with uow:
+            return await uow.get_repository(cls._repository).get_leaderboard(
+                since,
+                limit,
+                **filters
+            )
@@ -1,6 +1,37 @@
-from src.services.bases import StorageBaseService
+from typing import Optional
+
+from sqlalchemy import RowMapping
+
+from src.services.bases import StorageBaseService, UOWType
 
 
 class TaskService(StorageBaseService):
 
     _repository = 'task_repository'
+
+    @classmethod
+    async def search(
+        cls,
+        uow: type[UOWType],
+        query: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        **scope
+    ) -> tuple[list[RowMapping], Optional[str]]:
+        """
+        Returns ranked tasks and comments matching the query
+        and the cursor of the next page.
+
+        Args:
+            - `query`: web search query;
+            - `limit`: page size;
+            - `cursor`: cursor of the page returned earlier;
+            - `scope`: `organization_id` and optional `department_id`.
+        """
+        async with uow:
+            return await uow.get_repository(cls._repository).search(
+                query,
+                limit,
+                cursor,
+                **scope
+            )
@@ -1,7 +1,13 @@
 from datetime import datetime, timedelta
+from hashlib import sha256
+from time import time
+from typing import Optional
 
 import jwt
 
+from src.cache.memory import TTLCache
+from src.core.constants import JWT_CACHE_MAXSIZE
+from src.core.metrics import JWT_CACHE_HITS, JWT_CACHE_MISSES
 from src.core.settings.auth import auth_settings
 from src.exceptions.auth import InvalidToken
 from src.exceptions.common import NotSupportedMethodError
@@ -16,6 +22,7 @@ class JWTService(TokenAbstractBaseService):
     _key: str
     _algorithm: str
     _exp_minutes: dict[TokenEnum, int]
+    _verified: TTLCache
 
     def __init__(self) -> None:
         self._key = auth_settings.JWT_SECRET
@@ -25,6 +32,7 @@ class JWTService(TokenAbstractBaseService):
             TokenEnum.REFRESH: auth_settings.REFRESH_JWT_EXPIRE_MINUTES,
             TokenEnum.RESET: auth_settings.RESET_JWT_EXPIRE_MINUTES
         }
+        self._verified = TTLCache(JWT_CACHE_MAXSIZE, 0)
 
     async def write(self, user: User) -> dict:
         data: dict = {'sub': str(user.id)}
@@ -37,14 +45,32 @@ class JWTService(TokenAbstractBaseService):
         }
 
     async def read(self, token: str) -> dict:
+        """
+        Returns the payload of a valid access token.
+        Tokens without expiration are rejected.
+        Verified payloads are cached by token digest until they expire.
+        """
+        digest: bytes = sha256(token.encode()).digest()
+        payload: Optional[dict] = self._verified.get(digest)
+        if payload is not None:
+            JWT_CACHE_HITS.inc()
+            return payload
+
+        JWT_CACHE_MISSES.inc()
         try:
-            return decode(token, self._key, [self._algorithm])
+            payload = decode(token, self._key, [self._algorithm])
 
         except jwt.ExpiredSignatureError:
             raise InvalidToken()
         except jwt.PyJWTError:
             raise InvalidToken()
 
+        if payload.get('type') != TokenEnum.ACCESS or 'exp' not in payload:
+            raise InvalidToken()
+
+        self._verified.set(digest, payload, payload['exp'] - time())
+        return payload
+
     async def remove(self, token: str) -> None:
         raise NotSupportedMethodError(
             'JSON Web Token is valid until it expires'
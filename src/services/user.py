@@ -1,9 +1,12 @@
+from functools import partial
 from typing import Optional
 
 from pydantic import EmailStr
+from sqlalchemy import Row
 
 from src.api.v1.schemas.request.auth import AuthUser
 from src.api.v1.schemas.request.user import PasswordSchema
+from src.cache.principal import Principal, principal_cache
 from src.core.constants import ErrorCode
 from src.enums.role import RoleEnum
 from src.exceptions import (
@@ -20,6 +23,28 @@ class UserService(StorageBaseService):
 
     _repository = 'user_repository'
 
+    @classmethod
+    async def get_principal(
+        cls,
+        uow: type[UOWType],
+        pk: int
+    ) -> Optional[Principal]:
+        """Returns the authorization snapshot of the user by ID."""
+        async with uow:
+            row: Optional[Row] = (
+                await uow.get_repository(cls._repository).get_principal(pk)
+            )
+
+        if row:
+            return Principal(**row._mapping)
+
+    @classmethod
+    async def update(cls, uow: type[UOWType], pk: int, data: dict) -> User:
+        """Updates the user and invalidates his cached principal."""
+        user: User = await super().update(uow, pk, data)
+        await uow.after_commit(partial(principal_cache.invalidate, user.id))
+        return user
+
     @classmethod
     async def get_user_by_email(
         cls,
@@ -47,7 +72,10 @@ class UserService(StorageBaseService):
                 extra_msg=ErrorCode.INVALID_EMAIL
             )
 
-        if not pwd_guard.verify_password(model.password, user.hashed_password):
+        if not await pwd_guard.verify_password_async(
+            model.password,
+            user.hashed_password
+        ):
             raise user_exc.InvalidCredentialsError(
                 extra_msg=ErrorCode.INVALID_PASSWORD
             )
@@ -66,7 +94,7 @@ class UserService(StorageBaseService):
     ) -> User:
         """Changes password for user."""
         if (
-            not pwd_guard.verify_password(
+            not await pwd_guard.verify_password_async(
                 password_data.current_password,
                 user.hashed_password
             )
@@ -75,7 +103,7 @@ class UserService(StorageBaseService):
                 extra_msg=ErrorCode.INVALID_PASSWORD
             )
 
-        if pwd_guard.verify_password(
+        if await pwd_guard.verify_password_async(
             password_data.new_password,
             user.hashed_password
         ):
@@ -84,7 +112,7 @@ class UserService(StorageBaseService):
             )
 
         new_hashed_password: str = (
-            pwd_guard.get_password_hash(password_data.new_password)
+            await pwd_guard.get_password_hash_async(password_data.new_password)
         )
         return await cls.update(
             uow,
@@ -119,7 +147,33 @@ class UserService(StorageBaseService):
                 role_name=RoleEnum.VIEWER.value
             )
             user: User = (
-                await uow.__dict__[cls._repository]
+                await uow.get_repository(cls._repository)
                 .create_invited_user(org_id, user_data)
             )
             return user
+
+    @classmethod
+    async def set_password_by_code(
+        cls,
+        uow: type[UOWType],
+        details: Optional[dict],
+        password: str
+    ) -> User:
+        """
+        Sets the password of the imported user by the one-time code.
+
+        Args:
+            - `details` -- details stored by the code;
+            - `password` -- new password.
+        """
+        if not details:
+            raise auth_exc.SetPasswordCodeError()
+
+        hashed_password: str = await pwd_guard.get_password_hash_async(
+            password
+        )
+        return await cls.update(
+            uow,
+            details.get('user_id'),
+            {'hashed_password': hashed_password}
+        )
@@ -1,9 +1,10 @@
 from typing import Union
 
+from src.cache.principal import Principal
 from src.enums.role import RoleEnum
 from src.enums.status import STATUS_STATES
 from src.exceptions.db import ObjectNotFound
-from src.models import Role
+from src.models import Organization, Role
 from src.services import RoleService
 from src.units.unit_of_work import UnitOfWork
 from src.utils.security import pwd_guard
@@ -34,7 +35,7 @@ async def user_signup_preparation(
 
     password: str = user_data.pop('password')
     user_data.update(
-        hashed_password=pwd_guard.get_password_hash(password),
+        hashed_password=await pwd_guard.get_password_hash_async(password),
         is_active=True,
         is_superuser=False,
         role_id=role.id
@@ -62,5 +63,34 @@ def recieve_selection_data(
         'offset': params.get('offset'),
         'limit': params.get('limit'),
         'order': params.get('order'),
-        'order_by_field': params.get('order_by_field')
+        'order_by_field': params.get('order_by_field'),
+        'cursor': params.get('cursor')
+    }
+
+
+def get_invitation_details(
+    invited_by: Principal,
+    organization: Organization,
+    email: str
+) -> dict:
+    """
+    Returns the invitation details stored by the invite code.
+
+    Args:
+        - `invited_by` -- inviting administrator;
+        - `organization` -- organization to invite to;
+        - `email` -- invitee email.
+    """
+    return {
+        'invited_by': {
+            'id': invited_by.id,
+            'email': invited_by.email,
+        },
+        'organization': {
+            'id': organization.id,
+            'name': organization.name,
+        },
+        'invitee': {
+            'email': email,
+        }
     }
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from types import TracebackType
+from typing import Awaitable, Callable
 
 
 class AbstractBaseUnitOfWork(ABC):
@@ -21,6 +22,15 @@ class AbstractBaseUnitOfWork(ABC):
     ):
         raise NotImplementedError
 
+    @abstractmethod
+    def get_repository(self, name: str):
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def has_writes(self) -> bool:
+        raise NotImplementedError
+
     @abstractmethod
     async def commit(self):
         raise NotImplementedError
@@ -28,3 +38,7 @@ class AbstractBaseUnitOfWork(ABC):
     @abstractmethod
     async def rollback(self):
         raise NotImplementedError
+
+    @abstractmethod
+    async def after_commit(self, callback: Callable[[], Awaitable[None]]):
+        raise NotImplementedError
@@ -1,8 +1,9 @@
 from types import TracebackType
-from typing import Callable
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.db.sessions import HAS_WRITES_KEY
 from src.repositories import (
     comment,
     department,
@@ -16,36 +17,78 @@ from src.repositories import (
     task,
     user
 )
+from src.repositories.bases import SQLAlchemyRepository
 from src.units.base import AbstractBaseUnitOfWork
 
 
+RepositoryType = TypeVar('RepositoryType', bound=SQLAlchemyRepository)
+
+
+class LazyRepository(Generic[RepositoryType]):
+    """
+    Repository created on first access within a session.
+    The instance is cached in the unit of work `__dict__`,
+    so next lookups don't reach the descriptor.
+    """
+
+    def __init__(self, repository: type[RepositoryType]) -> None:
+        self._repository = repository
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+        owner._repository_names = (*owner._repository_names, name)
+
+    def __get__(
+        self,
+        instance: Optional['UnitOfWork'],
+        owner: type
+    ) -> RepositoryType:
+        if instance is None:
+            return self
+
+        repository: RepositoryType = self._repository(instance._session)
+        instance.__dict__[self._name] = repository
+        return repository
+
+
 class UnitOfWork(AbstractBaseUnitOfWork):
+    """
+    Unit of work over a single session.
+    Nested `async with` blocks reuse the session of the outermost one:
+    they only flush, the outermost block commits or rolls back.
+    """
+
+    _repository_names: tuple[str, ...] = ()
+
+    comment_repository = LazyRepository(comment.CommentRepository)
+    department_repository = LazyRepository(department.DepartmentRepository)
+    employee_repository = LazyRepository(employee.EmployeeRepository)
+    meeting_repository = LazyRepository(meeting.MeetingRepository)
+    organization_repository = LazyRepository(
+        organization.OrganizationRepository
+    )
+    permission_repository = LazyRepository(permission.PermissionRepository)
+    role_permission_repository = LazyRepository(
+        role_permission.RolePermissionRepository
+    )
+    role_repository = LazyRepository(role.RoleRepository)
+    score_repository = LazyRepository(score.ScoreRepository)
+    task_repository = LazyRepository(task.TaskRepository)
+    user_repository = LazyRepository(user.UserRepository)
 
     def __init__(self, sessionmaker: Callable[..., AsyncSession]) -> None:
         self._session_factory = sessionmaker
+        self._depth: int = 0
+        self._after_commit: list[Callable[[], Awaitable[None]]] = []
 
     async def __aenter__(self):
-        self._session: AsyncSession = self._session_factory()
+        self._depth += 1
+        if self._depth > 1:
+            return self
 
-        self.comment_repository = comment.CommentRepository(self._session)
-        self.department_repository = (
-            department.DepartmentRepository(self._session)
-        )
-        self.employee_repository = employee.EmployeeRepository(self._session)
-        self.meeting_repository = meeting.MeetingRepository(self._session)
-        self.organization_repository = (
-            organization.OrganizationRepository(self._session)
-        )
-        self.permission_repository = (
-            permission.PermissionRepository(self._session)
-        )
-        self.role_permission_repository = (
-            role_permission.RolePermissionRepository(self._session)
-        )
-        self.role_repository = role.RoleRepository(self._session)
-        self.score_repository = score.ScoreRepository(self._session)
-        self.task_repository = task.TaskRepository(self._session)
-        self.user_repository = user.UserRepository(self._session)
+        self._session: AsyncSession = self._session_factory()
+        for name in self._repository_names:
+            self.__dict__.pop(name, None)
 
         return self
 
@@ -55,15 +98,49 @@ class UnitOfWork(AbstractBaseUnitOfWork):
         exc_val: BaseException,
         exc_tb: TracebackType
     ):
-        if any((exc_type, exc_val, exc_tb)):
-            await self.rollback()
-        else:
-            await self.commit()
+        self._depth -= 1
+        if self._depth:
+            if not any((exc_type, exc_val, exc_tb)):
+                await self._session.flush()
+            return
+
+        try:
+            if any((exc_type, exc_val, exc_tb)):
+                await self.rollback()
+            else:
+                await self.commit()
+        finally:
+            await self._session.close()
 
-        await self._session.close()
+    def get_repository(self, name: str) -> SQLAlchemyRepository:
+        """Returns the repository of the current session by name."""
+        return getattr(self, name)
+
+    @property
+    def has_writes(self) -> bool:
+        """Whether the current transaction has uncommitted writes."""
+        if not self._depth:
+            return False
+
+        return self._session.info.get(HAS_WRITES_KEY, False)
 
     async def commit(self):
         await self._session.commit()
+        callbacks: list = self._after_commit
+        self._after_commit = []
+        for callback in callbacks:
+            await callback()
 
     async def rollback(self):
         await self._session.rollback()
+        self._after_commit.clear()
+
+    async def after_commit(self, callback: Callable[[], Awaitable[None]]):
+        """
+        Runs the callback after the transaction is committed.
+        Outside of a transaction the callback runs immediately.
+        """
+        if self._depth:
+            self._after_commit.append(callback)
+        else:
+            await callback()
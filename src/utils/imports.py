@@ -0,0 +1,133 @@
+import codecs
+import csv
+from collections import deque
+from typing import AsyncGenerator, AsyncIterator, Callable, Optional
+
+import orjson
+
+from src.exceptions.request import UnsupportedImportFormat
+
+
+CSV_MEDIA_TYPE: str = 'text/csv'
+NDJSON_MEDIA_TYPE: str = 'application/x-ndjson'
+
+Record = tuple[int, Optional[dict]]
+
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes]
+) -> AsyncGenerator[str, None]:
+    """
+    Yields text lines of the UTF-8 byte stream
+    holding only the incomplete line in memory.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    tail: str = ''
+    async for chunk in chunks:
+        tail += decoder.decode(chunk)
+        *lines, tail = tail.split('\n')
+        for line in lines:
+            yield line.rstrip('\r')
+
+    tail += decoder.decode(b'', final=True)
+    if tail:
+        yield tail.rstrip('\r')
+
+
+class _LineFeed:
+    """Iterator of the pushed lines read by one CSV reader."""
+
+    def __init__(self) -> None:
+        self._lines: deque[str] = deque()
+
+    def push(self, line: str) -> None:
+        self._lines.append(line + '\n')
+
+    def __iter__(self) -> '_LineFeed':
+        return self
+
+    def __next__(self) -> str:
+        if not self._lines:
+            raise StopIteration
+
+        return self._lines.popleft()
+
+
+async def _iter_csv(lines: AsyncIterator[str]) -> AsyncGenerator[Record, None]:
+    """
+    Parses the lines with one CSV reader, a row is read
+    when its quotes are closed, so quoted fields keep their newlines.
+    """
+    feed = _LineFeed()
+    reader = csv.reader(feed)
+    header: Optional[list[str]] = None
+    row_number: int = 0
+    quotes: int = 0
+    async for line in lines:
+        if not quotes and not line.strip():
+            continue
+
+        feed.push(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            continue
+
+        quotes = 0
+        values: list[str] = next(reader)
+        if header is None:
+            header = [name.strip().lower() for name in values]
+            continue
+
+        row_number += 1
+        if len(values) != len(header):
+            yield row_number, None
+            continue
+
+        yield row_number, dict(zip(header, values))
+
+    if quotes and header is not None:
+        yield row_number + 1, None
+
+
+async def _iter_ndjson(
+    lines: AsyncIterator[str]
+) -> AsyncGenerator[Record, None]:
+    row_number: int = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+
+        row_number += 1
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            yield row_number, None
+            continue
+
+        yield row_number, record if isinstance(record, dict) else None
+
+
+_PARSERS: dict[str, Callable[[AsyncIterator[str]], AsyncIterator[Record]]] = {
+    CSV_MEDIA_TYPE: _iter_csv,
+    NDJSON_MEDIA_TYPE: _iter_ndjson,
+}
+
+
+def iter_records(
+    chunks: AsyncIterator[bytes],
+    content_type: str
+) -> AsyncIterator[Record]:
+    """
+    Returns the iterator of (row number, record) pairs of the upload.
+    The record is None if the row can't be parsed.
+
+    Args:
+        - `chunks`: body byte stream;
+        - `content_type`: upload media type, CSV or NDJSON.
+    """
+    media_type: str = content_type.split(';')[0].strip().lower()
+    parser = _PARSERS.get(media_type)
+    if not parser:
+        raise UnsupportedImportFormat()
+
+    return parser(iter_lines(chunks))
@@ -0,0 +1,43 @@
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import Response
+
+from src.core.constants import NEXT_CURSOR_HEADER
+from src.exceptions.request import InvalidCursor
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    raise TypeError(f'{type(value).__name__} is not cursor serializable')
+
+
+def encode_cursor(*values) -> str:
+    """Returns an opaque cursor that holds the values."""
+    payload: str = json.dumps(values, default=_default, separators=(',', ':'))
+    return urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> list:
+    """Returns the values from the cursor."""
+    try:
+        padding: str = '=' * (-len(cursor) % 4)
+        values: Any = json.loads(urlsafe_b64decode(cursor + padding))
+    except (ValueError, binascii.Error):
+        raise InvalidCursor()
+
+    if not isinstance(values, list):
+        raise InvalidCursor()
+
+    return values
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    """Adds the cursor of the next page to the response headers."""
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
@@ -0,0 +1,105 @@
+from datetime import datetime, time, timedelta
+from typing import Generator, Iterable
+
+
+Interval = tuple[datetime, datetime]
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> list[Interval]:
+    """
+    Merges overlapping and adjacent intervals by one sweep
+    over the intervals sorted by start.
+    """
+    merged: list[Interval] = []
+    for start_at, end_at in sorted(intervals):
+        if merged and start_at <= merged[-1][1]:
+            if end_at > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end_at)
+            continue
+
+        merged.append((start_at, end_at))
+
+    return merged
+
+
+def working_windows(
+    start_at: datetime,
+    end_at: datetime,
+    work_start: time,
+    work_end: time
+) -> Generator[Interval, None, None]:
+    """
+    Yields the working hours of every day of the period
+    clipped by the period bounds.
+    The working hours are taken in the period start timezone.
+    """
+    day: datetime = start_at.replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    while day < end_at:
+        window_start: datetime = max(
+            start_at,
+            datetime.combine(day.date(), work_start, tzinfo=day.tzinfo)
+        )
+        window_end: datetime = min(
+            end_at,
+            datetime.combine(day.date(), work_end, tzinfo=day.tzinfo)
+        )
+        if window_start < window_end:
+            yield window_start, window_end
+
+        day += timedelta(days=1)
+
+
+def find_free_slots(
+    busy: Iterable[Interval],
+    start_at: datetime,
+    end_at: datetime,
+    duration: timedelta,
+    work_start: time,
+    work_end: time,
+    limit: int
+) -> list[Interval]:
+    """
+    Returns the earliest free intervals of working hours
+    that are not shorter than the duration.
+
+    Args:
+        - `busy`: busy intervals of all the participants;
+        - `start_at`: start of the search period;
+        - `end_at`: end of the search period;
+        - `duration`: minimal length of the free interval;
+        - `work_start`: start of the working day;
+        - `work_end`: end of the working day;
+        - `limit`: maximum number of the free intervals.
+    """
+    merged: list[Interval] = merge_intervals(busy)
+    slots: list[Interval] = []
+    first: int = 0
+    for window_start, window_end in working_windows(
+        start_at,
+        end_at,
+        work_start,
+        work_end
+    ):
+        while first < len(merged) and merged[first][1] <= window_start:
+            first += 1
+
+        cursor: datetime = window_start
+        index: int = first
+        while index < len(merged) and merged[index][0] < window_end:
+            busy_start, busy_end = merged[index]
+            if busy_start - cursor >= duration:
+                slots.append((cursor, busy_start))
+                if len(slots) == limit:
+                    return slots
+
+            cursor = max(cursor, busy_end)
+            index += 1
+
+        if window_end - cursor >= duration:
+            slots.append((cursor, window_end))
+            if len(slots) == limit:
+                return slots
+
+    return slots
@@ -1,15 +1,26 @@
+import asyncio
 import secrets
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable, Optional
 
 from passlib.context import CryptContext
 
+from src.core.metrics import PASSWORD_HASH_QUEUE_DEPTH, PASSWORD_HASH_SECONDS
+from src.core.settings.auth import auth_settings
+
 
 class PWDGuard:
 
     _context: CryptContext
+    _executor: ThreadPoolExecutor
 
-    def __init__(self, schemes: list[str]) -> None:
+    def __init__(self, schemes: list[str], max_workers: int) -> None:
         self._context = CryptContext(schemes, deprecated='auto')
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='pwd-guard'
+        )
 
     def verify_password(self, password: str, hashed_password: bytes) -> bool:
         """Verify password against an existing hash."""
@@ -19,9 +30,47 @@ class PWDGuard:
         """Returns hash for password."""
         return self._context.hash(bytes(password, 'utf-8'))
 
+    async def verify_password_async(
+        self,
+        password: str,
+        hashed_password: bytes
+    ) -> bool:
+        """Verify password on the hashing pool without blocking the loop."""
+        return await self._run(
+            'verify',
+            self.verify_password,
+            password,
+            hashed_password
+        )
+
+    async def get_password_hash_async(self, password: str) -> str:
+        """Returns hash for password computed on the hashing pool."""
+        return await self._run('hash', self.get_password_hash, password)
+
+    async def _run(
+        self,
+        operation: str,
+        func: Callable[..., Any],
+        *args
+    ) -> Any:
+        PASSWORD_HASH_QUEUE_DEPTH.inc()
+        start: float = perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                func,
+                *args
+            )
+        finally:
+            PASSWORD_HASH_QUEUE_DEPTH.dec()
+            PASSWORD_HASH_SECONDS.labels(operation).observe(
+                perf_counter() - start
+            )
 
-pwd_guard = PWDGuard(['bcrypt'])
+
+pwd_guard = PWDGuard(['bcrypt'], auth_settings.PASSWORD_HASH_WORKERS)
 
 
 def generate_url_token(length: Optional[int] = None) -> str:
     return secrets.token_urlsafe(length)
+